@@ -0,0 +1,32 @@
+import pickle
+import os
+import m2cgen
+
+# Directory holding the trained model artifacts
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# -------------------- Build-time Model Compilation --------------------
+
+# Run once after (re)training the model:
+#     python annually_insurance_premium_using_ml/compile_model.py
+#
+# Exports the pipeline's RandomForest classifier to plain Python code
+# (compiled_model.py) via m2cgen. The generated score() walks every tree
+# as straight-line comparisons, which is far faster for single-row
+# inference than sklearn's per-tree dispatch. The OneHotEncoder
+# preprocessing step cannot be exported by m2cgen and stays in sklearn.
+
+def main():
+    # Load the trained pipeline
+    with open(os.path.join(MODEL_DIR, 'model.pkl'), 'rb') as f:
+        model = pickle.load(f)
+
+    # Export only the final estimator; preprocessing stays in the pipeline
+    code = m2cgen.export_to_python(model.named_steps['classifier'], function_name='score')
+
+    # Write the generated scorer next to the pickle
+    with open(os.path.join(MODEL_DIR, 'compiled_model.py'), 'w') as f:
+        f.write(code)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,7817 @@
+def add_vectors(v1, v2):
+    return [sum(i) for i in zip(v1, v2)]
+def mul_vector_number(v1, num):
+    return [i * num for i in v1]
+def score(input):
+    if input[5] <= 0.5:
+        if input[17] <= 31.818840980529785:
+            if input[12] <= 0.5:
+                if input[11] <= 0.5:
+                    if input[18] <= 31.389999389648438:
+                        var0 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[0] <= 0.5:
+                            if input[14] <= 0.5:
+                                if input[18] <= 40.709999084472656:
+                                    var0 = [1.0, 0.0, 0.0]
+                                else:
+                                    var0 = [0.0, 0.0, 1.0]
+                            else:
+                                var0 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[14] <= 0.5:
+                                var0 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[17] <= 26.443750381469727:
+                                    var0 = [0.0, 0.0, 1.0]
+                                else:
+                                    var0 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 2.5700000524520874:
+                        if input[17] <= 29.03314208984375:
+                            var0 = [1.0, 0.0, 0.0]
+                        else:
+                            var0 = [0.0, 0.0, 1.0]
+                    else:
+                        var0 = [1.0, 0.0, 0.0]
+            else:
+                var0 = [0.0, 0.0, 1.0]
+        else:
+            if input[9] <= 0.5:
+                if input[11] <= 0.5:
+                    if input[15] <= 0.5:
+                        if input[1] <= 0.5:
+                            if input[7] <= 0.5:
+                                if input[3] <= 0.5:
+                                    if input[18] <= 27.4399995803833:
+                                        var0 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var0 = [0.0, 0.0, 1.0]
+                                else:
+                                    var0 = [1.0, 0.0, 0.0]
+                            else:
+                                var0 = [1.0, 0.0, 0.0]
+                        else:
+                            var0 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 39.4913330078125:
+                            if input[6] <= 0.5:
+                                var0 = [1.0, 0.0, 0.0]
+                            else:
+                                var0 = [0.0, 0.0, 1.0]
+                        else:
+                            var0 = [0.0, 0.0, 1.0]
+                else:
+                    var0 = [1.0, 0.0, 0.0]
+            else:
+                var0 = [0.0, 0.0, 1.0]
+    else:
+        if input[14] <= 0.5:
+            if input[0] <= 0.5:
+                if input[2] <= 0.5:
+                    if input[17] <= 23.012829780578613:
+                        if input[17] <= 21.701799392700195:
+                            var0 = [0.0, 1.0, 0.0]
+                        else:
+                            var0 = [0.0, 0.0, 1.0]
+                    else:
+                        var0 = [0.0, 1.0, 0.0]
+                else:
+                    var0 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 13.864999771118164:
+                    var0 = [0.0, 0.0, 1.0]
+                else:
+                    var0 = [0.0, 1.0, 0.0]
+        else:
+            var0 = [0.0, 1.0, 0.0]
+    if input[5] <= 0.5:
+        if input[9] <= 0.5:
+            if input[6] <= 0.5:
+                if input[15] <= 0.5:
+                    if input[0] <= 0.5:
+                        if input[18] <= 2.8249999284744263:
+                            var1 = [1.0, 0.0, 0.0]
+                        else:
+                            var1 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[8] <= 0.5:
+                            var1 = [0.0, 0.0, 1.0]
+                        else:
+                            var1 = [1.0, 0.0, 0.0]
+                else:
+                    if input[2] <= 0.5:
+                        var1 = [0.0, 0.0, 1.0]
+                    else:
+                        var1 = [1.0, 0.0, 0.0]
+            else:
+                if input[3] <= 0.5:
+                    if input[2] <= 0.5:
+                        if input[14] <= 0.5:
+                            if input[1] <= 0.5:
+                                var1 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[18] <= 11.539999961853027:
+                                    var1 = [0.0, 0.0, 1.0]
+                                else:
+                                    var1 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[18] <= 17.78000020980835:
+                                var1 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[17] <= 30.207368850708008:
+                                    var1 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[18] <= 25.954999923706055:
+                                        var1 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var1 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[15] <= 0.5:
+                            if input[18] <= 1.7199999690055847:
+                                if input[18] <= 1.0899999737739563:
+                                    var1 = [1.0, 0.0, 0.0]
+                                else:
+                                    var1 = [0.0, 0.0, 1.0]
+                            else:
+                                var1 = [1.0, 0.0, 0.0]
+                        else:
+                            var1 = [1.0, 0.0, 0.0]
+                else:
+                    var1 = [0.0, 0.0, 1.0]
+        else:
+            var1 = [0.0, 1.0, 0.0]
+    else:
+        if input[2] <= 0.5:
+            if input[7] <= 0.5:
+                if input[18] <= 47.53499984741211:
+                    if input[10] <= 0.5:
+                        var1 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[0] <= 0.5:
+                            var1 = [0.0, 0.0, 1.0]
+                        else:
+                            var1 = [0.0, 1.0, 0.0]
+                else:
+                    var1 = [0.0, 0.0, 1.0]
+            else:
+                var1 = [0.0, 1.0, 0.0]
+        else:
+            var1 = [0.0, 0.0, 1.0]
+    if input[2] <= 0.5:
+        if input[17] <= 32.415992736816406:
+            if input[4] <= 0.5:
+                if input[1] <= 0.5:
+                    if input[18] <= 9.860000133514404:
+                        if input[17] <= 22.507606506347656:
+                            var2 = [0.0, 0.0, 1.0]
+                        else:
+                            var2 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[13] <= 0.5:
+                            if input[18] <= 33.529998779296875:
+                                if input[15] <= 0.5:
+                                    if input[7] <= 0.5:
+                                        if input[8] <= 0.5:
+                                            var2 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var2 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var2 = [0.0, 0.0, 1.0]
+                                else:
+                                    var2 = [0.0, 1.0, 0.0]
+                            else:
+                                var2 = [0.0, 1.0, 0.0]
+                        else:
+                            var2 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 21.765000343322754:
+                        var2 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[6] <= 0.5:
+                            var2 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[15] <= 0.5:
+                                var2 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[7] <= 0.5:
+                                    var2 = [0.0, 1.0, 0.0]
+                                else:
+                                    var2 = [1.0, 0.0, 0.0]
+            else:
+                if input[0] <= 0.5:
+                    var2 = [0.0, 0.0, 1.0]
+                else:
+                    if input[9] <= 0.5:
+                        var2 = [1.0, 0.0, 0.0]
+                    else:
+                        var2 = [0.0, 1.0, 0.0]
+        else:
+            if input[1] <= 0.5:
+                if input[17] <= 40.908538818359375:
+                    var2 = [1.0, 0.0, 0.0]
+                else:
+                    var2 = [0.0, 0.0, 1.0]
+            else:
+                var2 = [0.0, 0.0, 1.0]
+    else:
+        if input[17] <= 23.765165328979492:
+            var2 = [0.0, 0.0, 1.0]
+        else:
+            if input[17] <= 32.04537868499756:
+                if input[15] <= 0.5:
+                    if input[14] <= 0.5:
+                        var2 = [1.0, 0.0, 0.0]
+                    else:
+                        var2 = [0.0, 0.0, 1.0]
+                else:
+                    var2 = [1.0, 0.0, 0.0]
+            else:
+                var2 = [1.0, 0.0, 0.0]
+    if input[17] <= 31.946627616882324:
+        if input[11] <= 0.5:
+            if input[3] <= 0.5:
+                if input[4] <= 0.5:
+                    if input[18] <= 37.760000228881836:
+                        if input[17] <= 17.86347007751465:
+                            if input[5] <= 0.5:
+                                var3 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[13] <= 0.5:
+                                    var3 = [0.0, 0.0, 1.0]
+                                else:
+                                    var3 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[10] <= 0.5:
+                                if input[14] <= 0.5:
+                                    var3 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[17] <= 30.333117485046387:
+                                        if input[18] <= 31.389999389648438:
+                                            var3 = [0.0, 1.0, 0.0]
+                                        else:
+                                            if input[6] <= 0.5:
+                                                var3 = [0.0, 1.0, 0.0]
+                                            else:
+                                                if input[7] <= 0.5:
+                                                    var3 = [0.0, 1.0, 0.0]
+                                                else:
+                                                    if input[18] <= 32.875:
+                                                        var3 = [0.0, 0.0, 1.0]
+                                                    else:
+                                                        var3 = [0.0, 1.0, 0.0]
+                                    else:
+                                        if input[18] <= 25.954999923706055:
+                                            var3 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var3 = [0.0, 1.0, 0.0]
+                            else:
+                                var3 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 40.60499954223633:
+                            var3 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[17] <= 23.842538833618164:
+                                if input[15] <= 0.5:
+                                    var3 = [0.0, 1.0, 0.0]
+                                else:
+                                    var3 = [0.0, 0.0, 1.0]
+                            else:
+                                var3 = [0.0, 1.0, 0.0]
+                else:
+                    if input[13] <= 0.5:
+                        var3 = [0.0, 1.0, 0.0]
+                    else:
+                        var3 = [1.0, 0.0, 0.0]
+            else:
+                var3 = [0.0, 1.0, 0.0]
+        else:
+            if input[17] <= 23.765165328979492:
+                var3 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 2.2350000143051147:
+                    if input[17] <= 29.054829597473145:
+                        var3 = [1.0, 0.0, 0.0]
+                    else:
+                        var3 = [0.0, 0.0, 1.0]
+                else:
+                    var3 = [1.0, 0.0, 0.0]
+    else:
+        if input[4] <= 0.5:
+            if input[11] <= 0.5:
+                if input[18] <= 42.165000915527344:
+                    var3 = [0.0, 0.0, 1.0]
+                else:
+                    var3 = [1.0, 0.0, 0.0]
+            else:
+                var3 = [1.0, 0.0, 0.0]
+        else:
+            if input[12] <= 0.5:
+                if input[18] <= 28.369998931884766:
+                    var3 = [1.0, 0.0, 0.0]
+                else:
+                    if input[7] <= 0.5:
+                        var3 = [0.0, 0.0, 1.0]
+                    else:
+                        var3 = [1.0, 0.0, 0.0]
+            else:
+                var3 = [0.0, 0.0, 1.0]
+    if input[0] <= 0.5:
+        if input[5] <= 0.5:
+            if input[9] <= 0.5:
+                if input[2] <= 0.5:
+                    if input[18] <= 36.23500061035156:
+                        if input[16] <= 0.5:
+                            if input[18] <= 2.8249999284744263:
+                                if input[18] <= 2.694999933242798:
+                                    var4 = [0.0, 0.0, 1.0]
+                                else:
+                                    var4 = [1.0, 0.0, 0.0]
+                            else:
+                                var4 = [0.0, 0.0, 1.0]
+                        else:
+                            var4 = [1.0, 0.0, 0.0]
+                    else:
+                        var4 = [1.0, 0.0, 0.0]
+                else:
+                    var4 = [1.0, 0.0, 0.0]
+            else:
+                if input[17] <= 32.12221717834473:
+                    var4 = [0.0, 1.0, 0.0]
+                else:
+                    var4 = [0.0, 0.0, 1.0]
+        else:
+            if input[17] <= 24.046144485473633:
+                if input[7] <= 0.5:
+                    if input[14] <= 0.5:
+                        if input[13] <= 0.5:
+                            var4 = [0.0, 0.0, 1.0]
+                        else:
+                            var4 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 10.680000185966492:
+                            var4 = [0.0, 1.0, 0.0]
+                        else:
+                            var4 = [0.0, 0.0, 1.0]
+                else:
+                    var4 = [0.0, 1.0, 0.0]
+            else:
+                var4 = [0.0, 1.0, 0.0]
+    else:
+        if input[4] <= 0.5:
+            if input[15] <= 0.5:
+                if input[6] <= 0.5:
+                    var4 = [0.0, 1.0, 0.0]
+                else:
+                    if input[7] <= 0.5:
+                        var4 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 31.8100004196167:
+                            var4 = [0.0, 0.0, 1.0]
+                        else:
+                            var4 = [0.0, 1.0, 0.0]
+            else:
+                if input[5] <= 0.5:
+                    var4 = [0.0, 1.0, 0.0]
+                else:
+                    var4 = [0.0, 0.0, 1.0]
+        else:
+            if input[13] <= 0.5:
+                var4 = [1.0, 0.0, 0.0]
+            else:
+                if input[14] <= 0.5:
+                    var4 = [1.0, 0.0, 0.0]
+                else:
+                    var4 = [0.0, 0.0, 1.0]
+    if input[18] <= 9.316144466400146:
+        if input[11] <= 0.5:
+            if input[16] <= 0.5:
+                if input[4] <= 0.5:
+                    if input[0] <= 0.5:
+                        if input[15] <= 0.5:
+                            var5 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[6] <= 0.5:
+                                var5 = [0.0, 1.0, 0.0]
+                            else:
+                                var5 = [0.0, 0.0, 1.0]
+                    else:
+                        var5 = [0.0, 0.0, 1.0]
+                else:
+                    var5 = [0.0, 0.0, 1.0]
+            else:
+                var5 = [0.0, 0.0, 1.0]
+        else:
+            if input[17] <= 24.698623657226562:
+                var5 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 32.04537868499756:
+                    if input[16] <= 0.5:
+                        var5 = [0.0, 0.0, 1.0]
+                    else:
+                        var5 = [1.0, 0.0, 0.0]
+                else:
+                    var5 = [1.0, 0.0, 0.0]
+    else:
+        if input[9] <= 0.5:
+            if input[5] <= 0.5:
+                if input[14] <= 0.5:
+                    if input[1] <= 0.5:
+                        if input[15] <= 0.5:
+                            var5 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[6] <= 0.5:
+                                var5 = [1.0, 0.0, 0.0]
+                            else:
+                                var5 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 24.347688674926758:
+                            var5 = [0.0, 0.0, 1.0]
+                        else:
+                            var5 = [1.0, 0.0, 0.0]
+                else:
+                    if input[18] <= 30.81999969482422:
+                        if input[10] <= 0.5:
+                            if input[7] <= 0.5:
+                                var5 = [1.0, 0.0, 0.0]
+                            else:
+                                var5 = [0.0, 1.0, 0.0]
+                        else:
+                            var5 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 30.007822036743164:
+                            if input[17] <= 26.443750381469727:
+                                var5 = [0.0, 0.0, 1.0]
+                            else:
+                                var5 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[1] <= 0.5:
+                                var5 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[17] <= 36.41134262084961:
+                                    var5 = [0.0, 0.0, 1.0]
+                                else:
+                                    var5 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 19.425000190734863:
+                    if input[10] <= 0.5:
+                        var5 = [0.0, 1.0, 0.0]
+                    else:
+                        var5 = [0.0, 0.0, 1.0]
+                else:
+                    if input[13] <= 0.5:
+                        if input[0] <= 0.5:
+                            if input[18] <= 47.43000030517578:
+                                var5 = [0.0, 1.0, 0.0]
+                            else:
+                                var5 = [0.0, 0.0, 1.0]
+                        else:
+                            var5 = [0.0, 1.0, 0.0]
+                    else:
+                        var5 = [0.0, 1.0, 0.0]
+        else:
+            var5 = [0.0, 1.0, 0.0]
+    if input[12] <= 0.5:
+        if input[2] <= 0.5:
+            if input[17] <= 33.27631378173828:
+                if input[4] <= 0.5:
+                    if input[9] <= 0.5:
+                        if input[10] <= 0.5:
+                            if input[6] <= 0.5:
+                                var6 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[16] <= 0.5:
+                                    if input[18] <= 32.875:
+                                        if input[8] <= 0.5:
+                                            if input[17] <= 26.73582935333252:
+                                                var6 = [0.0, 0.0, 1.0]
+                                            else:
+                                                var6 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var6 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var6 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[1] <= 0.5:
+                                        var6 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var6 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[0] <= 0.5:
+                                var6 = [0.0, 0.0, 1.0]
+                            else:
+                                var6 = [0.0, 1.0, 0.0]
+                    else:
+                        var6 = [0.0, 1.0, 0.0]
+                else:
+                    var6 = [0.0, 0.0, 1.0]
+            else:
+                if input[1] <= 0.5:
+                    var6 = [0.0, 0.0, 1.0]
+                else:
+                    if input[18] <= 18.645000457763672:
+                        var6 = [0.0, 0.0, 1.0]
+                    else:
+                        var6 = [1.0, 0.0, 0.0]
+        else:
+            if input[18] <= 1.8100000023841858:
+                if input[6] <= 0.5:
+                    if input[15] <= 0.5:
+                        var6 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[4] <= 0.5:
+                            var6 = [0.0, 0.0, 1.0]
+                        else:
+                            var6 = [1.0, 0.0, 0.0]
+                else:
+                    if input[18] <= 1.3399999737739563:
+                        var6 = [1.0, 0.0, 0.0]
+                    else:
+                        var6 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 3.4749999046325684:
+                    var6 = [1.0, 0.0, 0.0]
+                else:
+                    if input[5] <= 0.5:
+                        var6 = [1.0, 0.0, 0.0]
+                    else:
+                        var6 = [0.0, 0.0, 1.0]
+    else:
+        if input[4] <= 0.5:
+            if input[6] <= 0.5:
+                var6 = [0.0, 1.0, 0.0]
+            else:
+                var6 = [0.0, 0.0, 1.0]
+        else:
+            var6 = [0.0, 0.0, 1.0]
+    if input[10] <= 0.5:
+        if input[18] <= 7.419693231582642:
+            if input[2] <= 0.5:
+                if input[6] <= 0.5:
+                    if input[4] <= 0.5:
+                        var7 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 44.4867000579834:
+                            if input[18] <= 2.8249999284744263:
+                                var7 = [1.0, 0.0, 0.0]
+                            else:
+                                var7 = [0.0, 0.0, 1.0]
+                        else:
+                            var7 = [0.0, 0.0, 1.0]
+                else:
+                    var7 = [0.0, 0.0, 1.0]
+            else:
+                if input[6] <= 0.5:
+                    if input[17] <= 28.219194412231445:
+                        var7 = [0.0, 0.0, 1.0]
+                    else:
+                        var7 = [1.0, 0.0, 0.0]
+                else:
+                    var7 = [1.0, 0.0, 0.0]
+        else:
+            if input[5] <= 0.5:
+                if input[9] <= 0.5:
+                    if input[17] <= 30.554964065551758:
+                        if input[1] <= 0.5:
+                            if input[18] <= 32.875:
+                                if input[8] <= 0.5:
+                                    var7 = [0.0, 0.0, 1.0]
+                                else:
+                                    var7 = [0.0, 1.0, 0.0]
+                            else:
+                                var7 = [0.0, 1.0, 0.0]
+                        else:
+                            var7 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[6] <= 0.5:
+                            if input[14] <= 0.5:
+                                var7 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[18] <= 27.4399995803833:
+                                    var7 = [1.0, 0.0, 0.0]
+                                else:
+                                    var7 = [0.0, 0.0, 1.0]
+                        else:
+                            var7 = [1.0, 0.0, 0.0]
+                else:
+                    if input[18] <= 20.835903644561768:
+                        if input[6] <= 0.5:
+                            var7 = [0.0, 1.0, 0.0]
+                        else:
+                            var7 = [0.0, 0.0, 1.0]
+                    else:
+                        var7 = [0.0, 1.0, 0.0]
+            else:
+                var7 = [0.0, 1.0, 0.0]
+    else:
+        if input[0] <= 0.5:
+            if input[17] <= 36.993812561035156:
+                var7 = [0.0, 0.0, 1.0]
+            else:
+                var7 = [1.0, 0.0, 0.0]
+        else:
+            var7 = [0.0, 1.0, 0.0]
+    if input[5] <= 0.5:
+        if input[0] <= 0.5:
+            if input[10] <= 0.5:
+                if input[12] <= 0.5:
+                    if input[11] <= 0.5:
+                        if input[6] <= 0.5:
+                            var8 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[17] <= 29.68824863433838:
+                                var8 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[18] <= 21.752583026885986:
+                                    var8 = [0.0, 0.0, 1.0]
+                                else:
+                                    var8 = [0.0, 1.0, 0.0]
+                    else:
+                        var8 = [1.0, 0.0, 0.0]
+                else:
+                    if input[14] <= 0.5:
+                        var8 = [0.0, 0.0, 1.0]
+                    else:
+                        var8 = [1.0, 0.0, 0.0]
+            else:
+                if input[17] <= 36.057273864746094:
+                    var8 = [0.0, 0.0, 1.0]
+                else:
+                    var8 = [1.0, 0.0, 0.0]
+        else:
+            if input[6] <= 0.5:
+                if input[17] <= 31.794302940368652:
+                    var8 = [0.0, 1.0, 0.0]
+                else:
+                    if input[17] <= 33.13436317443848:
+                        var8 = [1.0, 0.0, 0.0]
+                    else:
+                        var8 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 31.389999389648438:
+                    var8 = [0.0, 1.0, 0.0]
+                else:
+                    if input[17] <= 26.569499015808105:
+                        var8 = [0.0, 0.0, 1.0]
+                    else:
+                        var8 = [0.0, 1.0, 0.0]
+    else:
+        if input[17] <= 22.122957229614258:
+            if input[18] <= 19.119999885559082:
+                if input[0] <= 0.5:
+                    if input[12] <= 0.5:
+                        var8 = [0.0, 0.0, 1.0]
+                    else:
+                        var8 = [0.0, 1.0, 0.0]
+                else:
+                    var8 = [0.0, 1.0, 0.0]
+            else:
+                var8 = [0.0, 1.0, 0.0]
+        else:
+            if input[2] <= 0.5:
+                if input[13] <= 0.5:
+                    if input[17] <= 23.012829780578613:
+                        var8 = [0.0, 0.0, 1.0]
+                    else:
+                        var8 = [0.0, 1.0, 0.0]
+                else:
+                    var8 = [0.0, 1.0, 0.0]
+            else:
+                var8 = [0.0, 0.0, 1.0]
+    if input[5] <= 0.5:
+        if input[12] <= 0.5:
+            if input[0] <= 0.5:
+                if input[9] <= 0.5:
+                    if input[14] <= 0.5:
+                        if input[11] <= 0.5:
+                            if input[15] <= 0.5:
+                                if input[10] <= 0.5:
+                                    var9 = [1.0, 0.0, 0.0]
+                                else:
+                                    var9 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[7] <= 0.5:
+                                    var9 = [0.0, 0.0, 1.0]
+                                else:
+                                    var9 = [1.0, 0.0, 0.0]
+                        else:
+                            var9 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[4] <= 0.5:
+                            if input[18] <= 2.575000047683716:
+                                var9 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[11] <= 0.5:
+                                    var9 = [0.0, 0.0, 1.0]
+                                else:
+                                    var9 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[13] <= 0.5:
+                                if input[17] <= 34.45302391052246:
+                                    var9 = [0.0, 0.0, 1.0]
+                                else:
+                                    var9 = [1.0, 0.0, 0.0]
+                            else:
+                                var9 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 32.28618144989014:
+                        var9 = [0.0, 1.0, 0.0]
+                    else:
+                        var9 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 35.3419246673584:
+                    if input[9] <= 0.5:
+                        if input[17] <= 22.296271324157715:
+                            var9 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[18] <= 17.78000020980835:
+                                var9 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[18] <= 41.314998626708984:
+                                    if input[18] <= 25.954999923706055:
+                                        var9 = [0.0, 0.0, 1.0]
+                                    else:
+                                        if input[17] <= 32.46217441558838:
+                                            var9 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var9 = [0.0, 0.0, 1.0]
+                                else:
+                                    var9 = [1.0, 0.0, 0.0]
+                    else:
+                        var9 = [0.0, 1.0, 0.0]
+                else:
+                    var9 = [1.0, 0.0, 0.0]
+        else:
+            var9 = [0.0, 0.0, 1.0]
+    else:
+        if input[18] <= 19.119999885559082:
+            if input[1] <= 0.5:
+                if input[12] <= 0.5:
+                    var9 = [0.0, 0.0, 1.0]
+                else:
+                    var9 = [0.0, 1.0, 0.0]
+            else:
+                var9 = [0.0, 0.0, 1.0]
+        else:
+            if input[1] <= 0.5:
+                var9 = [0.0, 1.0, 0.0]
+            else:
+                if input[8] <= 0.5:
+                    var9 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 47.43000030517578:
+                        var9 = [0.0, 1.0, 0.0]
+                    else:
+                        var9 = [0.0, 0.0, 1.0]
+    if input[11] <= 0.5:
+        if input[5] <= 0.5:
+            if input[3] <= 0.5:
+                if input[9] <= 0.5:
+                    if input[6] <= 0.5:
+                        if input[18] <= 30.81999969482422:
+                            var10 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[1] <= 0.5:
+                                var10 = [0.0, 0.0, 1.0]
+                            else:
+                                var10 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[10] <= 0.5:
+                            if input[14] <= 0.5:
+                                if input[0] <= 0.5:
+                                    var10 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[15] <= 0.5:
+                                        var10 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var10 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[18] <= 30.53999900817871:
+                                    var10 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[8] <= 0.5:
+                                        var10 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var10 = [0.0, 1.0, 0.0]
+                        else:
+                            var10 = [0.0, 0.0, 1.0]
+                else:
+                    var10 = [0.0, 1.0, 0.0]
+            else:
+                var10 = [0.0, 0.0, 1.0]
+        else:
+            if input[18] <= 43.69000053405762:
+                if input[18] <= 10.525000095367432:
+                    if input[3] <= 0.5:
+                        var10 = [0.0, 0.0, 1.0]
+                    else:
+                        var10 = [0.0, 1.0, 0.0]
+                else:
+                    var10 = [0.0, 1.0, 0.0]
+            else:
+                var10 = [0.0, 0.0, 1.0]
+    else:
+        if input[4] <= 0.5:
+            if input[15] <= 0.5:
+                if input[18] <= 2.5700000524520874:
+                    if input[18] <= 1.3449999690055847:
+                        var10 = [1.0, 0.0, 0.0]
+                    else:
+                        var10 = [0.0, 0.0, 1.0]
+                else:
+                    var10 = [1.0, 0.0, 0.0]
+            else:
+                if input[17] <= 23.765165328979492:
+                    var10 = [0.0, 0.0, 1.0]
+                else:
+                    var10 = [1.0, 0.0, 0.0]
+        else:
+            var10 = [1.0, 0.0, 0.0]
+    if input[2] <= 0.5:
+        if input[18] <= 9.441144466400146:
+            if input[17] <= 17.439528465270996:
+                var11 = [0.0, 1.0, 0.0]
+            else:
+                if input[5] <= 0.5:
+                    if input[3] <= 0.5:
+                        var11 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[14] <= 0.5:
+                            var11 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[6] <= 0.5:
+                                var11 = [1.0, 0.0, 0.0]
+                            else:
+                                var11 = [0.0, 0.0, 1.0]
+                else:
+                    if input[0] <= 0.5:
+                        var11 = [0.0, 1.0, 0.0]
+                    else:
+                        var11 = [0.0, 0.0, 1.0]
+        else:
+            if input[5] <= 0.5:
+                if input[16] <= 0.5:
+                    if input[1] <= 0.5:
+                        if input[9] <= 0.5:
+                            if input[18] <= 32.875:
+                                if input[4] <= 0.5:
+                                    if input[18] <= 17.78000020980835:
+                                        var11 = [0.0, 1.0, 0.0]
+                                    else:
+                                        if input[7] <= 0.5:
+                                            var11 = [0.0, 0.0, 1.0]
+                                        else:
+                                            if input[18] <= 30.53999900817871:
+                                                var11 = [0.0, 1.0, 0.0]
+                                            else:
+                                                var11 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[18] <= 28.369998931884766:
+                                        var11 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var11 = [0.0, 0.0, 1.0]
+                            else:
+                                var11 = [0.0, 1.0, 0.0]
+                        else:
+                            var11 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 31.67206382751465:
+                            var11 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[14] <= 0.5:
+                                var11 = [0.0, 1.0, 0.0]
+                            else:
+                                var11 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 19.265146255493164:
+                        var11 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[17] <= 31.208378791809082:
+                            var11 = [1.0, 0.0, 0.0]
+                        else:
+                            var11 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 47.53499984741211:
+                    var11 = [0.0, 1.0, 0.0]
+                else:
+                    var11 = [0.0, 0.0, 1.0]
+    else:
+        if input[18] <= 1.8100000023841858:
+            if input[5] <= 0.5:
+                var11 = [1.0, 0.0, 0.0]
+            else:
+                var11 = [0.0, 0.0, 1.0]
+        else:
+            var11 = [1.0, 0.0, 0.0]
+    if input[0] <= 0.5:
+        if input[5] <= 0.5:
+            if input[18] <= 1.824999988079071:
+                var12 = [1.0, 0.0, 0.0]
+            else:
+                if input[3] <= 0.5:
+                    if input[17] <= 36.41134262084961:
+                        if input[16] <= 0.5:
+                            if input[10] <= 0.5:
+                                if input[2] <= 0.5:
+                                    if input[7] <= 0.5:
+                                        if input[17] <= 32.28618144989014:
+                                            var12 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var12 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var12 = [1.0, 0.0, 0.0]
+                                else:
+                                    var12 = [1.0, 0.0, 0.0]
+                            else:
+                                var12 = [0.0, 0.0, 1.0]
+                        else:
+                            var12 = [1.0, 0.0, 0.0]
+                    else:
+                        var12 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 43.06949424743652:
+                        var12 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[6] <= 0.5:
+                            var12 = [1.0, 0.0, 0.0]
+                        else:
+                            var12 = [0.0, 0.0, 1.0]
+        else:
+            if input[10] <= 0.5:
+                if input[12] <= 0.5:
+                    if input[7] <= 0.5:
+                        if input[18] <= 24.365000247955322:
+                            var12 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[18] <= 47.43000030517578:
+                                var12 = [0.0, 1.0, 0.0]
+                            else:
+                                var12 = [0.0, 0.0, 1.0]
+                    else:
+                        var12 = [0.0, 1.0, 0.0]
+                else:
+                    var12 = [0.0, 1.0, 0.0]
+            else:
+                var12 = [0.0, 0.0, 1.0]
+    else:
+        if input[7] <= 0.5:
+            if input[18] <= 9.494693279266357:
+                var12 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 31.794302940368652:
+                    var12 = [0.0, 1.0, 0.0]
+                else:
+                    if input[14] <= 0.5:
+                        if input[13] <= 0.5:
+                            var12 = [0.0, 1.0, 0.0]
+                        else:
+                            var12 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[8] <= 0.5:
+                            var12 = [0.0, 0.0, 1.0]
+                        else:
+                            var12 = [1.0, 0.0, 0.0]
+        else:
+            if input[18] <= 32.875:
+                if input[17] <= 26.73582935333252:
+                    var12 = [0.0, 0.0, 1.0]
+                else:
+                    var12 = [0.0, 1.0, 0.0]
+            else:
+                var12 = [0.0, 1.0, 0.0]
+    if input[17] <= 31.946627616882324:
+        if input[18] <= 2.6799999475479126:
+            if input[15] <= 0.5:
+                if input[3] <= 0.5:
+                    if input[17] <= 28.09898853302002:
+                        var13 = [1.0, 0.0, 0.0]
+                    else:
+                        var13 = [0.0, 0.0, 1.0]
+                else:
+                    var13 = [0.0, 0.0, 1.0]
+            else:
+                var13 = [0.0, 0.0, 1.0]
+        else:
+            if input[9] <= 0.5:
+                if input[10] <= 0.5:
+                    if input[17] <= 21.32178020477295:
+                        if input[6] <= 0.5:
+                            if input[0] <= 0.5:
+                                var13 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[13] <= 0.5:
+                                    if input[17] <= 19.485254287719727:
+                                        var13 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var13 = [0.0, 1.0, 0.0]
+                                else:
+                                    var13 = [0.0, 1.0, 0.0]
+                        else:
+                            var13 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[17] <= 24.57785415649414:
+                            if input[0] <= 0.5:
+                                var13 = [1.0, 0.0, 0.0]
+                            else:
+                                var13 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[16] <= 0.5:
+                                var13 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[3] <= 0.5:
+                                    var13 = [1.0, 0.0, 0.0]
+                                else:
+                                    var13 = [0.0, 0.0, 1.0]
+                else:
+                    var13 = [0.0, 0.0, 1.0]
+            else:
+                var13 = [0.0, 1.0, 0.0]
+    else:
+        if input[3] <= 0.5:
+            if input[14] <= 0.5:
+                if input[9] <= 0.5:
+                    if input[10] <= 0.5:
+                        var13 = [1.0, 0.0, 0.0]
+                    else:
+                        var13 = [0.0, 0.0, 1.0]
+                else:
+                    if input[18] <= 12.023727416992188:
+                        var13 = [0.0, 1.0, 0.0]
+                    else:
+                        var13 = [0.0, 0.0, 1.0]
+            else:
+                if input[10] <= 0.5:
+                    if input[2] <= 0.5:
+                        if input[17] <= 36.032827377319336:
+                            var13 = [0.0, 0.0, 1.0]
+                        else:
+                            var13 = [1.0, 0.0, 0.0]
+                    else:
+                        var13 = [1.0, 0.0, 0.0]
+                else:
+                    if input[4] <= 0.5:
+                        var13 = [0.0, 0.0, 1.0]
+                    else:
+                        var13 = [1.0, 0.0, 0.0]
+        else:
+            var13 = [0.0, 0.0, 1.0]
+    if input[18] <= 9.441144466400146:
+        if input[15] <= 0.5:
+            if input[18] <= 2.225000023841858:
+                if input[18] <= 0.574999988079071:
+                    var14 = [0.0, 0.0, 1.0]
+                else:
+                    var14 = [1.0, 0.0, 0.0]
+            else:
+                if input[6] <= 0.5:
+                    if input[17] <= 42.925825119018555:
+                        var14 = [0.0, 0.0, 1.0]
+                    else:
+                        var14 = [1.0, 0.0, 0.0]
+                else:
+                    var14 = [0.0, 0.0, 1.0]
+        else:
+            if input[3] <= 0.5:
+                if input[18] <= 1.0350000262260437:
+                    var14 = [1.0, 0.0, 0.0]
+                else:
+                    if input[5] <= 0.5:
+                        if input[2] <= 0.5:
+                            var14 = [0.0, 0.0, 1.0]
+                        else:
+                            var14 = [1.0, 0.0, 0.0]
+                    else:
+                        var14 = [0.0, 0.0, 1.0]
+            else:
+                var14 = [0.0, 0.0, 1.0]
+    else:
+        if input[4] <= 0.5:
+            if input[8] <= 0.5:
+                if input[17] <= 34.212852478027344:
+                    if input[7] <= 0.5:
+                        if input[18] <= 15.78000020980835:
+                            var14 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[1] <= 0.5:
+                                var14 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[10] <= 0.5:
+                                    var14 = [0.0, 1.0, 0.0]
+                                else:
+                                    var14 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[6] <= 0.5:
+                            var14 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 27.453327178955078:
+                                if input[14] <= 0.5:
+                                    var14 = [1.0, 0.0, 0.0]
+                                else:
+                                    var14 = [0.0, 0.0, 1.0]
+                            else:
+                                var14 = [0.0, 1.0, 0.0]
+                else:
+                    var14 = [0.0, 0.0, 1.0]
+            else:
+                if input[6] <= 0.5:
+                    var14 = [0.0, 1.0, 0.0]
+                else:
+                    if input[14] <= 0.5:
+                        var14 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[18] <= 17.78000020980835:
+                            var14 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 30.333117485046387:
+                                var14 = [0.0, 1.0, 0.0]
+                            else:
+                                var14 = [0.0, 0.0, 1.0]
+        else:
+            if input[8] <= 0.5:
+                if input[0] <= 0.5:
+                    var14 = [1.0, 0.0, 0.0]
+                else:
+                    if input[14] <= 0.5:
+                        if input[18] <= 17.474692821502686:
+                            var14 = [0.0, 1.0, 0.0]
+                        else:
+                            var14 = [1.0, 0.0, 0.0]
+                    else:
+                        var14 = [0.0, 0.0, 1.0]
+            else:
+                var14 = [1.0, 0.0, 0.0]
+    if input[11] <= 0.5:
+        if input[4] <= 0.5:
+            if input[10] <= 0.5:
+                if input[5] <= 0.5:
+                    if input[16] <= 0.5:
+                        if input[18] <= 36.209999084472656:
+                            if input[0] <= 0.5:
+                                if input[18] <= 21.752583026885986:
+                                    var15 = [0.0, 0.0, 1.0]
+                                else:
+                                    var15 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[9] <= 0.5:
+                                    if input[13] <= 0.5:
+                                        if input[8] <= 0.5:
+                                            if input[18] <= 30.53999900817871:
+                                                var15 = [0.0, 1.0, 0.0]
+                                            else:
+                                                if input[18] <= 32.875:
+                                                    var15 = [0.0, 0.0, 1.0]
+                                                else:
+                                                    var15 = [0.0, 1.0, 0.0]
+                                        else:
+                                            if input[18] <= 28.94499969482422:
+                                                var15 = [0.0, 0.0, 1.0]
+                                            else:
+                                                var15 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var15 = [0.0, 1.0, 0.0]
+                                else:
+                                    var15 = [0.0, 1.0, 0.0]
+                        else:
+                            var15 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[1] <= 0.5:
+                            var15 = [0.0, 0.0, 1.0]
+                        else:
+                            var15 = [1.0, 0.0, 0.0]
+                else:
+                    if input[16] <= 0.5:
+                        if input[15] <= 0.5:
+                            var15 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 17.182832717895508:
+                                var15 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[12] <= 0.5:
+                                    if input[17] <= 19.472938537597656:
+                                        var15 = [0.0, 0.0, 1.0]
+                                    else:
+                                        if input[7] <= 0.5:
+                                            if input[18] <= 43.31999969482422:
+                                                var15 = [0.0, 1.0, 0.0]
+                                            else:
+                                                var15 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var15 = [0.0, 1.0, 0.0]
+                                else:
+                                    var15 = [0.0, 1.0, 0.0]
+                    else:
+                        var15 = [0.0, 1.0, 0.0]
+            else:
+                var15 = [0.0, 0.0, 1.0]
+        else:
+            if input[14] <= 0.5:
+                var15 = [0.0, 0.0, 1.0]
+            else:
+                if input[13] <= 0.5:
+                    var15 = [1.0, 0.0, 0.0]
+                else:
+                    if input[1] <= 0.5:
+                        var15 = [0.0, 0.0, 1.0]
+                    else:
+                        var15 = [1.0, 0.0, 0.0]
+    else:
+        if input[18] <= 1.4100000262260437:
+            if input[14] <= 0.5:
+                if input[4] <= 0.5:
+                    if input[6] <= 0.5:
+                        var15 = [0.0, 0.0, 1.0]
+                    else:
+                        var15 = [1.0, 0.0, 0.0]
+                else:
+                    var15 = [1.0, 0.0, 0.0]
+            else:
+                var15 = [1.0, 0.0, 0.0]
+        else:
+            if input[5] <= 0.5:
+                if input[18] <= 1.699999988079071:
+                    var15 = [0.0, 0.0, 1.0]
+                else:
+                    if input[6] <= 0.5:
+                        var15 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[15] <= 0.5:
+                            if input[17] <= 40.20197582244873:
+                                if input[17] <= 30.578115463256836:
+                                    var15 = [1.0, 0.0, 0.0]
+                                else:
+                                    var15 = [0.0, 0.0, 1.0]
+                            else:
+                                var15 = [1.0, 0.0, 0.0]
+                        else:
+                            var15 = [1.0, 0.0, 0.0]
+            else:
+                var15 = [0.0, 0.0, 1.0]
+    if input[5] <= 0.5:
+        if input[2] <= 0.5:
+            if input[6] <= 0.5:
+                if input[17] <= 30.499518394470215:
+                    var16 = [0.0, 0.0, 1.0]
+                else:
+                    if input[0] <= 0.5:
+                        if input[3] <= 0.5:
+                            var16 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[14] <= 0.5:
+                                var16 = [0.0, 0.0, 1.0]
+                            else:
+                                var16 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[14] <= 0.5:
+                            var16 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[13] <= 0.5:
+                                var16 = [1.0, 0.0, 0.0]
+                            else:
+                                var16 = [0.0, 0.0, 1.0]
+            else:
+                if input[8] <= 0.5:
+                    if input[3] <= 0.5:
+                        if input[18] <= 30.324999809265137:
+                            if input[1] <= 0.5:
+                                var16 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[10] <= 0.5:
+                                    var16 = [0.0, 1.0, 0.0]
+                                else:
+                                    var16 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[0] <= 0.5:
+                                if input[10] <= 0.5:
+                                    var16 = [1.0, 0.0, 0.0]
+                                else:
+                                    var16 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[17] <= 26.443750381469727:
+                                    var16 = [0.0, 0.0, 1.0]
+                                else:
+                                    var16 = [0.0, 1.0, 0.0]
+                    else:
+                        var16 = [0.0, 0.0, 1.0]
+                else:
+                    var16 = [0.0, 1.0, 0.0]
+        else:
+            if input[17] <= 31.649048805236816:
+                if input[17] <= 29.054829597473145:
+                    var16 = [1.0, 0.0, 0.0]
+                else:
+                    if input[18] <= 1.7199999690055847:
+                        var16 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[14] <= 0.5:
+                            var16 = [1.0, 0.0, 0.0]
+                        else:
+                            var16 = [0.0, 0.0, 1.0]
+            else:
+                var16 = [1.0, 0.0, 0.0]
+    else:
+        if input[18] <= 10.525000095367432:
+            if input[3] <= 0.5:
+                var16 = [0.0, 0.0, 1.0]
+            else:
+                var16 = [0.0, 1.0, 0.0]
+        else:
+            var16 = [0.0, 1.0, 0.0]
+    if input[3] <= 0.5:
+        if input[18] <= 7.419693231582642:
+            if input[5] <= 0.5:
+                if input[17] <= 29.054829597473145:
+                    var17 = [1.0, 0.0, 0.0]
+                else:
+                    if input[15] <= 0.5:
+                        if input[4] <= 0.5:
+                            if input[17] <= 29.643961906433105:
+                                var17 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[18] <= 2.0550000071525574:
+                                    var17 = [1.0, 0.0, 0.0]
+                                else:
+                                    var17 = [0.0, 0.0, 1.0]
+                        else:
+                            var17 = [1.0, 0.0, 0.0]
+                    else:
+                        var17 = [1.0, 0.0, 0.0]
+            else:
+                var17 = [0.0, 0.0, 1.0]
+        else:
+            if input[1] <= 0.5:
+                if input[17] <= 31.794302940368652:
+                    if input[16] <= 0.5:
+                        var17 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[5] <= 0.5:
+                            var17 = [0.0, 0.0, 1.0]
+                        else:
+                            var17 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 28.369998931884766:
+                        var17 = [1.0, 0.0, 0.0]
+                    else:
+                        var17 = [0.0, 0.0, 1.0]
+            else:
+                if input[6] <= 0.5:
+                    if input[4] <= 0.5:
+                        if input[13] <= 0.5:
+                            if input[15] <= 0.5:
+                                if input[16] <= 0.5:
+                                    if input[17] <= 22.363134384155273:
+                                        var17 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var17 = [0.0, 1.0, 0.0]
+                                else:
+                                    var17 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[8] <= 0.5:
+                                    var17 = [0.0, 1.0, 0.0]
+                                else:
+                                    var17 = [0.0, 0.0, 1.0]
+                        else:
+                            var17 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 39.47500038146973:
+                            var17 = [1.0, 0.0, 0.0]
+                        else:
+                            var17 = [0.0, 0.0, 1.0]
+                else:
+                    if input[10] <= 0.5:
+                        if input[17] <= 29.68824863433838:
+                            var17 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[17] <= 32.12221717834473:
+                                var17 = [0.0, 1.0, 0.0]
+                            else:
+                                var17 = [0.0, 0.0, 1.0]
+                    else:
+                        var17 = [0.0, 0.0, 1.0]
+    else:
+        if input[5] <= 0.5:
+            var17 = [0.0, 0.0, 1.0]
+        else:
+            var17 = [0.0, 1.0, 0.0]
+    if input[6] <= 0.5:
+        if input[2] <= 0.5:
+            if input[9] <= 0.5:
+                if input[10] <= 0.5:
+                    if input[13] <= 0.5:
+                        if input[17] <= 22.282362937927246:
+                            var18 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[12] <= 0.5:
+                                var18 = [0.0, 0.0, 1.0]
+                            else:
+                                var18 = [0.0, 1.0, 0.0]
+                    else:
+                        var18 = [0.0, 1.0, 0.0]
+                else:
+                    if input[1] <= 0.5:
+                        var18 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[5] <= 0.5:
+                            if input[18] <= 39.47500038146973:
+                                var18 = [1.0, 0.0, 0.0]
+                            else:
+                                var18 = [0.0, 0.0, 1.0]
+                        else:
+                            var18 = [0.0, 0.0, 1.0]
+            else:
+                var18 = [0.0, 1.0, 0.0]
+        else:
+            if input[5] <= 0.5:
+                var18 = [1.0, 0.0, 0.0]
+            else:
+                var18 = [0.0, 0.0, 1.0]
+    else:
+        if input[17] <= 33.81854248046875:
+            if input[10] <= 0.5:
+                if input[2] <= 0.5:
+                    if input[3] <= 0.5:
+                        if input[8] <= 0.5:
+                            if input[18] <= 35.55500030517578:
+                                if input[17] <= 17.662528038024902:
+                                    var18 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[18] <= 31.389999389648438:
+                                        var18 = [0.0, 1.0, 0.0]
+                                    else:
+                                        if input[17] <= 26.443750381469727:
+                                            var18 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var18 = [0.0, 1.0, 0.0]
+                            else:
+                                var18 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[17] <= 30.333117485046387:
+                                var18 = [0.0, 1.0, 0.0]
+                            else:
+                                var18 = [0.0, 0.0, 1.0]
+                    else:
+                        var18 = [0.0, 0.0, 1.0]
+                else:
+                    if input[17] <= 29.988983154296875:
+                        var18 = [1.0, 0.0, 0.0]
+                    else:
+                        var18 = [0.0, 0.0, 1.0]
+            else:
+                var18 = [0.0, 0.0, 1.0]
+        else:
+            if input[3] <= 0.5:
+                var18 = [1.0, 0.0, 0.0]
+            else:
+                var18 = [0.0, 0.0, 1.0]
+    if input[17] <= 21.764772415161133:
+        if input[18] <= 13.864999771118164:
+            if input[14] <= 0.5:
+                var19 = [0.0, 0.0, 1.0]
+            else:
+                var19 = [0.0, 1.0, 0.0]
+        else:
+            var19 = [0.0, 1.0, 0.0]
+    else:
+        if input[11] <= 0.5:
+            if input[4] <= 0.5:
+                if input[18] <= 9.441144466400146:
+                    if input[10] <= 0.5:
+                        if input[18] <= 1.784999966621399:
+                            var19 = [0.0, 1.0, 0.0]
+                        else:
+                            var19 = [0.0, 0.0, 1.0]
+                    else:
+                        var19 = [0.0, 0.0, 1.0]
+                else:
+                    if input[10] <= 0.5:
+                        if input[17] <= 23.904407501220703:
+                            var19 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[8] <= 0.5:
+                                if input[15] <= 0.5:
+                                    if input[17] <= 32.14398956298828:
+                                        var19 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var19 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[7] <= 0.5:
+                                        if input[17] <= 32.192633628845215:
+                                            var19 = [0.0, 1.0, 0.0]
+                                        else:
+                                            if input[18] <= 12.023727416992188:
+                                                var19 = [0.0, 1.0, 0.0]
+                                            else:
+                                                var19 = [0.0, 0.0, 1.0]
+                                    else:
+                                        if input[6] <= 0.5:
+                                            var19 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var19 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[17] <= 29.032323837280273:
+                                    var19 = [0.0, 1.0, 0.0]
+                                else:
+                                    var19 = [0.0, 0.0, 1.0]
+                    else:
+                        var19 = [0.0, 0.0, 1.0]
+            else:
+                if input[10] <= 0.5:
+                    if input[18] <= 16.54469347000122:
+                        if input[9] <= 0.5:
+                            if input[14] <= 0.5:
+                                var19 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[17] <= 42.925825119018555:
+                                    var19 = [0.0, 0.0, 1.0]
+                                else:
+                                    var19 = [1.0, 0.0, 0.0]
+                        else:
+                            var19 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[8] <= 0.5:
+                            if input[1] <= 0.5:
+                                if input[0] <= 0.5:
+                                    var19 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[16] <= 0.5:
+                                        if input[18] <= 28.369998931884766:
+                                            var19 = [1.0, 0.0, 0.0]
+                                        else:
+                                            var19 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var19 = [1.0, 0.0, 0.0]
+                            else:
+                                var19 = [1.0, 0.0, 0.0]
+                        else:
+                            var19 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 34.45302391052246:
+                        var19 = [0.0, 0.0, 1.0]
+                    else:
+                        var19 = [1.0, 0.0, 0.0]
+        else:
+            if input[6] <= 0.5:
+                if input[4] <= 0.5:
+                    var19 = [0.0, 0.0, 1.0]
+                else:
+                    var19 = [1.0, 0.0, 0.0]
+            else:
+                var19 = [1.0, 0.0, 0.0]
+    if input[9] <= 0.5:
+        if input[17] <= 31.680950164794922:
+            if input[2] <= 0.5:
+                if input[0] <= 0.5:
+                    if input[18] <= 47.53499984741211:
+                        if input[6] <= 0.5:
+                            if input[1] <= 0.5:
+                                var20 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[15] <= 0.5:
+                                    if input[10] <= 0.5:
+                                        var20 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var20 = [0.0, 0.0, 1.0]
+                                else:
+                                    var20 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[7] <= 0.5:
+                                if input[3] <= 0.5:
+                                    if input[8] <= 0.5:
+                                        var20 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var20 = [1.0, 0.0, 0.0]
+                                else:
+                                    var20 = [0.0, 0.0, 1.0]
+                            else:
+                                var20 = [1.0, 0.0, 0.0]
+                    else:
+                        var20 = [0.0, 0.0, 1.0]
+                else:
+                    if input[5] <= 0.5:
+                        var20 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[15] <= 0.5:
+                            var20 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[8] <= 0.5:
+                                var20 = [0.0, 1.0, 0.0]
+                            else:
+                                var20 = [0.0, 0.0, 1.0]
+            else:
+                if input[14] <= 0.5:
+                    if input[17] <= 23.765165328979492:
+                        var20 = [0.0, 0.0, 1.0]
+                    else:
+                        var20 = [1.0, 0.0, 0.0]
+                else:
+                    if input[18] <= 1.0899999737739563:
+                        var20 = [1.0, 0.0, 0.0]
+                    else:
+                        var20 = [0.0, 0.0, 1.0]
+        else:
+            if input[12] <= 0.5:
+                if input[11] <= 0.5:
+                    if input[6] <= 0.5:
+                        var20 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[13] <= 0.5:
+                            var20 = [0.0, 0.0, 1.0]
+                        else:
+                            var20 = [1.0, 0.0, 0.0]
+                else:
+                    var20 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 2.875:
+                    var20 = [1.0, 0.0, 0.0]
+                else:
+                    var20 = [0.0, 0.0, 1.0]
+    else:
+        var20 = [0.0, 1.0, 0.0]
+    if input[18] <= 9.619693279266357:
+        if input[5] <= 0.5:
+            if input[2] <= 0.5:
+                var21 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 31.649048805236816:
+                    if input[14] <= 0.5:
+                        var21 = [1.0, 0.0, 0.0]
+                    else:
+                        var21 = [0.0, 0.0, 1.0]
+                else:
+                    var21 = [1.0, 0.0, 0.0]
+        else:
+            if input[12] <= 0.5:
+                var21 = [0.0, 0.0, 1.0]
+            else:
+                var21 = [0.0, 1.0, 0.0]
+    else:
+        if input[13] <= 0.5:
+            if input[18] <= 37.38999938964844:
+                if input[7] <= 0.5:
+                    if input[4] <= 0.5:
+                        if input[1] <= 0.5:
+                            var21 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 33.301700592041016:
+                                var21 = [0.0, 1.0, 0.0]
+                            else:
+                                var21 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 16.54469347000122:
+                            var21 = [0.0, 1.0, 0.0]
+                        else:
+                            var21 = [1.0, 0.0, 0.0]
+                else:
+                    if input[5] <= 0.5:
+                        if input[14] <= 0.5:
+                            var21 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[18] <= 32.875:
+                                var21 = [0.0, 0.0, 1.0]
+                            else:
+                                var21 = [0.0, 1.0, 0.0]
+                    else:
+                        var21 = [0.0, 1.0, 0.0]
+            else:
+                if input[16] <= 0.5:
+                    if input[10] <= 0.5:
+                        if input[5] <= 0.5:
+                            var21 = [1.0, 0.0, 0.0]
+                        else:
+                            var21 = [0.0, 1.0, 0.0]
+                    else:
+                        var21 = [0.0, 0.0, 1.0]
+                else:
+                    var21 = [0.0, 0.0, 1.0]
+        else:
+            if input[0] <= 0.5:
+                var21 = [1.0, 0.0, 0.0]
+            else:
+                if input[6] <= 0.5:
+                    var21 = [1.0, 0.0, 0.0]
+                else:
+                    var21 = [0.0, 1.0, 0.0]
+    if input[2] <= 0.5:
+        if input[17] <= 34.212852478027344:
+            if input[5] <= 0.5:
+                if input[17] <= 28.935158729553223:
+                    if input[9] <= 0.5:
+                        if input[18] <= 22.69499969482422:
+                            var22 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[1] <= 0.5:
+                                var22 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[10] <= 0.5:
+                                    var22 = [1.0, 0.0, 0.0]
+                                else:
+                                    var22 = [0.0, 0.0, 1.0]
+                    else:
+                        var22 = [0.0, 1.0, 0.0]
+                else:
+                    if input[0] <= 0.5:
+                        if input[17] <= 32.12221717834473:
+                            var22 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[18] <= 12.023727416992188:
+                                var22 = [0.0, 1.0, 0.0]
+                            else:
+                                var22 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[17] <= 30.333117485046387:
+                            var22 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[7] <= 0.5:
+                                if input[17] <= 31.254234313964844:
+                                    var22 = [0.0, 0.0, 1.0]
+                                else:
+                                    var22 = [0.0, 1.0, 0.0]
+                            else:
+                                var22 = [0.0, 1.0, 0.0]
+            else:
+                if input[16] <= 0.5:
+                    if input[15] <= 0.5:
+                        var22 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[8] <= 0.5:
+                            var22 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 19.485254287719727:
+                                var22 = [0.0, 0.0, 1.0]
+                            else:
+                                var22 = [0.0, 1.0, 0.0]
+                else:
+                    var22 = [0.0, 1.0, 0.0]
+        else:
+            if input[6] <= 0.5:
+                if input[0] <= 0.5:
+                    if input[3] <= 0.5:
+                        var22 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[18] <= 2.8249999284744263:
+                            var22 = [1.0, 0.0, 0.0]
+                        else:
+                            var22 = [0.0, 0.0, 1.0]
+                else:
+                    var22 = [1.0, 0.0, 0.0]
+            else:
+                var22 = [0.0, 0.0, 1.0]
+    else:
+        if input[6] <= 0.5:
+            if input[5] <= 0.5:
+                var22 = [1.0, 0.0, 0.0]
+            else:
+                var22 = [0.0, 0.0, 1.0]
+        else:
+            if input[17] <= 33.505757331848145:
+                if input[14] <= 0.5:
+                    var22 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 29.054829597473145:
+                        var22 = [1.0, 0.0, 0.0]
+                    else:
+                        var22 = [0.0, 0.0, 1.0]
+            else:
+                var22 = [1.0, 0.0, 0.0]
+    if input[8] <= 0.5:
+        if input[12] <= 0.5:
+            if input[18] <= 6.140000104904175:
+                if input[15] <= 0.5:
+                    if input[14] <= 0.5:
+                        var23 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[18] <= 1.3399999737739563:
+                            var23 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[18] <= 1.699999988079071:
+                                var23 = [0.0, 0.0, 1.0]
+                            else:
+                                var23 = [1.0, 0.0, 0.0]
+                else:
+                    if input[5] <= 0.5:
+                        var23 = [1.0, 0.0, 0.0]
+                    else:
+                        var23 = [0.0, 0.0, 1.0]
+            else:
+                if input[10] <= 0.5:
+                    if input[17] <= 32.415992736816406:
+                        if input[16] <= 0.5:
+                            var23 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 21.05126667022705:
+                                var23 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[9] <= 0.5:
+                                    var23 = [1.0, 0.0, 0.0]
+                                else:
+                                    var23 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[4] <= 0.5:
+                            var23 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[15] <= 0.5:
+                                if input[17] <= 36.032827377319336:
+                                    var23 = [0.0, 0.0, 1.0]
+                                else:
+                                    var23 = [1.0, 0.0, 0.0]
+                            else:
+                                var23 = [1.0, 0.0, 0.0]
+                else:
+                    if input[14] <= 0.5:
+                        var23 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[17] <= 36.993812561035156:
+                            var23 = [0.0, 0.0, 1.0]
+                        else:
+                            var23 = [1.0, 0.0, 0.0]
+        else:
+            if input[4] <= 0.5:
+                if input[6] <= 0.5:
+                    var23 = [0.0, 1.0, 0.0]
+                else:
+                    var23 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 2.8249999284744263:
+                    var23 = [1.0, 0.0, 0.0]
+                else:
+                    var23 = [0.0, 0.0, 1.0]
+    else:
+        if input[6] <= 0.5:
+            if input[17] <= 21.972312927246094:
+                var23 = [0.0, 1.0, 0.0]
+            else:
+                var23 = [0.0, 0.0, 1.0]
+        else:
+            if input[17] <= 30.333117485046387:
+                if input[14] <= 0.5:
+                    var23 = [1.0, 0.0, 0.0]
+                else:
+                    var23 = [0.0, 1.0, 0.0]
+            else:
+                var23 = [0.0, 0.0, 1.0]
+    if input[16] <= 0.5:
+        if input[5] <= 0.5:
+            if input[9] <= 0.5:
+                if input[2] <= 0.5:
+                    if input[14] <= 0.5:
+                        if input[7] <= 0.5:
+                            var24 = [0.0, 0.0, 1.0]
+                        else:
+                            var24 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[6] <= 0.5:
+                            if input[13] <= 0.5:
+                                if input[10] <= 0.5:
+                                    var24 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[18] <= 39.47500038146973:
+                                        var24 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var24 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[0] <= 0.5:
+                                    var24 = [1.0, 0.0, 0.0]
+                                else:
+                                    var24 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[18] <= 25.954999923706055:
+                                var24 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[1] <= 0.5:
+                                    if input[8] <= 0.5:
+                                        if input[18] <= 30.53999900817871:
+                                            var24 = [0.0, 1.0, 0.0]
+                                        else:
+                                            if input[18] <= 32.875:
+                                                var24 = [0.0, 0.0, 1.0]
+                                            else:
+                                                var24 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var24 = [0.0, 1.0, 0.0]
+                                else:
+                                    var24 = [0.0, 0.0, 1.0]
+                else:
+                    if input[18] <= 1.3449999690055847:
+                        var24 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 31.649048805236816:
+                            if input[18] <= 3.0850000381469727:
+                                var24 = [0.0, 0.0, 1.0]
+                            else:
+                                var24 = [1.0, 0.0, 0.0]
+                        else:
+                            var24 = [1.0, 0.0, 0.0]
+            else:
+                if input[6] <= 0.5:
+                    var24 = [0.0, 1.0, 0.0]
+                else:
+                    if input[0] <= 0.5:
+                        if input[17] <= 32.28618144989014:
+                            var24 = [0.0, 1.0, 0.0]
+                        else:
+                            var24 = [0.0, 0.0, 1.0]
+                    else:
+                        var24 = [0.0, 1.0, 0.0]
+        else:
+            if input[15] <= 0.5:
+                if input[1] <= 0.5:
+                    var24 = [0.0, 1.0, 0.0]
+                else:
+                    if input[17] <= 22.363134384155273:
+                        var24 = [0.0, 0.0, 1.0]
+                    else:
+                        var24 = [0.0, 1.0, 0.0]
+            else:
+                if input[0] <= 0.5:
+                    var24 = [0.0, 1.0, 0.0]
+                else:
+                    var24 = [0.0, 0.0, 1.0]
+    else:
+        if input[6] <= 0.5:
+            if input[17] <= 20.09489631652832:
+                var24 = [0.0, 1.0, 0.0]
+            else:
+                var24 = [0.0, 0.0, 1.0]
+        else:
+            if input[0] <= 0.5:
+                if input[17] <= 30.73780345916748:
+                    var24 = [1.0, 0.0, 0.0]
+                else:
+                    if input[12] <= 0.5:
+                        if input[10] <= 0.5:
+                            var24 = [1.0, 0.0, 0.0]
+                        else:
+                            var24 = [0.0, 0.0, 1.0]
+                    else:
+                        var24 = [0.0, 0.0, 1.0]
+            else:
+                var24 = [0.0, 0.0, 1.0]
+    if input[5] <= 0.5:
+        if input[17] <= 35.32961463928223:
+            if input[17] <= 32.076438903808594:
+                if input[16] <= 0.5:
+                    if input[2] <= 0.5:
+                        if input[12] <= 0.5:
+                            if input[15] <= 0.5:
+                                if input[17] <= 30.207368850708008:
+                                    if input[9] <= 0.5:
+                                        if input[17] <= 25.268705368041992:
+                                            var25 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var25 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var25 = [0.0, 1.0, 0.0]
+                                else:
+                                    var25 = [0.0, 0.0, 1.0]
+                            else:
+                                var25 = [0.0, 1.0, 0.0]
+                        else:
+                            var25 = [0.0, 0.0, 1.0]
+                    else:
+                        var25 = [0.0, 0.0, 1.0]
+                else:
+                    if input[6] <= 0.5:
+                        var25 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[18] <= 20.169184684753418:
+                            var25 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[10] <= 0.5:
+                                if input[9] <= 0.5:
+                                    if input[1] <= 0.5:
+                                        var25 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var25 = [1.0, 0.0, 0.0]
+                                else:
+                                    var25 = [0.0, 1.0, 0.0]
+                            else:
+                                var25 = [0.0, 0.0, 1.0]
+            else:
+                if input[11] <= 0.5:
+                    if input[16] <= 0.5:
+                        var25 = [0.0, 0.0, 1.0]
+                    else:
+                        var25 = [1.0, 0.0, 0.0]
+                else:
+                    var25 = [1.0, 0.0, 0.0]
+        else:
+            var25 = [1.0, 0.0, 0.0]
+    else:
+        if input[0] <= 0.5:
+            if input[11] <= 0.5:
+                if input[17] <= 23.012829780578613:
+                    if input[17] <= 19.21723461151123:
+                        var25 = [0.0, 1.0, 0.0]
+                    else:
+                        var25 = [0.0, 0.0, 1.0]
+                else:
+                    var25 = [0.0, 1.0, 0.0]
+            else:
+                var25 = [0.0, 0.0, 1.0]
+        else:
+            var25 = [0.0, 1.0, 0.0]
+    if input[2] <= 0.5:
+        if input[5] <= 0.5:
+            if input[6] <= 0.5:
+                var26 = [1.0, 0.0, 0.0]
+            else:
+                if input[7] <= 0.5:
+                    if input[17] <= 33.27631378173828:
+                        if input[9] <= 0.5:
+                            if input[14] <= 0.5:
+                                var26 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[18] <= 28.94499969482422:
+                                    var26 = [0.0, 0.0, 1.0]
+                                else:
+                                    var26 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 32.415992736816406:
+                                var26 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[18] <= 12.023727416992188:
+                                    var26 = [0.0, 1.0, 0.0]
+                                else:
+                                    var26 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[13] <= 0.5:
+                            var26 = [0.0, 0.0, 1.0]
+                        else:
+                            var26 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 19.265146255493164:
+                        var26 = [0.0, 0.0, 1.0]
+                    else:
+                        var26 = [1.0, 0.0, 0.0]
+        else:
+            if input[17] <= 20.12319564819336:
+                if input[0] <= 0.5:
+                    var26 = [0.0, 0.0, 1.0]
+                else:
+                    if input[15] <= 0.5:
+                        var26 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 17.182832717895508:
+                            var26 = [0.0, 1.0, 0.0]
+                        else:
+                            var26 = [0.0, 0.0, 1.0]
+            else:
+                var26 = [0.0, 1.0, 0.0]
+    else:
+        if input[16] <= 0.5:
+            if input[4] <= 0.5:
+                if input[14] <= 0.5:
+                    if input[18] <= 2.4299999475479126:
+                        var26 = [0.0, 0.0, 1.0]
+                    else:
+                        var26 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 32.571603775024414:
+                        var26 = [0.0, 0.0, 1.0]
+                    else:
+                        var26 = [1.0, 0.0, 0.0]
+            else:
+                var26 = [1.0, 0.0, 0.0]
+        else:
+            var26 = [1.0, 0.0, 0.0]
+    if input[17] <= 35.32961463928223:
+        if input[11] <= 0.5:
+            if input[17] <= 33.27631378173828:
+                if input[17] <= 23.074698448181152:
+                    if input[7] <= 0.5:
+                        if input[18] <= 40.329999923706055:
+                            if input[3] <= 0.5:
+                                var27 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[6] <= 0.5:
+                                    var27 = [0.0, 1.0, 0.0]
+                                else:
+                                    var27 = [0.0, 0.0, 1.0]
+                        else:
+                            var27 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[5] <= 0.5:
+                            var27 = [0.0, 0.0, 1.0]
+                        else:
+                            var27 = [0.0, 1.0, 0.0]
+                else:
+                    if input[1] <= 0.5:
+                        if input[15] <= 0.5:
+                            if input[6] <= 0.5:
+                                var27 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[8] <= 0.5:
+                                    if input[3] <= 0.5:
+                                        var27 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var27 = [0.0, 0.0, 1.0]
+                                else:
+                                    var27 = [0.0, 1.0, 0.0]
+                        else:
+                            var27 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[14] <= 0.5:
+                            if input[9] <= 0.5:
+                                var27 = [1.0, 0.0, 0.0]
+                            else:
+                                var27 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 27.685659408569336:
+                                var27 = [0.0, 1.0, 0.0]
+                            else:
+                                var27 = [0.0, 0.0, 1.0]
+            else:
+                if input[15] <= 0.5:
+                    if input[14] <= 0.5:
+                        var27 = [1.0, 0.0, 0.0]
+                    else:
+                        var27 = [0.0, 0.0, 1.0]
+                else:
+                    var27 = [0.0, 0.0, 1.0]
+        else:
+            if input[18] <= 1.8100000023841858:
+                var27 = [0.0, 0.0, 1.0]
+            else:
+                if input[16] <= 0.5:
+                    if input[5] <= 0.5:
+                        if input[6] <= 0.5:
+                            var27 = [1.0, 0.0, 0.0]
+                        else:
+                            var27 = [0.0, 0.0, 1.0]
+                    else:
+                        var27 = [0.0, 0.0, 1.0]
+                else:
+                    var27 = [1.0, 0.0, 0.0]
+    else:
+        if input[12] <= 0.5:
+            var27 = [1.0, 0.0, 0.0]
+        else:
+            if input[4] <= 0.5:
+                var27 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 42.925825119018555:
+                    var27 = [0.0, 0.0, 1.0]
+                else:
+                    var27 = [1.0, 0.0, 0.0]
+    if input[2] <= 0.5:
+        if input[5] <= 0.5:
+            if input[4] <= 0.5:
+                if input[3] <= 0.5:
+                    if input[16] <= 0.5:
+                        if input[7] <= 0.5:
+                            if input[0] <= 0.5:
+                                if input[9] <= 0.5:
+                                    var28 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[17] <= 32.28618144989014:
+                                        var28 = [0.0, 1.0, 0.0]
+                                    else:
+                                        if input[18] <= 12.023727416992188:
+                                            var28 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var28 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[17] <= 30.333117485046387:
+                                    var28 = [0.0, 1.0, 0.0]
+                                else:
+                                    var28 = [0.0, 0.0, 1.0]
+                        else:
+                            var28 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[8] <= 0.5:
+                            var28 = [0.0, 0.0, 1.0]
+                        else:
+                            var28 = [1.0, 0.0, 0.0]
+                else:
+                    var28 = [0.0, 0.0, 1.0]
+            else:
+                if input[9] <= 0.5:
+                    if input[17] <= 33.13436317443848:
+                        var28 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[0] <= 0.5:
+                            var28 = [1.0, 0.0, 0.0]
+                        else:
+                            var28 = [0.0, 0.0, 1.0]
+                else:
+                    var28 = [0.0, 1.0, 0.0]
+        else:
+            if input[10] <= 0.5:
+                if input[16] <= 0.5:
+                    if input[18] <= 46.53499984741211:
+                        var28 = [0.0, 1.0, 0.0]
+                    else:
+                        var28 = [0.0, 0.0, 1.0]
+                else:
+                    var28 = [0.0, 1.0, 0.0]
+            else:
+                if input[17] <= 17.263123035430908:
+                    var28 = [0.0, 1.0, 0.0]
+                else:
+                    var28 = [0.0, 0.0, 1.0]
+    else:
+        if input[18] <= 0.5499999821186066:
+            var28 = [0.0, 0.0, 1.0]
+        else:
+            if input[14] <= 0.5:
+                if input[16] <= 0.5:
+                    if input[5] <= 0.5:
+                        var28 = [1.0, 0.0, 0.0]
+                    else:
+                        var28 = [0.0, 0.0, 1.0]
+                else:
+                    var28 = [1.0, 0.0, 0.0]
+            else:
+                var28 = [1.0, 0.0, 0.0]
+    if input[2] <= 0.5:
+        if input[0] <= 0.5:
+            if input[5] <= 0.5:
+                if input[12] <= 0.5:
+                    if input[16] <= 0.5:
+                        if input[15] <= 0.5:
+                            if input[18] <= 44.03499984741211:
+                                var29 = [1.0, 0.0, 0.0]
+                            else:
+                                var29 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[9] <= 0.5:
+                                if input[18] <= 40.709999084472656:
+                                    var29 = [1.0, 0.0, 0.0]
+                                else:
+                                    var29 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[18] <= 21.752583026885986:
+                                    var29 = [0.0, 0.0, 1.0]
+                                else:
+                                    var29 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 45.829999923706055:
+                            var29 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[10] <= 0.5:
+                                var29 = [1.0, 0.0, 0.0]
+                            else:
+                                var29 = [0.0, 0.0, 1.0]
+                else:
+                    if input[17] <= 44.4867000579834:
+                        if input[18] <= 2.694999933242798:
+                            var29 = [0.0, 0.0, 1.0]
+                        else:
+                            var29 = [1.0, 0.0, 0.0]
+                    else:
+                        var29 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 46.53499984741211:
+                    if input[10] <= 0.5:
+                        var29 = [0.0, 1.0, 0.0]
+                    else:
+                        var29 = [0.0, 0.0, 1.0]
+                else:
+                    var29 = [0.0, 0.0, 1.0]
+        else:
+            if input[9] <= 0.5:
+                if input[4] <= 0.5:
+                    if input[7] <= 0.5:
+                        if input[15] <= 0.5:
+                            if input[6] <= 0.5:
+                                var29 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[18] <= 28.94499969482422:
+                                    if input[17] <= 29.032323837280273:
+                                        var29 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var29 = [0.0, 0.0, 1.0]
+                                else:
+                                    var29 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[6] <= 0.5:
+                                if input[18] <= 14.170000076293945:
+                                    var29 = [0.0, 0.0, 1.0]
+                                else:
+                                    var29 = [0.0, 1.0, 0.0]
+                            else:
+                                var29 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[15] <= 0.5:
+                            var29 = [0.0, 0.0, 1.0]
+                        else:
+                            var29 = [0.0, 1.0, 0.0]
+                else:
+                    if input[17] <= 35.3419246673584:
+                        var29 = [0.0, 0.0, 1.0]
+                    else:
+                        var29 = [1.0, 0.0, 0.0]
+            else:
+                var29 = [0.0, 1.0, 0.0]
+    else:
+        if input[17] <= 23.765165328979492:
+            var29 = [0.0, 0.0, 1.0]
+        else:
+            var29 = [1.0, 0.0, 0.0]
+    if input[14] <= 0.5:
+        if input[3] <= 0.5:
+            if input[18] <= 24.82418441772461:
+                if input[13] <= 0.5:
+                    if input[11] <= 0.5:
+                        if input[17] <= 22.892462730407715:
+                            var30 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[6] <= 0.5:
+                                var30 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[8] <= 0.5:
+                                    var30 = [0.0, 0.0, 1.0]
+                                else:
+                                    var30 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 23.765165328979492:
+                            var30 = [0.0, 0.0, 1.0]
+                        else:
+                            var30 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 26.397357940673828:
+                        var30 = [0.0, 1.0, 0.0]
+                    else:
+                        var30 = [1.0, 0.0, 0.0]
+            else:
+                if input[6] <= 0.5:
+                    if input[0] <= 0.5:
+                        if input[18] <= 47.43000030517578:
+                            var30 = [0.0, 1.0, 0.0]
+                        else:
+                            var30 = [0.0, 0.0, 1.0]
+                    else:
+                        var30 = [0.0, 1.0, 0.0]
+                else:
+                    if input[0] <= 0.5:
+                        if input[7] <= 0.5:
+                            if input[10] <= 0.5:
+                                var30 = [0.0, 1.0, 0.0]
+                            else:
+                                var30 = [0.0, 0.0, 1.0]
+                        else:
+                            var30 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[16] <= 0.5:
+                            var30 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[18] <= 28.124184608459473:
+                                var30 = [0.0, 1.0, 0.0]
+                            else:
+                                var30 = [0.0, 0.0, 1.0]
+        else:
+            if input[6] <= 0.5:
+                if input[18] <= 3.284999966621399:
+                    var30 = [0.0, 1.0, 0.0]
+                else:
+                    var30 = [0.0, 0.0, 1.0]
+            else:
+                var30 = [0.0, 0.0, 1.0]
+    else:
+        if input[17] <= 31.19386577606201:
+            if input[6] <= 0.5:
+                if input[1] <= 0.5:
+                    var30 = [0.0, 1.0, 0.0]
+                else:
+                    if input[13] <= 0.5:
+                        var30 = [0.0, 0.0, 1.0]
+                    else:
+                        var30 = [0.0, 1.0, 0.0]
+            else:
+                if input[8] <= 0.5:
+                    if input[7] <= 0.5:
+                        var30 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[17] <= 26.73582935333252:
+                            var30 = [0.0, 0.0, 1.0]
+                        else:
+                            var30 = [0.0, 1.0, 0.0]
+                else:
+                    var30 = [0.0, 0.0, 1.0]
+        else:
+            if input[0] <= 0.5:
+                var30 = [1.0, 0.0, 0.0]
+            else:
+                if input[13] <= 0.5:
+                    var30 = [1.0, 0.0, 0.0]
+                else:
+                    var30 = [0.0, 0.0, 1.0]
+    if input[2] <= 0.5:
+        if input[4] <= 0.5:
+            if input[18] <= 39.14999961853027:
+                if input[15] <= 0.5:
+                    if input[5] <= 0.5:
+                        if input[17] <= 25.268705368041992:
+                            var31 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[14] <= 0.5:
+                                if input[12] <= 0.5:
+                                    var31 = [1.0, 0.0, 0.0]
+                                else:
+                                    var31 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[7] <= 0.5:
+                                    if input[0] <= 0.5:
+                                        var31 = [0.0, 0.0, 1.0]
+                                    else:
+                                        if input[18] <= 17.78000020980835:
+                                            var31 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var31 = [0.0, 0.0, 1.0]
+                                else:
+                                    var31 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[10] <= 0.5:
+                            var31 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[18] <= 26.630000114440918:
+                                var31 = [0.0, 0.0, 1.0]
+                            else:
+                                var31 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 2.759999990463257:
+                        if input[18] <= 1.784999966621399:
+                            var31 = [0.0, 1.0, 0.0]
+                        else:
+                            var31 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[9] <= 0.5:
+                            var31 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[18] <= 20.835903644561768:
+                                if input[17] <= 33.033369064331055:
+                                    var31 = [0.0, 0.0, 1.0]
+                                else:
+                                    var31 = [0.0, 1.0, 0.0]
+                            else:
+                                var31 = [0.0, 1.0, 0.0]
+            else:
+                if input[7] <= 0.5:
+                    if input[10] <= 0.5:
+                        var31 = [1.0, 0.0, 0.0]
+                    else:
+                        var31 = [0.0, 0.0, 1.0]
+                else:
+                    var31 = [1.0, 0.0, 0.0]
+        else:
+            if input[12] <= 0.5:
+                if input[0] <= 0.5:
+                    if input[17] <= 33.870553970336914:
+                        var31 = [0.0, 0.0, 1.0]
+                    else:
+                        var31 = [1.0, 0.0, 0.0]
+                else:
+                    if input[14] <= 0.5:
+                        var31 = [1.0, 0.0, 0.0]
+                    else:
+                        var31 = [0.0, 0.0, 1.0]
+            else:
+                var31 = [0.0, 0.0, 1.0]
+    else:
+        if input[11] <= 0.5:
+            var31 = [1.0, 0.0, 0.0]
+        else:
+            if input[14] <= 0.5:
+                if input[17] <= 23.402153968811035:
+                    var31 = [0.0, 0.0, 1.0]
+                else:
+                    var31 = [1.0, 0.0, 0.0]
+            else:
+                var31 = [1.0, 0.0, 0.0]
+    if input[0] <= 0.5:
+        if input[17] <= 33.00283432006836:
+            if input[17] <= 19.21723461151123:
+                var32 = [0.0, 1.0, 0.0]
+            else:
+                if input[18] <= 19.835000038146973:
+                    if input[18] <= 1.4100000262260437:
+                        if input[3] <= 0.5:
+                            var32 = [1.0, 0.0, 0.0]
+                        else:
+                            var32 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[4] <= 0.5:
+                            if input[3] <= 0.5:
+                                if input[16] <= 0.5:
+                                    var32 = [0.0, 0.0, 1.0]
+                                else:
+                                    var32 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[16] <= 0.5:
+                                    if input[15] <= 0.5:
+                                        var32 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var32 = [0.0, 1.0, 0.0]
+                                else:
+                                    var32 = [0.0, 0.0, 1.0]
+                        else:
+                            var32 = [1.0, 0.0, 0.0]
+                else:
+                    if input[16] <= 0.5:
+                        if input[17] <= 20.9281644821167:
+                            var32 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[15] <= 0.5:
+                                var32 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[6] <= 0.5:
+                                    var32 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[18] <= 34.06999969482422:
+                                        var32 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var32 = [1.0, 0.0, 0.0]
+                    else:
+                        var32 = [0.0, 0.0, 1.0]
+        else:
+            if input[14] <= 0.5:
+                var32 = [1.0, 0.0, 0.0]
+            else:
+                if input[4] <= 0.5:
+                    if input[11] <= 0.5:
+                        var32 = [0.0, 0.0, 1.0]
+                    else:
+                        var32 = [1.0, 0.0, 0.0]
+                else:
+                    if input[10] <= 0.5:
+                        if input[3] <= 0.5:
+                            var32 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[18] <= 2.8249999284744263:
+                                var32 = [1.0, 0.0, 0.0]
+                            else:
+                                var32 = [0.0, 0.0, 1.0]
+                    else:
+                        var32 = [1.0, 0.0, 0.0]
+    else:
+        if input[16] <= 0.5:
+            if input[13] <= 0.5:
+                if input[8] <= 0.5:
+                    if input[7] <= 0.5:
+                        var32 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 32.875:
+                            if input[14] <= 0.5:
+                                var32 = [0.0, 1.0, 0.0]
+                            else:
+                                var32 = [0.0, 0.0, 1.0]
+                        else:
+                            var32 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 28.94499969482422:
+                        var32 = [0.0, 0.0, 1.0]
+                    else:
+                        var32 = [0.0, 1.0, 0.0]
+            else:
+                if input[15] <= 0.5:
+                    var32 = [0.0, 0.0, 1.0]
+                else:
+                    var32 = [0.0, 1.0, 0.0]
+        else:
+            if input[17] <= 17.740819931030273:
+                var32 = [0.0, 0.0, 1.0]
+            else:
+                var32 = [0.0, 1.0, 0.0]
+    if input[0] <= 0.5:
+        if input[2] <= 0.5:
+            if input[17] <= 33.27631378173828:
+                if input[6] <= 0.5:
+                    var33 = [0.0, 1.0, 0.0]
+                else:
+                    if input[17] <= 28.156450271606445:
+                        if input[17] <= 21.143878936767578:
+                            var33 = [0.0, 0.0, 1.0]
+                        else:
+                            var33 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[18] <= 21.752583026885986:
+                            if input[3] <= 0.5:
+                                if input[17] <= 33.033369064331055:
+                                    var33 = [0.0, 0.0, 1.0]
+                                else:
+                                    var33 = [0.0, 1.0, 0.0]
+                            else:
+                                var33 = [0.0, 0.0, 1.0]
+                        else:
+                            var33 = [0.0, 1.0, 0.0]
+            else:
+                if input[18] <= 36.20000076293945:
+                    if input[17] <= 36.993812561035156:
+                        var33 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[16] <= 0.5:
+                            var33 = [1.0, 0.0, 0.0]
+                        else:
+                            var33 = [0.0, 0.0, 1.0]
+                else:
+                    var33 = [1.0, 0.0, 0.0]
+        else:
+            if input[6] <= 0.5:
+                if input[17] <= 27.677541732788086:
+                    var33 = [0.0, 0.0, 1.0]
+                else:
+                    var33 = [1.0, 0.0, 0.0]
+            else:
+                var33 = [1.0, 0.0, 0.0]
+    else:
+        if input[9] <= 0.5:
+            if input[16] <= 0.5:
+                if input[17] <= 31.725293159484863:
+                    if input[8] <= 0.5:
+                        if input[17] <= 22.344231605529785:
+                            var33 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[18] <= 32.875:
+                                if input[13] <= 0.5:
+                                    var33 = [0.0, 0.0, 1.0]
+                                else:
+                                    var33 = [0.0, 1.0, 0.0]
+                            else:
+                                var33 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[15] <= 0.5:
+                            if input[18] <= 28.94499969482422:
+                                var33 = [0.0, 0.0, 1.0]
+                            else:
+                                var33 = [0.0, 1.0, 0.0]
+                        else:
+                            var33 = [0.0, 0.0, 1.0]
+                else:
+                    var33 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 43.65999984741211:
+                    var33 = [0.0, 1.0, 0.0]
+                else:
+                    var33 = [1.0, 0.0, 0.0]
+        else:
+            var33 = [0.0, 1.0, 0.0]
+    if input[2] <= 0.5:
+        if input[5] <= 0.5:
+            if input[0] <= 0.5:
+                if input[7] <= 0.5:
+                    if input[18] <= 14.122582912445068:
+                        if input[12] <= 0.5:
+                            if input[18] <= 12.023727416992188:
+                                if input[10] <= 0.5:
+                                    var34 = [0.0, 1.0, 0.0]
+                                else:
+                                    var34 = [0.0, 0.0, 1.0]
+                            else:
+                                var34 = [0.0, 0.0, 1.0]
+                        else:
+                            var34 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[15] <= 0.5:
+                            if input[17] <= 34.75508117675781:
+                                var34 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[18] <= 31.64000129699707:
+                                    var34 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[6] <= 0.5:
+                                        var34 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var34 = [0.0, 0.0, 1.0]
+                        else:
+                            var34 = [0.0, 0.0, 1.0]
+                else:
+                    var34 = [1.0, 0.0, 0.0]
+            else:
+                if input[17] <= 17.662528038024902:
+                    var34 = [0.0, 0.0, 1.0]
+                else:
+                    if input[17] <= 33.21696090698242:
+                        if input[7] <= 0.5:
+                            if input[8] <= 0.5:
+                                if input[16] <= 0.5:
+                                    var34 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[4] <= 0.5:
+                                        var34 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var34 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[6] <= 0.5:
+                                    var34 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[17] <= 29.032323837280273:
+                                        var34 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var34 = [0.0, 0.0, 1.0]
+                        else:
+                            var34 = [0.0, 0.0, 1.0]
+                    else:
+                        var34 = [0.0, 0.0, 1.0]
+        else:
+            if input[1] <= 0.5:
+                if input[10] <= 0.5:
+                    if input[8] <= 0.5:
+                        var34 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[16] <= 0.5:
+                            var34 = [0.0, 0.0, 1.0]
+                        else:
+                            var34 = [0.0, 1.0, 0.0]
+                else:
+                    var34 = [0.0, 1.0, 0.0]
+            else:
+                var34 = [0.0, 1.0, 0.0]
+    else:
+        if input[6] <= 0.5:
+            if input[18] <= 3.0449999570846558:
+                if input[14] <= 0.5:
+                    if input[4] <= 0.5:
+                        var34 = [0.0, 0.0, 1.0]
+                    else:
+                        var34 = [1.0, 0.0, 0.0]
+                else:
+                    var34 = [1.0, 0.0, 0.0]
+            else:
+                var34 = [0.0, 0.0, 1.0]
+        else:
+            var34 = [1.0, 0.0, 0.0]
+    if input[17] <= 32.076438903808594:
+        if input[11] <= 0.5:
+            if input[3] <= 0.5:
+                if input[17] <= 17.86347007751465:
+                    var35 = [0.0, 0.0, 1.0]
+                else:
+                    if input[8] <= 0.5:
+                        if input[1] <= 0.5:
+                            if input[16] <= 0.5:
+                                if input[7] <= 0.5:
+                                    var35 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[6] <= 0.5:
+                                        var35 = [0.0, 1.0, 0.0]
+                                    else:
+                                        if input[18] <= 32.875:
+                                            if input[17] <= 26.73582935333252:
+                                                var35 = [0.0, 0.0, 1.0]
+                                            else:
+                                                var35 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var35 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[6] <= 0.5:
+                                    var35 = [1.0, 0.0, 0.0]
+                                else:
+                                    var35 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[9] <= 0.5:
+                                if input[17] <= 20.12319564819336:
+                                    var35 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[10] <= 0.5:
+                                        if input[13] <= 0.5:
+                                            if input[17] <= 21.30946445465088:
+                                                var35 = [0.0, 1.0, 0.0]
+                                            else:
+                                                if input[6] <= 0.5:
+                                                    var35 = [0.0, 1.0, 0.0]
+                                                else:
+                                                    var35 = [1.0, 0.0, 0.0]
+                                        else:
+                                            var35 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var35 = [0.0, 0.0, 1.0]
+                            else:
+                                var35 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 31.027535438537598:
+                            if input[18] <= 24.50999927520752:
+                                if input[17] <= 27.76011371612549:
+                                    var35 = [0.0, 1.0, 0.0]
+                                else:
+                                    var35 = [1.0, 0.0, 0.0]
+                            else:
+                                var35 = [0.0, 1.0, 0.0]
+                        else:
+                            var35 = [1.0, 0.0, 0.0]
+            else:
+                var35 = [0.0, 0.0, 1.0]
+        else:
+            if input[5] <= 0.5:
+                var35 = [1.0, 0.0, 0.0]
+            else:
+                var35 = [0.0, 0.0, 1.0]
+    else:
+        if input[17] <= 44.7901725769043:
+            if input[2] <= 0.5:
+                if input[10] <= 0.5:
+                    if input[15] <= 0.5:
+                        if input[13] <= 0.5:
+                            if input[18] <= 2.8249999284744263:
+                                var35 = [1.0, 0.0, 0.0]
+                            else:
+                                var35 = [0.0, 0.0, 1.0]
+                        else:
+                            var35 = [0.0, 0.0, 1.0]
+                    else:
+                        var35 = [1.0, 0.0, 0.0]
+                else:
+                    if input[6] <= 0.5:
+                        var35 = [1.0, 0.0, 0.0]
+                    else:
+                        var35 = [0.0, 0.0, 1.0]
+            else:
+                var35 = [1.0, 0.0, 0.0]
+        else:
+            var35 = [0.0, 0.0, 1.0]
+    if input[17] <= 32.076438903808594:
+        if input[15] <= 0.5:
+            if input[0] <= 0.5:
+                if input[14] <= 0.5:
+                    if input[1] <= 0.5:
+                        var36 = [0.0, 0.0, 1.0]
+                    else:
+                        var36 = [1.0, 0.0, 0.0]
+                else:
+                    if input[18] <= 1.0899999737739563:
+                        var36 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[4] <= 0.5:
+                            if input[6] <= 0.5:
+                                if input[17] <= 22.363134384155273:
+                                    var36 = [0.0, 0.0, 1.0]
+                                else:
+                                    var36 = [0.0, 1.0, 0.0]
+                            else:
+                                var36 = [0.0, 0.0, 1.0]
+                        else:
+                            var36 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 32.875:
+                    if input[9] <= 0.5:
+                        var36 = [0.0, 0.0, 1.0]
+                    else:
+                        var36 = [0.0, 1.0, 0.0]
+                else:
+                    if input[13] <= 0.5:
+                        var36 = [0.0, 1.0, 0.0]
+                    else:
+                        var36 = [1.0, 0.0, 0.0]
+        else:
+            if input[2] <= 0.5:
+                if input[8] <= 0.5:
+                    var36 = [0.0, 1.0, 0.0]
+                else:
+                    if input[1] <= 0.5:
+                        if input[17] <= 19.485254287719727:
+                            var36 = [0.0, 0.0, 1.0]
+                        else:
+                            var36 = [0.0, 1.0, 0.0]
+                    else:
+                        var36 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 2.8600000143051147:
+                    var36 = [0.0, 0.0, 1.0]
+                else:
+                    var36 = [1.0, 0.0, 0.0]
+    else:
+        if input[17] <= 44.7901725769043:
+            if input[0] <= 0.5:
+                if input[17] <= 33.00283432006836:
+                    if input[9] <= 0.5:
+                        var36 = [1.0, 0.0, 0.0]
+                    else:
+                        var36 = [0.0, 0.0, 1.0]
+                else:
+                    if input[17] <= 33.808231353759766:
+                        if input[15] <= 0.5:
+                            var36 = [1.0, 0.0, 0.0]
+                        else:
+                            var36 = [0.0, 1.0, 0.0]
+                    else:
+                        var36 = [1.0, 0.0, 0.0]
+            else:
+                var36 = [0.0, 0.0, 1.0]
+        else:
+            if input[14] <= 0.5:
+                var36 = [0.0, 0.0, 1.0]
+            else:
+                var36 = [1.0, 0.0, 0.0]
+    if input[5] <= 0.5:
+        if input[14] <= 0.5:
+            if input[10] <= 0.5:
+                if input[4] <= 0.5:
+                    if input[16] <= 0.5:
+                        if input[11] <= 0.5:
+                            if input[7] <= 0.5:
+                                if input[12] <= 0.5:
+                                    var37 = [0.0, 1.0, 0.0]
+                                else:
+                                    var37 = [0.0, 0.0, 1.0]
+                            else:
+                                var37 = [1.0, 0.0, 0.0]
+                        else:
+                            var37 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 40.84758949279785:
+                            if input[9] <= 0.5:
+                                var37 = [1.0, 0.0, 0.0]
+                            else:
+                                var37 = [0.0, 1.0, 0.0]
+                        else:
+                            var37 = [0.0, 0.0, 1.0]
+                else:
+                    var37 = [1.0, 0.0, 0.0]
+            else:
+                var37 = [0.0, 0.0, 1.0]
+        else:
+            if input[17] <= 31.521262168884277:
+                if input[11] <= 0.5:
+                    if input[8] <= 0.5:
+                        if input[9] <= 0.5:
+                            if input[17] <= 26.73582935333252:
+                                var37 = [0.0, 0.0, 1.0]
+                            else:
+                                var37 = [0.0, 1.0, 0.0]
+                        else:
+                            var37 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 29.032323837280273:
+                            var37 = [0.0, 1.0, 0.0]
+                        else:
+                            var37 = [0.0, 0.0, 1.0]
+                else:
+                    if input[17] <= 29.054829597473145:
+                        var37 = [1.0, 0.0, 0.0]
+                    else:
+                        var37 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 40.621036529541016:
+                    var37 = [1.0, 0.0, 0.0]
+                else:
+                    if input[6] <= 0.5:
+                        if input[3] <= 0.5:
+                            var37 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[18] <= 2.8249999284744263:
+                                var37 = [1.0, 0.0, 0.0]
+                            else:
+                                var37 = [0.0, 0.0, 1.0]
+                    else:
+                        var37 = [1.0, 0.0, 0.0]
+    else:
+        if input[17] <= 24.145343780517578:
+            if input[12] <= 0.5:
+                if input[18] <= 10.525000095367432:
+                    var37 = [0.0, 0.0, 1.0]
+                else:
+                    if input[10] <= 0.5:
+                        var37 = [0.0, 1.0, 0.0]
+                    else:
+                        var37 = [0.0, 0.0, 1.0]
+            else:
+                var37 = [0.0, 1.0, 0.0]
+        else:
+            var37 = [0.0, 1.0, 0.0]
+    if input[0] <= 0.5:
+        if input[7] <= 0.5:
+            if input[17] <= 19.764005661010742:
+                var38 = [0.0, 1.0, 0.0]
+            else:
+                if input[3] <= 0.5:
+                    if input[4] <= 0.5:
+                        if input[13] <= 0.5:
+                            if input[17] <= 36.16967582702637:
+                                if input[1] <= 0.5:
+                                    if input[18] <= 2.5700000524520874:
+                                        if input[17] <= 28.09898853302002:
+                                            if input[18] <= 0.9449999928474426:
+                                                var38 = [0.0, 0.0, 1.0]
+                                            else:
+                                                if input[6] <= 0.5:
+                                                    var38 = [0.0, 0.0, 1.0]
+                                                else:
+                                                    var38 = [1.0, 0.0, 0.0]
+                                        else:
+                                            var38 = [0.0, 0.0, 1.0]
+                                    else:
+                                        if input[17] <= 23.402153968811035:
+                                            var38 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var38 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[17] <= 31.469772338867188:
+                                        if input[9] <= 0.5:
+                                            var38 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var38 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var38 = [0.0, 0.0, 1.0]
+                            else:
+                                var38 = [1.0, 0.0, 0.0]
+                        else:
+                            var38 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 44.03499984741211:
+                            var38 = [1.0, 0.0, 0.0]
+                        else:
+                            var38 = [0.0, 0.0, 1.0]
+                else:
+                    if input[4] <= 0.5:
+                        if input[17] <= 26.82800006866455:
+                            var38 = [0.0, 1.0, 0.0]
+                        else:
+                            var38 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 2.8249999284744263:
+                            var38 = [1.0, 0.0, 0.0]
+                        else:
+                            var38 = [0.0, 0.0, 1.0]
+        else:
+            var38 = [1.0, 0.0, 0.0]
+    else:
+        if input[17] <= 31.794302940368652:
+            if input[18] <= 9.494693279266357:
+                var38 = [0.0, 0.0, 1.0]
+            else:
+                if input[8] <= 0.5:
+                    if input[7] <= 0.5:
+                        var38 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 22.344231605529785:
+                            var38 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[18] <= 30.53999900817871:
+                                var38 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[17] <= 26.443750381469727:
+                                    var38 = [0.0, 0.0, 1.0]
+                                else:
+                                    var38 = [0.0, 1.0, 0.0]
+                else:
+                    var38 = [0.0, 1.0, 0.0]
+        else:
+            if input[17] <= 33.13436317443848:
+                var38 = [1.0, 0.0, 0.0]
+            else:
+                if input[14] <= 0.5:
+                    var38 = [1.0, 0.0, 0.0]
+                else:
+                    var38 = [0.0, 0.0, 1.0]
+    if input[18] <= 19.119999885559082:
+        if input[0] <= 0.5:
+            if input[16] <= 0.5:
+                if input[15] <= 0.5:
+                    if input[5] <= 0.5:
+                        if input[18] <= 2.694999933242798:
+                            var39 = [0.0, 0.0, 1.0]
+                        else:
+                            var39 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[10] <= 0.5:
+                            var39 = [0.0, 1.0, 0.0]
+                        else:
+                            var39 = [0.0, 0.0, 1.0]
+                else:
+                    if input[5] <= 0.5:
+                        if input[2] <= 0.5:
+                            var39 = [0.0, 0.0, 1.0]
+                        else:
+                            var39 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[3] <= 0.5:
+                            var39 = [0.0, 0.0, 1.0]
+                        else:
+                            var39 = [0.0, 1.0, 0.0]
+            else:
+                if input[18] <= 2.4200000166893005:
+                    var39 = [1.0, 0.0, 0.0]
+                else:
+                    if input[18] <= 9.164999842643738:
+                        var39 = [0.0, 0.0, 1.0]
+                    else:
+                        var39 = [1.0, 0.0, 0.0]
+        else:
+            if input[18] <= 9.494693279266357:
+                var39 = [0.0, 0.0, 1.0]
+            else:
+                var39 = [0.0, 1.0, 0.0]
+    else:
+        if input[6] <= 0.5:
+            if input[5] <= 0.5:
+                if input[13] <= 0.5:
+                    var39 = [1.0, 0.0, 0.0]
+                else:
+                    if input[15] <= 0.5:
+                        if input[14] <= 0.5:
+                            var39 = [1.0, 0.0, 0.0]
+                        else:
+                            var39 = [0.0, 0.0, 1.0]
+                    else:
+                        var39 = [1.0, 0.0, 0.0]
+            else:
+                var39 = [0.0, 1.0, 0.0]
+        else:
+            if input[15] <= 0.5:
+                if input[17] <= 33.595476150512695:
+                    if input[1] <= 0.5:
+                        if input[18] <= 24.604185104370117:
+                            var39 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[14] <= 0.5:
+                                if input[17] <= 24.518181800842285:
+                                    var39 = [0.0, 0.0, 1.0]
+                                else:
+                                    var39 = [0.0, 1.0, 0.0]
+                            else:
+                                var39 = [0.0, 1.0, 0.0]
+                    else:
+                        var39 = [0.0, 0.0, 1.0]
+                else:
+                    var39 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 28.206417083740234:
+                    if input[18] <= 34.06999969482422:
+                        var39 = [0.0, 1.0, 0.0]
+                    else:
+                        var39 = [1.0, 0.0, 0.0]
+                else:
+                    var39 = [0.0, 1.0, 0.0]
+    if input[2] <= 0.5:
+        if input[3] <= 0.5:
+            if input[13] <= 0.5:
+                if input[18] <= 43.17499923706055:
+                    if input[17] <= 32.65893745422363:
+                        if input[15] <= 0.5:
+                            if input[18] <= 22.0991849899292:
+                                var40 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[7] <= 0.5:
+                                    var40 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[5] <= 0.5:
+                                        var40 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var40 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[0] <= 0.5:
+                                if input[18] <= 34.06999969482422:
+                                    var40 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[5] <= 0.5:
+                                        var40 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var40 = [0.0, 1.0, 0.0]
+                            else:
+                                var40 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[4] <= 0.5:
+                            var40 = [0.0, 0.0, 1.0]
+                        else:
+                            var40 = [1.0, 0.0, 0.0]
+                else:
+                    if input[16] <= 0.5:
+                        var40 = [0.0, 0.0, 1.0]
+                    else:
+                        var40 = [0.0, 1.0, 0.0]
+            else:
+                if input[5] <= 0.5:
+                    if input[6] <= 0.5:
+                        if input[14] <= 0.5:
+                            var40 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[0] <= 0.5:
+                                var40 = [1.0, 0.0, 0.0]
+                            else:
+                                var40 = [0.0, 0.0, 1.0]
+                    else:
+                        var40 = [0.0, 1.0, 0.0]
+                else:
+                    var40 = [0.0, 1.0, 0.0]
+        else:
+            if input[17] <= 26.82800006866455:
+                if input[6] <= 0.5:
+                    var40 = [0.0, 1.0, 0.0]
+                else:
+                    var40 = [0.0, 0.0, 1.0]
+            else:
+                var40 = [0.0, 0.0, 1.0]
+    else:
+        if input[5] <= 0.5:
+            if input[17] <= 29.643961906433105:
+                if input[16] <= 0.5:
+                    var40 = [0.0, 0.0, 1.0]
+                else:
+                    var40 = [1.0, 0.0, 0.0]
+            else:
+                var40 = [1.0, 0.0, 0.0]
+        else:
+            var40 = [0.0, 0.0, 1.0]
+    if input[2] <= 0.5:
+        if input[17] <= 31.818840980529785:
+            if input[3] <= 0.5:
+                if input[15] <= 0.5:
+                    if input[18] <= 39.52000045776367:
+                        var41 = [0.0, 1.0, 0.0]
+                    else:
+                        var41 = [1.0, 0.0, 0.0]
+                else:
+                    if input[4] <= 0.5:
+                        if input[10] <= 0.5:
+                            if input[8] <= 0.5:
+                                var41 = [0.0, 1.0, 0.0]
+                            else:
+                                var41 = [0.0, 0.0, 1.0]
+                        else:
+                            var41 = [0.0, 0.0, 1.0]
+                    else:
+                        var41 = [0.0, 1.0, 0.0]
+            else:
+                var41 = [0.0, 0.0, 1.0]
+        else:
+            if input[17] <= 31.948652267456055:
+                var41 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 35.3799991607666:
+                    if input[9] <= 0.5:
+                        if input[10] <= 0.5:
+                            var41 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[14] <= 0.5:
+                                var41 = [0.0, 0.0, 1.0]
+                            else:
+                                var41 = [1.0, 0.0, 0.0]
+                    else:
+                        var41 = [0.0, 1.0, 0.0]
+                else:
+                    var41 = [1.0, 0.0, 0.0]
+    else:
+        if input[4] <= 0.5:
+            if input[15] <= 0.5:
+                if input[14] <= 0.5:
+                    var41 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 29.054829597473145:
+                        var41 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 37.61045742034912:
+                            var41 = [0.0, 0.0, 1.0]
+                        else:
+                            var41 = [1.0, 0.0, 0.0]
+            else:
+                if input[5] <= 0.5:
+                    var41 = [1.0, 0.0, 0.0]
+                else:
+                    var41 = [0.0, 0.0, 1.0]
+        else:
+            var41 = [1.0, 0.0, 0.0]
+    if input[17] <= 31.818840980529785:
+        if input[11] <= 0.5:
+            if input[13] <= 0.5:
+                if input[9] <= 0.5:
+                    if input[17] <= 30.007822036743164:
+                        if input[1] <= 0.5:
+                            if input[6] <= 0.5:
+                                var42 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[17] <= 25.268705368041992:
+                                    var42 = [0.0, 0.0, 1.0]
+                                else:
+                                    var42 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[8] <= 0.5:
+                                if input[18] <= 19.835000038146973:
+                                    var42 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[17] <= 24.913984298706055:
+                                        var42 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var42 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[17] <= 23.3491153717041:
+                                    var42 = [0.0, 1.0, 0.0]
+                                else:
+                                    var42 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[18] <= 25.954999923706055:
+                            var42 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[10] <= 0.5:
+                                var42 = [0.0, 1.0, 0.0]
+                            else:
+                                var42 = [0.0, 0.0, 1.0]
+                else:
+                    var42 = [0.0, 1.0, 0.0]
+            else:
+                var42 = [0.0, 1.0, 0.0]
+        else:
+            if input[17] <= 23.402153968811035:
+                var42 = [0.0, 0.0, 1.0]
+            else:
+                if input[15] <= 0.5:
+                    if input[17] <= 30.578115463256836:
+                        var42 = [1.0, 0.0, 0.0]
+                    else:
+                        var42 = [0.0, 0.0, 1.0]
+                else:
+                    var42 = [1.0, 0.0, 0.0]
+    else:
+        if input[2] <= 0.5:
+            if input[14] <= 0.5:
+                if input[13] <= 0.5:
+                    if input[18] <= 19.551767826080322:
+                        var42 = [0.0, 0.0, 1.0]
+                    else:
+                        var42 = [0.0, 1.0, 0.0]
+                else:
+                    var42 = [1.0, 0.0, 0.0]
+            else:
+                if input[13] <= 0.5:
+                    var42 = [1.0, 0.0, 0.0]
+                else:
+                    if input[18] <= 35.3799991607666:
+                        var42 = [0.0, 0.0, 1.0]
+                    else:
+                        var42 = [1.0, 0.0, 0.0]
+        else:
+            var42 = [1.0, 0.0, 0.0]
+    if input[0] <= 0.5:
+        if input[2] <= 0.5:
+            if input[7] <= 0.5:
+                if input[9] <= 0.5:
+                    if input[10] <= 0.5:
+                        if input[18] <= 29.800000190734863:
+                            if input[18] <= 9.039999842643738:
+                                if input[6] <= 0.5:
+                                    if input[15] <= 0.5:
+                                        if input[18] <= 2.8249999284744263:
+                                            var43 = [1.0, 0.0, 0.0]
+                                        else:
+                                            var43 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var43 = [0.0, 0.0, 1.0]
+                                else:
+                                    var43 = [0.0, 0.0, 1.0]
+                            else:
+                                var43 = [1.0, 0.0, 0.0]
+                        else:
+                            var43 = [0.0, 1.0, 0.0]
+                    else:
+                        var43 = [0.0, 0.0, 1.0]
+                else:
+                    if input[15] <= 0.5:
+                        var43 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 32.12221717834473:
+                            var43 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[18] <= 12.023727416992188:
+                                var43 = [0.0, 1.0, 0.0]
+                            else:
+                                var43 = [0.0, 0.0, 1.0]
+            else:
+                var43 = [1.0, 0.0, 0.0]
+        else:
+            if input[18] <= 1.2950000166893005:
+                var43 = [1.0, 0.0, 0.0]
+            else:
+                if input[17] <= 23.402153968811035:
+                    var43 = [0.0, 0.0, 1.0]
+                else:
+                    if input[4] <= 0.5:
+                        if input[18] <= 2.5700000524520874:
+                            if input[14] <= 0.5:
+                                var43 = [1.0, 0.0, 0.0]
+                            else:
+                                var43 = [0.0, 0.0, 1.0]
+                        else:
+                            var43 = [1.0, 0.0, 0.0]
+                    else:
+                        var43 = [1.0, 0.0, 0.0]
+    else:
+        if input[4] <= 0.5:
+            if input[8] <= 0.5:
+                if input[13] <= 0.5:
+                    if input[6] <= 0.5:
+                        var43 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[16] <= 0.5:
+                            if input[18] <= 31.389999389648438:
+                                var43 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[17] <= 26.443750381469727:
+                                    var43 = [0.0, 0.0, 1.0]
+                                else:
+                                    var43 = [0.0, 1.0, 0.0]
+                        else:
+                            var43 = [0.0, 1.0, 0.0]
+                else:
+                    var43 = [0.0, 1.0, 0.0]
+            else:
+                if input[5] <= 0.5:
+                    if input[17] <= 30.333117485046387:
+                        var43 = [0.0, 1.0, 0.0]
+                    else:
+                        var43 = [0.0, 0.0, 1.0]
+                else:
+                    var43 = [0.0, 0.0, 1.0]
+        else:
+            var43 = [1.0, 0.0, 0.0]
+    if input[9] <= 0.5:
+        if input[11] <= 0.5:
+            if input[2] <= 0.5:
+                if input[5] <= 0.5:
+                    if input[15] <= 0.5:
+                        if input[18] <= 36.20000076293945:
+                            if input[3] <= 0.5:
+                                if input[14] <= 0.5:
+                                    var44 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[4] <= 0.5:
+                                        if input[1] <= 0.5:
+                                            var44 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var44 = [0.0, 0.0, 1.0]
+                                    else:
+                                        if input[18] <= 30.81999969482422:
+                                            var44 = [1.0, 0.0, 0.0]
+                                        else:
+                                            var44 = [0.0, 0.0, 1.0]
+                            else:
+                                var44 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[0] <= 0.5:
+                                if input[13] <= 0.5:
+                                    if input[7] <= 0.5:
+                                        var44 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var44 = [1.0, 0.0, 0.0]
+                                else:
+                                    var44 = [1.0, 0.0, 0.0]
+                            else:
+                                var44 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[3] <= 0.5:
+                            if input[10] <= 0.5:
+                                var44 = [1.0, 0.0, 0.0]
+                            else:
+                                var44 = [0.0, 0.0, 1.0]
+                        else:
+                            var44 = [0.0, 0.0, 1.0]
+                else:
+                    if input[17] <= 20.12319564819336:
+                        if input[10] <= 0.5:
+                            if input[18] <= 10.525000095367432:
+                                var44 = [0.0, 0.0, 1.0]
+                            else:
+                                var44 = [0.0, 1.0, 0.0]
+                        else:
+                            var44 = [0.0, 0.0, 1.0]
+                    else:
+                        var44 = [0.0, 1.0, 0.0]
+            else:
+                var44 = [1.0, 0.0, 0.0]
+        else:
+            if input[5] <= 0.5:
+                if input[18] <= 1.3399999737739563:
+                    var44 = [1.0, 0.0, 0.0]
+                else:
+                    if input[14] <= 0.5:
+                        var44 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[4] <= 0.5:
+                            var44 = [0.0, 0.0, 1.0]
+                        else:
+                            var44 = [1.0, 0.0, 0.0]
+            else:
+                var44 = [0.0, 0.0, 1.0]
+    else:
+        var44 = [0.0, 1.0, 0.0]
+    if input[10] <= 0.5:
+        if input[9] <= 0.5:
+            if input[2] <= 0.5:
+                if input[18] <= 37.35499954223633:
+                    if input[18] <= 34.224998474121094:
+                        if input[17] <= 31.725293159484863:
+                            if input[13] <= 0.5:
+                                if input[5] <= 0.5:
+                                    if input[8] <= 0.5:
+                                        if input[18] <= 29.47499942779541:
+                                            var45 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var45 = [0.0, 0.0, 1.0]
+                                    else:
+                                        if input[17] <= 29.032323837280273:
+                                            var45 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var45 = [0.0, 0.0, 1.0]
+                                else:
+                                    var45 = [0.0, 1.0, 0.0]
+                            else:
+                                var45 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[18] <= 12.765000224113464:
+                                var45 = [0.0, 0.0, 1.0]
+                            else:
+                                var45 = [1.0, 0.0, 0.0]
+                    else:
+                        var45 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 40.60499954223633:
+                        var45 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[18] <= 47.39999961853027:
+                            var45 = [0.0, 1.0, 0.0]
+                        else:
+                            var45 = [1.0, 0.0, 0.0]
+            else:
+                if input[6] <= 0.5:
+                    if input[4] <= 0.5:
+                        var45 = [0.0, 0.0, 1.0]
+                    else:
+                        var45 = [1.0, 0.0, 0.0]
+                else:
+                    if input[14] <= 0.5:
+                        var45 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[18] <= 1.6800000071525574:
+                            var45 = [1.0, 0.0, 0.0]
+                        else:
+                            var45 = [0.0, 0.0, 1.0]
+        else:
+            var45 = [0.0, 1.0, 0.0]
+    else:
+        if input[16] <= 0.5:
+            if input[14] <= 0.5:
+                var45 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 17.263123035430908:
+                    var45 = [0.0, 1.0, 0.0]
+                else:
+                    if input[6] <= 0.5:
+                        if input[4] <= 0.5:
+                            var45 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[17] <= 34.45302391052246:
+                                var45 = [0.0, 0.0, 1.0]
+                            else:
+                                var45 = [1.0, 0.0, 0.0]
+                    else:
+                        var45 = [0.0, 0.0, 1.0]
+        else:
+            var45 = [0.0, 0.0, 1.0]
+    var46 = add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(var0, var1), var2), var3), var4), var5), var6), var7), var8), var9), var10), var11), var12), var13), var14), var15), var16), var17), var18), var19), var20), var21), var22), var23), var24), var25), var26), var27), var28), var29), var30), var31), var32), var33), var34), var35), var36), var37), var38), var39), var40), var41), var42), var43), var44), var45)
+    if input[2] <= 0.5:
+        if input[17] <= 33.036505699157715:
+            if input[14] <= 0.5:
+                if input[17] <= 18.164326667785645:
+                    var47 = [0.0, 0.0, 1.0]
+                else:
+                    if input[0] <= 0.5:
+                        if input[6] <= 0.5:
+                            if input[1] <= 0.5:
+                                var47 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[8] <= 0.5:
+                                    var47 = [0.0, 1.0, 0.0]
+                                else:
+                                    var47 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[1] <= 0.5:
+                                var47 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[16] <= 0.5:
+                                    if input[17] <= 28.206417083740234:
+                                        if input[7] <= 0.5:
+                                            var47 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var47 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var47 = [0.0, 1.0, 0.0]
+                                else:
+                                    var47 = [1.0, 0.0, 0.0]
+                    else:
+                        var47 = [0.0, 1.0, 0.0]
+            else:
+                if input[5] <= 0.5:
+                    if input[7] <= 0.5:
+                        if input[3] <= 0.5:
+                            if input[1] <= 0.5:
+                                if input[17] <= 30.333117485046387:
+                                    var47 = [0.0, 1.0, 0.0]
+                                else:
+                                    var47 = [0.0, 0.0, 1.0]
+                            else:
+                                var47 = [0.0, 0.0, 1.0]
+                        else:
+                            var47 = [0.0, 0.0, 1.0]
+                    else:
+                        var47 = [0.0, 1.0, 0.0]
+                else:
+                    var47 = [0.0, 1.0, 0.0]
+        else:
+            if input[13] <= 0.5:
+                if input[14] <= 0.5:
+                    var47 = [0.0, 0.0, 1.0]
+                else:
+                    var47 = [1.0, 0.0, 0.0]
+            else:
+                if input[14] <= 0.5:
+                    var47 = [1.0, 0.0, 0.0]
+                else:
+                    if input[1] <= 0.5:
+                        var47 = [0.0, 0.0, 1.0]
+                    else:
+                        var47 = [1.0, 0.0, 0.0]
+    else:
+        if input[17] <= 32.04537868499756:
+            if input[18] <= 2.5700000524520874:
+                if input[16] <= 0.5:
+                    var47 = [0.0, 0.0, 1.0]
+                else:
+                    if input[5] <= 0.5:
+                        var47 = [1.0, 0.0, 0.0]
+                    else:
+                        var47 = [0.0, 0.0, 1.0]
+            else:
+                var47 = [1.0, 0.0, 0.0]
+        else:
+            var47 = [1.0, 0.0, 0.0]
+    if input[18] <= 9.441144466400146:
+        if input[1] <= 0.5:
+            if input[17] <= 22.853424072265625:
+                var48 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 23.74814510345459:
+                    var48 = [0.0, 1.0, 0.0]
+                else:
+                    if input[11] <= 0.5:
+                        if input[18] <= 2.8249999284744263:
+                            if input[14] <= 0.5:
+                                var48 = [0.0, 0.0, 1.0]
+                            else:
+                                var48 = [1.0, 0.0, 0.0]
+                        else:
+                            var48 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[4] <= 0.5:
+                            if input[14] <= 0.5:
+                                var48 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[18] <= 2.575000047683716:
+                                    if input[17] <= 29.988983154296875:
+                                        var48 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var48 = [0.0, 0.0, 1.0]
+                                else:
+                                    var48 = [1.0, 0.0, 0.0]
+                        else:
+                            var48 = [1.0, 0.0, 0.0]
+        else:
+            var48 = [0.0, 0.0, 1.0]
+    else:
+        if input[9] <= 0.5:
+            if input[6] <= 0.5:
+                if input[10] <= 0.5:
+                    if input[4] <= 0.5:
+                        if input[0] <= 0.5:
+                            if input[17] <= 21.959997177124023:
+                                var48 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[8] <= 0.5:
+                                    var48 = [0.0, 1.0, 0.0]
+                                else:
+                                    var48 = [0.0, 0.0, 1.0]
+                        else:
+                            var48 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 35.3419246673584:
+                            var48 = [0.0, 0.0, 1.0]
+                        else:
+                            var48 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 17.263123035430908:
+                        var48 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 23.77500057220459:
+                            var48 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[18] <= 39.47500038146973:
+                                var48 = [1.0, 0.0, 0.0]
+                            else:
+                                var48 = [0.0, 0.0, 1.0]
+            else:
+                if input[14] <= 0.5:
+                    if input[13] <= 0.5:
+                        if input[10] <= 0.5:
+                            if input[1] <= 0.5:
+                                var48 = [0.0, 0.0, 1.0]
+                            else:
+                                var48 = [1.0, 0.0, 0.0]
+                        else:
+                            var48 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[15] <= 0.5:
+                            var48 = [1.0, 0.0, 0.0]
+                        else:
+                            var48 = [0.0, 1.0, 0.0]
+                else:
+                    if input[7] <= 0.5:
+                        if input[0] <= 0.5:
+                            var48 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[17] <= 30.333117485046387:
+                                var48 = [0.0, 1.0, 0.0]
+                            else:
+                                var48 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 30.53999900817871:
+                            var48 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 26.443750381469727:
+                                var48 = [0.0, 0.0, 1.0]
+                            else:
+                                var48 = [0.0, 1.0, 0.0]
+        else:
+            if input[14] <= 0.5:
+                if input[17] <= 32.415992736816406:
+                    var48 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 12.023727416992188:
+                        var48 = [0.0, 1.0, 0.0]
+                    else:
+                        var48 = [0.0, 0.0, 1.0]
+            else:
+                var48 = [0.0, 1.0, 0.0]
+    if input[18] <= 1.4599999785423279:
+        if input[5] <= 0.5:
+            var49 = [1.0, 0.0, 0.0]
+        else:
+            if input[15] <= 0.5:
+                var49 = [0.0, 0.0, 1.0]
+            else:
+                var49 = [0.0, 1.0, 0.0]
+    else:
+        if input[7] <= 0.5:
+            if input[10] <= 0.5:
+                if input[9] <= 0.5:
+                    if input[16] <= 0.5:
+                        if input[4] <= 0.5:
+                            if input[18] <= 2.6799999475479126:
+                                var49 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[18] <= 43.31999969482422:
+                                    if input[1] <= 0.5:
+                                        if input[18] <= 9.860000133514404:
+                                            if input[12] <= 0.5:
+                                                if input[17] <= 23.402153968811035:
+                                                    var49 = [0.0, 0.0, 1.0]
+                                                else:
+                                                    var49 = [1.0, 0.0, 0.0]
+                                            else:
+                                                var49 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var49 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var49 = [0.0, 1.0, 0.0]
+                                else:
+                                    var49 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[14] <= 0.5:
+                                if input[3] <= 0.5:
+                                    var49 = [1.0, 0.0, 0.0]
+                                else:
+                                    var49 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[17] <= 33.262149810791016:
+                                    var49 = [1.0, 0.0, 0.0]
+                                else:
+                                    var49 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[5] <= 0.5:
+                            if input[17] <= 40.84758949279785:
+                                var49 = [1.0, 0.0, 0.0]
+                            else:
+                                var49 = [0.0, 0.0, 1.0]
+                        else:
+                            var49 = [0.0, 1.0, 0.0]
+                else:
+                    if input[0] <= 0.5:
+                        var49 = [0.0, 0.0, 1.0]
+                    else:
+                        var49 = [0.0, 1.0, 0.0]
+            else:
+                if input[0] <= 0.5:
+                    var49 = [0.0, 0.0, 1.0]
+                else:
+                    var49 = [0.0, 1.0, 0.0]
+        else:
+            if input[18] <= 36.904998779296875:
+                var49 = [0.0, 1.0, 0.0]
+            else:
+                if input[5] <= 0.5:
+                    var49 = [1.0, 0.0, 0.0]
+                else:
+                    var49 = [0.0, 1.0, 0.0]
+    if input[2] <= 0.5:
+        if input[17] <= 33.27631378173828:
+            if input[1] <= 0.5:
+                if input[3] <= 0.5:
+                    if input[18] <= 9.494693279266357:
+                        var50 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 30.324999809265137:
+                            var50 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[14] <= 0.5:
+                                if input[18] <= 40.29499912261963:
+                                    var50 = [0.0, 0.0, 1.0]
+                                else:
+                                    var50 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[18] <= 32.875:
+                                    var50 = [0.0, 0.0, 1.0]
+                                else:
+                                    var50 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 3.409999966621399:
+                        var50 = [0.0, 1.0, 0.0]
+                    else:
+                        var50 = [0.0, 0.0, 1.0]
+            else:
+                if input[9] <= 0.5:
+                    var50 = [0.0, 0.0, 1.0]
+                else:
+                    if input[18] <= 12.023727416992188:
+                        var50 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 32.28618144989014:
+                            var50 = [0.0, 1.0, 0.0]
+                        else:
+                            var50 = [0.0, 0.0, 1.0]
+        else:
+            if input[17] <= 35.72043991088867:
+                if input[17] <= 33.81854248046875:
+                    var50 = [0.0, 0.0, 1.0]
+                else:
+                    if input[18] <= 42.165000915527344:
+                        var50 = [0.0, 0.0, 1.0]
+                    else:
+                        var50 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 13.454999566078186:
+                    if input[14] <= 0.5:
+                        var50 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 2.8249999284744263:
+                            var50 = [1.0, 0.0, 0.0]
+                        else:
+                            var50 = [0.0, 0.0, 1.0]
+                else:
+                    var50 = [1.0, 0.0, 0.0]
+    else:
+        if input[4] <= 0.5:
+            if input[15] <= 0.5:
+                if input[17] <= 24.30154037475586:
+                    var50 = [0.0, 0.0, 1.0]
+                else:
+                    if input[14] <= 0.5:
+                        var50 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 36.67630386352539:
+                            var50 = [0.0, 0.0, 1.0]
+                        else:
+                            var50 = [1.0, 0.0, 0.0]
+            else:
+                if input[6] <= 0.5:
+                    var50 = [0.0, 0.0, 1.0]
+                else:
+                    var50 = [1.0, 0.0, 0.0]
+        else:
+            var50 = [1.0, 0.0, 0.0]
+    if input[17] <= 31.794302940368652:
+        if input[13] <= 0.5:
+            if input[0] <= 0.5:
+                if input[17] <= 19.21723461151123:
+                    var51 = [0.0, 1.0, 0.0]
+                else:
+                    if input[10] <= 0.5:
+                        if input[9] <= 0.5:
+                            if input[1] <= 0.5:
+                                if input[12] <= 0.5:
+                                    if input[5] <= 0.5:
+                                        if input[16] <= 0.5:
+                                            if input[17] <= 29.054829597473145:
+                                                var51 = [1.0, 0.0, 0.0]
+                                            else:
+                                                var51 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var51 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var51 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[18] <= 2.9149999618530273:
+                                        var51 = [0.0, 0.0, 1.0]
+                                    else:
+                                        if input[5] <= 0.5:
+                                            var51 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var51 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[18] <= 42.364999771118164:
+                                    var51 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[8] <= 0.5:
+                                        var51 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var51 = [0.0, 0.0, 1.0]
+                        else:
+                            var51 = [0.0, 1.0, 0.0]
+                    else:
+                        var51 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 27.33626651763916:
+                    if input[16] <= 0.5:
+                        if input[5] <= 0.5:
+                            if input[9] <= 0.5:
+                                var51 = [0.0, 0.0, 1.0]
+                            else:
+                                var51 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[10] <= 0.5:
+                                if input[18] <= 21.8799991607666:
+                                    var51 = [0.0, 0.0, 1.0]
+                                else:
+                                    var51 = [0.0, 1.0, 0.0]
+                            else:
+                                var51 = [0.0, 1.0, 0.0]
+                    else:
+                        var51 = [0.0, 0.0, 1.0]
+                else:
+                    var51 = [0.0, 1.0, 0.0]
+        else:
+            if input[4] <= 0.5:
+                var51 = [0.0, 1.0, 0.0]
+            else:
+                var51 = [1.0, 0.0, 0.0]
+    else:
+        if input[6] <= 0.5:
+            if input[18] <= 2.5399999618530273:
+                var51 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 12.525000214576721:
+                    var51 = [0.0, 0.0, 1.0]
+                else:
+                    if input[13] <= 0.5:
+                        var51 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 35.3419246673584:
+                            var51 = [0.0, 0.0, 1.0]
+                        else:
+                            var51 = [1.0, 0.0, 0.0]
+        else:
+            if input[11] <= 0.5:
+                var51 = [0.0, 0.0, 1.0]
+            else:
+                var51 = [1.0, 0.0, 0.0]
+    if input[18] <= 9.441144466400146:
+        if input[6] <= 0.5:
+            if input[5] <= 0.5:
+                if input[3] <= 0.5:
+                    var52 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 42.925825119018555:
+                        var52 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[14] <= 0.5:
+                            var52 = [0.0, 0.0, 1.0]
+                        else:
+                            var52 = [1.0, 0.0, 0.0]
+            else:
+                if input[16] <= 0.5:
+                    if input[3] <= 0.5:
+                        var52 = [0.0, 0.0, 1.0]
+                    else:
+                        var52 = [0.0, 1.0, 0.0]
+                else:
+                    var52 = [0.0, 0.0, 1.0]
+        else:
+            if input[17] <= 23.056336402893066:
+                var52 = [0.0, 0.0, 1.0]
+            else:
+                if input[3] <= 0.5:
+                    if input[10] <= 0.5:
+                        var52 = [1.0, 0.0, 0.0]
+                    else:
+                        var52 = [0.0, 0.0, 1.0]
+                else:
+                    var52 = [0.0, 0.0, 1.0]
+    else:
+        if input[0] <= 0.5:
+            if input[17] <= 35.46449279785156:
+                if input[10] <= 0.5:
+                    if input[6] <= 0.5:
+                        if input[17] <= 21.701799392700195:
+                            var52 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[18] <= 46.53499984741211:
+                                var52 = [0.0, 1.0, 0.0]
+                            else:
+                                var52 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 34.06999969482422:
+                            if input[17] <= 29.68824863433838:
+                                var52 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[18] <= 12.023727416992188:
+                                    var52 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[18] <= 21.752583026885986:
+                                        var52 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var52 = [0.0, 1.0, 0.0]
+                        else:
+                            var52 = [1.0, 0.0, 0.0]
+                else:
+                    var52 = [0.0, 0.0, 1.0]
+            else:
+                var52 = [1.0, 0.0, 0.0]
+        else:
+            if input[16] <= 0.5:
+                if input[6] <= 0.5:
+                    if input[9] <= 0.5:
+                        if input[17] <= 26.138742446899414:
+                            var52 = [0.0, 1.0, 0.0]
+                        else:
+                            var52 = [0.0, 0.0, 1.0]
+                    else:
+                        var52 = [0.0, 1.0, 0.0]
+                else:
+                    if input[8] <= 0.5:
+                        if input[14] <= 0.5:
+                            var52 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 26.443750381469727:
+                                var52 = [0.0, 0.0, 1.0]
+                            else:
+                                var52 = [0.0, 1.0, 0.0]
+                    else:
+                        var52 = [0.0, 1.0, 0.0]
+            else:
+                if input[18] <= 40.29499912261963:
+                    var52 = [0.0, 0.0, 1.0]
+                else:
+                    var52 = [1.0, 0.0, 0.0]
+    if input[11] <= 0.5:
+        if input[17] <= 30.721294403076172:
+            if input[4] <= 0.5:
+                if input[16] <= 0.5:
+                    if input[6] <= 0.5:
+                        if input[18] <= 46.53499984741211:
+                            if input[18] <= 10.525000095367432:
+                                if input[8] <= 0.5:
+                                    var53 = [0.0, 1.0, 0.0]
+                                else:
+                                    var53 = [0.0, 0.0, 1.0]
+                            else:
+                                var53 = [0.0, 1.0, 0.0]
+                        else:
+                            var53 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 31.389999389648438:
+                            if input[18] <= 7.2749998569488525:
+                                var53 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[18] <= 25.888320922851562:
+                                    if input[18] <= 17.78000020980835:
+                                        var53 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var53 = [0.0, 0.0, 1.0]
+                                else:
+                                    var53 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[0] <= 0.5:
+                                var53 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[8] <= 0.5:
+                                    if input[18] <= 32.875:
+                                        var53 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var53 = [0.0, 1.0, 0.0]
+                                else:
+                                    var53 = [0.0, 1.0, 0.0]
+                else:
+                    if input[1] <= 0.5:
+                        if input[17] <= 17.740819931030273:
+                            var53 = [0.0, 0.0, 1.0]
+                        else:
+                            var53 = [0.0, 1.0, 0.0]
+                    else:
+                        var53 = [1.0, 0.0, 0.0]
+            else:
+                var53 = [0.0, 0.0, 1.0]
+        else:
+            if input[12] <= 0.5:
+                if input[18] <= 41.314998626708984:
+                    if input[1] <= 0.5:
+                        if input[18] <= 28.369998931884766:
+                            var53 = [1.0, 0.0, 0.0]
+                        else:
+                            var53 = [0.0, 0.0, 1.0]
+                    else:
+                        var53 = [0.0, 1.0, 0.0]
+                else:
+                    var53 = [1.0, 0.0, 0.0]
+            else:
+                var53 = [0.0, 0.0, 1.0]
+    else:
+        if input[15] <= 0.5:
+            if input[16] <= 0.5:
+                if input[6] <= 0.5:
+                    var53 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 32.571603775024414:
+                        if input[18] <= 1.0899999737739563:
+                            var53 = [1.0, 0.0, 0.0]
+                        else:
+                            var53 = [0.0, 0.0, 1.0]
+                    else:
+                        var53 = [1.0, 0.0, 0.0]
+            else:
+                if input[6] <= 0.5:
+                    var53 = [0.0, 0.0, 1.0]
+                else:
+                    var53 = [1.0, 0.0, 0.0]
+        else:
+            if input[5] <= 0.5:
+                var53 = [1.0, 0.0, 0.0]
+            else:
+                var53 = [0.0, 0.0, 1.0]
+    if input[9] <= 0.5:
+        if input[0] <= 0.5:
+            if input[11] <= 0.5:
+                if input[4] <= 0.5:
+                    if input[5] <= 0.5:
+                        if input[8] <= 0.5:
+                            var54 = [0.0, 0.0, 1.0]
+                        else:
+                            var54 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[12] <= 0.5:
+                            if input[8] <= 0.5:
+                                if input[15] <= 0.5:
+                                    if input[10] <= 0.5:
+                                        var54 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var54 = [0.0, 0.0, 1.0]
+                                else:
+                                    var54 = [0.0, 1.0, 0.0]
+                            else:
+                                var54 = [0.0, 0.0, 1.0]
+                        else:
+                            var54 = [0.0, 1.0, 0.0]
+                else:
+                    if input[12] <= 0.5:
+                        var54 = [1.0, 0.0, 0.0]
+                    else:
+                        var54 = [0.0, 0.0, 1.0]
+            else:
+                if input[5] <= 0.5:
+                    if input[4] <= 0.5:
+                        if input[15] <= 0.5:
+                            if input[17] <= 29.054829597473145:
+                                var54 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[18] <= 1.3399999737739563:
+                                    var54 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[18] <= 2.575000047683716:
+                                        var54 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var54 = [1.0, 0.0, 0.0]
+                        else:
+                            var54 = [1.0, 0.0, 0.0]
+                    else:
+                        var54 = [1.0, 0.0, 0.0]
+                else:
+                    var54 = [0.0, 0.0, 1.0]
+        else:
+            if input[4] <= 0.5:
+                if input[17] <= 17.439963340759277:
+                    var54 = [0.0, 0.0, 1.0]
+                else:
+                    if input[8] <= 0.5:
+                        var54 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[16] <= 0.5:
+                            if input[14] <= 0.5:
+                                var54 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[17] <= 29.032323837280273:
+                                    var54 = [0.0, 1.0, 0.0]
+                                else:
+                                    var54 = [0.0, 0.0, 1.0]
+                        else:
+                            var54 = [0.0, 1.0, 0.0]
+            else:
+                var54 = [1.0, 0.0, 0.0]
+    else:
+        if input[1] <= 0.5:
+            var54 = [0.0, 1.0, 0.0]
+        else:
+            if input[5] <= 0.5:
+                if input[17] <= 32.28618144989014:
+                    var54 = [0.0, 1.0, 0.0]
+                else:
+                    if input[17] <= 33.033369064331055:
+                        var54 = [0.0, 0.0, 1.0]
+                    else:
+                        var54 = [0.0, 1.0, 0.0]
+            else:
+                var54 = [0.0, 1.0, 0.0]
+    if input[17] <= 23.216435432434082:
+        if input[17] <= 21.44240665435791:
+            if input[7] <= 0.5:
+                if input[12] <= 0.5:
+                    if input[8] <= 0.5:
+                        var55 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 18.164326667785645:
+                            var55 = [0.0, 0.0, 1.0]
+                        else:
+                            var55 = [0.0, 1.0, 0.0]
+                else:
+                    var55 = [0.0, 1.0, 0.0]
+            else:
+                if input[6] <= 0.5:
+                    var55 = [0.0, 1.0, 0.0]
+                else:
+                    var55 = [0.0, 0.0, 1.0]
+        else:
+            if input[18] <= 1.3700000047683716:
+                var55 = [0.0, 1.0, 0.0]
+            else:
+                var55 = [0.0, 0.0, 1.0]
+    else:
+        if input[10] <= 0.5:
+            if input[12] <= 0.5:
+                if input[17] <= 35.118858337402344:
+                    if input[9] <= 0.5:
+                        if input[0] <= 0.5:
+                            if input[5] <= 0.5:
+                                if input[14] <= 0.5:
+                                    var55 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[4] <= 0.5:
+                                        if input[18] <= 1.0899999737739563:
+                                            var55 = [1.0, 0.0, 0.0]
+                                        else:
+                                            var55 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var55 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[7] <= 0.5:
+                                    var55 = [0.0, 0.0, 1.0]
+                                else:
+                                    var55 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[6] <= 0.5:
+                                if input[18] <= 41.314998626708984:
+                                    var55 = [0.0, 0.0, 1.0]
+                                else:
+                                    var55 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[18] <= 17.78000020980835:
+                                    var55 = [0.0, 1.0, 0.0]
+                                else:
+                                    var55 = [0.0, 0.0, 1.0]
+                    else:
+                        var55 = [0.0, 1.0, 0.0]
+                else:
+                    var55 = [1.0, 0.0, 0.0]
+            else:
+                if input[16] <= 0.5:
+                    if input[4] <= 0.5:
+                        var55 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[14] <= 0.5:
+                            var55 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[17] <= 42.925825119018555:
+                                var55 = [0.0, 0.0, 1.0]
+                            else:
+                                var55 = [1.0, 0.0, 0.0]
+                else:
+                    var55 = [0.0, 0.0, 1.0]
+        else:
+            var55 = [0.0, 0.0, 1.0]
+    if input[18] <= 9.860000133514404:
+        if input[18] <= 1.4100000262260437:
+            if input[15] <= 0.5:
+                if input[6] <= 0.5:
+                    var56 = [0.0, 0.0, 1.0]
+                else:
+                    var56 = [1.0, 0.0, 0.0]
+            else:
+                if input[11] <= 0.5:
+                    var56 = [0.0, 1.0, 0.0]
+                else:
+                    var56 = [1.0, 0.0, 0.0]
+        else:
+            if input[14] <= 0.5:
+                if input[2] <= 0.5:
+                    if input[15] <= 0.5:
+                        var56 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[8] <= 0.5:
+                            if input[17] <= 35.40589904785156:
+                                var56 = [0.0, 1.0, 0.0]
+                            else:
+                                var56 = [0.0, 0.0, 1.0]
+                        else:
+                            var56 = [0.0, 0.0, 1.0]
+                else:
+                    if input[16] <= 0.5:
+                        if input[6] <= 0.5:
+                            var56 = [0.0, 0.0, 1.0]
+                        else:
+                            var56 = [1.0, 0.0, 0.0]
+                    else:
+                        var56 = [1.0, 0.0, 0.0]
+            else:
+                if input[6] <= 0.5:
+                    if input[17] <= 42.925825119018555:
+                        var56 = [0.0, 0.0, 1.0]
+                    else:
+                        var56 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 40.20197582244873:
+                        var56 = [0.0, 0.0, 1.0]
+                    else:
+                        var56 = [1.0, 0.0, 0.0]
+    else:
+        if input[5] <= 0.5:
+            if input[9] <= 0.5:
+                if input[4] <= 0.5:
+                    if input[15] <= 0.5:
+                        if input[0] <= 0.5:
+                            if input[16] <= 0.5:
+                                var56 = [0.0, 0.0, 1.0]
+                            else:
+                                var56 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[16] <= 0.5:
+                                if input[18] <= 25.954999923706055:
+                                    if input[18] <= 17.78000020980835:
+                                        var56 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var56 = [0.0, 0.0, 1.0]
+                                else:
+                                    var56 = [0.0, 1.0, 0.0]
+                            else:
+                                var56 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[1] <= 0.5:
+                            var56 = [0.0, 1.0, 0.0]
+                        else:
+                            var56 = [1.0, 0.0, 0.0]
+                else:
+                    if input[16] <= 0.5:
+                        if input[13] <= 0.5:
+                            if input[18] <= 39.47500038146973:
+                                var56 = [1.0, 0.0, 0.0]
+                            else:
+                                var56 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[0] <= 0.5:
+                                var56 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[17] <= 35.3419246673584:
+                                    var56 = [0.0, 0.0, 1.0]
+                                else:
+                                    var56 = [1.0, 0.0, 0.0]
+                    else:
+                        var56 = [1.0, 0.0, 0.0]
+            else:
+                if input[1] <= 0.5:
+                    var56 = [0.0, 1.0, 0.0]
+                else:
+                    if input[17] <= 32.28618144989014:
+                        var56 = [0.0, 1.0, 0.0]
+                    else:
+                        var56 = [0.0, 0.0, 1.0]
+        else:
+            if input[10] <= 0.5:
+                if input[17] <= 22.123496055603027:
+                    var56 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 46.53499984741211:
+                        var56 = [0.0, 1.0, 0.0]
+                    else:
+                        var56 = [0.0, 0.0, 1.0]
+            else:
+                var56 = [0.0, 1.0, 0.0]
+    if input[10] <= 0.5:
+        if input[2] <= 0.5:
+            if input[18] <= 9.494693279266357:
+                if input[12] <= 0.5:
+                    var57 = [0.0, 0.0, 1.0]
+                else:
+                    if input[14] <= 0.5:
+                        if input[5] <= 0.5:
+                            var57 = [0.0, 0.0, 1.0]
+                        else:
+                            var57 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 19.421363830566406:
+                            var57 = [0.0, 1.0, 0.0]
+                        else:
+                            var57 = [0.0, 0.0, 1.0]
+            else:
+                if input[4] <= 0.5:
+                    if input[16] <= 0.5:
+                        if input[17] <= 32.28618144989014:
+                            if input[13] <= 0.5:
+                                if input[0] <= 0.5:
+                                    if input[17] <= 23.842538833618164:
+                                        var57 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var57 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[18] <= 25.954999923706055:
+                                        if input[5] <= 0.5:
+                                            var57 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var57 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var57 = [0.0, 1.0, 0.0]
+                            else:
+                                var57 = [0.0, 1.0, 0.0]
+                        else:
+                            var57 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[6] <= 0.5:
+                            var57 = [0.0, 1.0, 0.0]
+                        else:
+                            var57 = [1.0, 0.0, 0.0]
+                else:
+                    if input[9] <= 0.5:
+                        if input[14] <= 0.5:
+                            var57 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[17] <= 36.032827377319336:
+                                if input[18] <= 27.4399995803833:
+                                    var57 = [1.0, 0.0, 0.0]
+                                else:
+                                    var57 = [0.0, 0.0, 1.0]
+                            else:
+                                var57 = [1.0, 0.0, 0.0]
+                    else:
+                        var57 = [0.0, 1.0, 0.0]
+        else:
+            if input[16] <= 0.5:
+                if input[17] <= 23.765165328979492:
+                    var57 = [0.0, 0.0, 1.0]
+                else:
+                    if input[18] <= 1.3449999690055847:
+                        var57 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 31.256547927856445:
+                            if input[17] <= 26.802518844604492:
+                                var57 = [1.0, 0.0, 0.0]
+                            else:
+                                var57 = [0.0, 0.0, 1.0]
+                        else:
+                            var57 = [1.0, 0.0, 0.0]
+            else:
+                var57 = [1.0, 0.0, 0.0]
+    else:
+        var57 = [0.0, 0.0, 1.0]
+    if input[5] <= 0.5:
+        if input[17] <= 35.32961463928223:
+            if input[18] <= 30.494998931884766:
+                if input[9] <= 0.5:
+                    if input[6] <= 0.5:
+                        var58 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[16] <= 0.5:
+                            if input[17] <= 30.84907341003418:
+                                if input[0] <= 0.5:
+                                    if input[17] <= 29.054829597473145:
+                                        var58 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var58 = [0.0, 0.0, 1.0]
+                                else:
+                                    var58 = [0.0, 1.0, 0.0]
+                            else:
+                                var58 = [0.0, 0.0, 1.0]
+                        else:
+                            var58 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 32.261643409729004:
+                        var58 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 12.023727416992188:
+                            var58 = [0.0, 1.0, 0.0]
+                        else:
+                            var58 = [0.0, 0.0, 1.0]
+            else:
+                if input[7] <= 0.5:
+                    var58 = [0.0, 0.0, 1.0]
+                else:
+                    if input[17] <= 27.453327178955078:
+                        if input[1] <= 0.5:
+                            var58 = [0.0, 0.0, 1.0]
+                        else:
+                            var58 = [1.0, 0.0, 0.0]
+                    else:
+                        var58 = [0.0, 1.0, 0.0]
+        else:
+            if input[18] <= 3.0199999809265137:
+                if input[11] <= 0.5:
+                    if input[4] <= 0.5:
+                        var58 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 2.8249999284744263:
+                            var58 = [1.0, 0.0, 0.0]
+                        else:
+                            var58 = [0.0, 0.0, 1.0]
+                else:
+                    var58 = [1.0, 0.0, 0.0]
+            else:
+                var58 = [1.0, 0.0, 0.0]
+    else:
+        if input[18] <= 2.1100000143051147:
+            if input[18] <= 1.3700000047683716:
+                if input[16] <= 0.5:
+                    var58 = [0.0, 1.0, 0.0]
+                else:
+                    var58 = [0.0, 0.0, 1.0]
+            else:
+                var58 = [0.0, 0.0, 1.0]
+        else:
+            if input[14] <= 0.5:
+                if input[17] <= 19.472938537597656:
+                    var58 = [0.0, 0.0, 1.0]
+                else:
+                    if input[12] <= 0.5:
+                        if input[8] <= 0.5:
+                            var58 = [0.0, 1.0, 0.0]
+                        else:
+                            var58 = [0.0, 0.0, 1.0]
+                    else:
+                        var58 = [0.0, 1.0, 0.0]
+            else:
+                if input[1] <= 0.5:
+                    var58 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 21.765000343322754:
+                        var58 = [0.0, 0.0, 1.0]
+                    else:
+                        var58 = [0.0, 1.0, 0.0]
+    if input[0] <= 0.5:
+        if input[5] <= 0.5:
+            if input[9] <= 0.5:
+                if input[2] <= 0.5:
+                    if input[12] <= 0.5:
+                        if input[16] <= 0.5:
+                            if input[6] <= 0.5:
+                                var59 = [1.0, 0.0, 0.0]
+                            else:
+                                var59 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[10] <= 0.5:
+                                var59 = [1.0, 0.0, 0.0]
+                            else:
+                                var59 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[4] <= 0.5:
+                            var59 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[17] <= 42.925825119018555:
+                                var59 = [0.0, 0.0, 1.0]
+                            else:
+                                var59 = [1.0, 0.0, 0.0]
+                else:
+                    if input[15] <= 0.5:
+                        if input[18] <= 1.4599999785423279:
+                            var59 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[11] <= 0.5:
+                                var59 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[17] <= 31.649048805236816:
+                                    var59 = [0.0, 0.0, 1.0]
+                                else:
+                                    var59 = [1.0, 0.0, 0.0]
+                    else:
+                        var59 = [1.0, 0.0, 0.0]
+            else:
+                if input[17] <= 32.28618144989014:
+                    var59 = [0.0, 1.0, 0.0]
+                else:
+                    if input[17] <= 33.033369064331055:
+                        var59 = [0.0, 0.0, 1.0]
+                    else:
+                        var59 = [0.0, 1.0, 0.0]
+        else:
+            if input[15] <= 0.5:
+                if input[11] <= 0.5:
+                    var59 = [0.0, 1.0, 0.0]
+                else:
+                    var59 = [0.0, 0.0, 1.0]
+            else:
+                var59 = [0.0, 1.0, 0.0]
+    else:
+        if input[15] <= 0.5:
+            if input[5] <= 0.5:
+                if input[18] <= 25.954999923706055:
+                    if input[18] <= 17.78000020980835:
+                        var59 = [0.0, 1.0, 0.0]
+                    else:
+                        var59 = [0.0, 0.0, 1.0]
+                else:
+                    if input[18] <= 31.8100004196167:
+                        if input[16] <= 0.5:
+                            var59 = [0.0, 1.0, 0.0]
+                        else:
+                            var59 = [0.0, 0.0, 1.0]
+                    else:
+                        var59 = [0.0, 1.0, 0.0]
+            else:
+                var59 = [0.0, 1.0, 0.0]
+        else:
+            if input[17] <= 34.001864433288574:
+                var59 = [0.0, 1.0, 0.0]
+            else:
+                var59 = [1.0, 0.0, 0.0]
+    if input[4] <= 0.5:
+        if input[17] <= 30.84907341003418:
+            if input[2] <= 0.5:
+                if input[9] <= 0.5:
+                    if input[18] <= 10.019999980926514:
+                        if input[8] <= 0.5:
+                            if input[15] <= 0.5:
+                                var60 = [0.0, 0.0, 1.0]
+                            else:
+                                var60 = [0.0, 1.0, 0.0]
+                        else:
+                            var60 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[1] <= 0.5:
+                            var60 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[6] <= 0.5:
+                                if input[8] <= 0.5:
+                                    if input[18] <= 19.835000038146973:
+                                        var60 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var60 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[18] <= 47.43000030517578:
+                                        var60 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var60 = [0.0, 0.0, 1.0]
+                            else:
+                                var60 = [1.0, 0.0, 0.0]
+                else:
+                    var60 = [0.0, 1.0, 0.0]
+            else:
+                if input[5] <= 0.5:
+                    if input[17] <= 28.344416618347168:
+                        var60 = [1.0, 0.0, 0.0]
+                    else:
+                        var60 = [0.0, 0.0, 1.0]
+                else:
+                    var60 = [0.0, 0.0, 1.0]
+        else:
+            if input[11] <= 0.5:
+                if input[1] <= 0.5:
+                    var60 = [0.0, 0.0, 1.0]
+                else:
+                    if input[13] <= 0.5:
+                        if input[10] <= 0.5:
+                            if input[18] <= 12.023727416992188:
+                                var60 = [0.0, 1.0, 0.0]
+                            else:
+                                var60 = [0.0, 0.0, 1.0]
+                        else:
+                            var60 = [0.0, 0.0, 1.0]
+                    else:
+                        var60 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 1.6800000071525574:
+                    var60 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 33.337998390197754:
+                        var60 = [0.0, 0.0, 1.0]
+                    else:
+                        var60 = [1.0, 0.0, 0.0]
+    else:
+        if input[10] <= 0.5:
+            if input[1] <= 0.5:
+                if input[12] <= 0.5:
+                    var60 = [1.0, 0.0, 0.0]
+                else:
+                    if input[14] <= 0.5:
+                        var60 = [0.0, 0.0, 1.0]
+                    else:
+                        var60 = [1.0, 0.0, 0.0]
+            else:
+                var60 = [1.0, 0.0, 0.0]
+        else:
+            var60 = [0.0, 0.0, 1.0]
+    if input[2] <= 0.5:
+        if input[17] <= 33.19085502624512:
+            if input[0] <= 0.5:
+                if input[5] <= 0.5:
+                    if input[14] <= 0.5:
+                        if input[1] <= 0.5:
+                            var61 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[18] <= 44.06999969482422:
+                                var61 = [1.0, 0.0, 0.0]
+                            else:
+                                var61 = [0.0, 0.0, 1.0]
+                    else:
+                        var61 = [0.0, 0.0, 1.0]
+                else:
+                    if input[17] <= 23.94173812866211:
+                        if input[16] <= 0.5:
+                            if input[18] <= 10.680000185966492:
+                                var61 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[18] <= 35.53499984741211:
+                                    if input[10] <= 0.5:
+                                        var61 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var61 = [0.0, 0.0, 1.0]
+                                else:
+                                    var61 = [0.0, 0.0, 1.0]
+                        else:
+                            var61 = [0.0, 1.0, 0.0]
+                    else:
+                        var61 = [0.0, 1.0, 0.0]
+            else:
+                if input[6] <= 0.5:
+                    if input[16] <= 0.5:
+                        var61 = [0.0, 1.0, 0.0]
+                    else:
+                        var61 = [1.0, 0.0, 0.0]
+                else:
+                    if input[7] <= 0.5:
+                        var61 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 26.443750381469727:
+                            var61 = [0.0, 0.0, 1.0]
+                        else:
+                            var61 = [0.0, 1.0, 0.0]
+        else:
+            if input[17] <= 40.764705657958984:
+                if input[18] <= 30.81999969482422:
+                    var61 = [1.0, 0.0, 0.0]
+                else:
+                    if input[4] <= 0.5:
+                        var61 = [1.0, 0.0, 0.0]
+                    else:
+                        var61 = [0.0, 0.0, 1.0]
+            else:
+                var61 = [0.0, 0.0, 1.0]
+    else:
+        if input[16] <= 0.5:
+            if input[15] <= 0.5:
+                if input[17] <= 31.649048805236816:
+                    if input[17] <= 29.054829597473145:
+                        var61 = [1.0, 0.0, 0.0]
+                    else:
+                        var61 = [0.0, 0.0, 1.0]
+                else:
+                    var61 = [1.0, 0.0, 0.0]
+            else:
+                if input[6] <= 0.5:
+                    var61 = [0.0, 0.0, 1.0]
+                else:
+                    var61 = [1.0, 0.0, 0.0]
+        else:
+            if input[18] <= 0.9449999928474426:
+                var61 = [0.0, 0.0, 1.0]
+            else:
+                var61 = [1.0, 0.0, 0.0]
+    if input[2] <= 0.5:
+        if input[3] <= 0.5:
+            if input[17] <= 17.86347007751465:
+                var62 = [0.0, 0.0, 1.0]
+            else:
+                if input[10] <= 0.5:
+                    if input[5] <= 0.5:
+                        if input[9] <= 0.5:
+                            if input[6] <= 0.5:
+                                if input[17] <= 33.13436317443848:
+                                    var62 = [1.0, 0.0, 0.0]
+                                else:
+                                    var62 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[0] <= 0.5:
+                                    var62 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[17] <= 30.333117485046387:
+                                        var62 = [0.0, 1.0, 0.0]
+                                    else:
+                                        if input[8] <= 0.5:
+                                            var62 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var62 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[0] <= 0.5:
+                                if input[17] <= 32.28618144989014:
+                                    var62 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[18] <= 12.023727416992188:
+                                        var62 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var62 = [0.0, 0.0, 1.0]
+                            else:
+                                var62 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 47.53499984741211:
+                            var62 = [0.0, 1.0, 0.0]
+                        else:
+                            var62 = [0.0, 0.0, 1.0]
+                else:
+                    var62 = [0.0, 0.0, 1.0]
+        else:
+            var62 = [0.0, 0.0, 1.0]
+    else:
+        if input[6] <= 0.5:
+            if input[5] <= 0.5:
+                var62 = [1.0, 0.0, 0.0]
+            else:
+                var62 = [0.0, 0.0, 1.0]
+        else:
+            if input[18] <= 1.4599999785423279:
+                var62 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 2.575000047683716:
+                    var62 = [0.0, 0.0, 1.0]
+                else:
+                    var62 = [1.0, 0.0, 0.0]
+    if input[11] <= 0.5:
+        if input[18] <= 9.441144466400146:
+            if input[17] <= 29.281261444091797:
+                if input[8] <= 0.5:
+                    var63 = [0.0, 1.0, 0.0]
+                else:
+                    var63 = [0.0, 0.0, 1.0]
+            else:
+                if input[6] <= 0.5:
+                    if input[14] <= 0.5:
+                        var63 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 2.8249999284744263:
+                            var63 = [1.0, 0.0, 0.0]
+                        else:
+                            var63 = [0.0, 0.0, 1.0]
+                else:
+                    var63 = [0.0, 0.0, 1.0]
+        else:
+            if input[10] <= 0.5:
+                if input[18] <= 47.39999961853027:
+                    if input[9] <= 0.5:
+                        if input[17] <= 27.76011371612549:
+                            if input[17] <= 17.439963340759277:
+                                var63 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[18] <= 37.760000228881836:
+                                    var63 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[7] <= 0.5:
+                                        var63 = [0.0, 1.0, 0.0]
+                                    else:
+                                        if input[17] <= 24.913984298706055:
+                                            var63 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var63 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[17] <= 29.0609073638916:
+                                var63 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[6] <= 0.5:
+                                    if input[8] <= 0.5:
+                                        if input[18] <= 28.369998931884766:
+                                            var63 = [1.0, 0.0, 0.0]
+                                        else:
+                                            var63 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var63 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[15] <= 0.5:
+                                        if input[17] <= 30.333117485046387:
+                                            var63 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var63 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var63 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 32.415992736816406:
+                            var63 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[18] <= 12.023727416992188:
+                                var63 = [0.0, 1.0, 0.0]
+                            else:
+                                var63 = [0.0, 0.0, 1.0]
+                else:
+                    var63 = [1.0, 0.0, 0.0]
+            else:
+                if input[1] <= 0.5:
+                    var63 = [0.0, 1.0, 0.0]
+                else:
+                    if input[14] <= 0.5:
+                        var63 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[17] <= 36.993812561035156:
+                            var63 = [0.0, 0.0, 1.0]
+                        else:
+                            var63 = [1.0, 0.0, 0.0]
+    else:
+        if input[16] <= 0.5:
+            if input[17] <= 32.04537868499756:
+                var63 = [0.0, 0.0, 1.0]
+            else:
+                var63 = [1.0, 0.0, 0.0]
+        else:
+            var63 = [1.0, 0.0, 0.0]
+    if input[18] <= 9.441144466400146:
+        if input[3] <= 0.5:
+            if input[17] <= 23.402153968811035:
+                var64 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 6.140000104904175:
+                    if input[16] <= 0.5:
+                        if input[14] <= 0.5:
+                            var64 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[18] <= 1.3449999690055847:
+                                var64 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[6] <= 0.5:
+                                    var64 = [1.0, 0.0, 0.0]
+                                else:
+                                    var64 = [0.0, 0.0, 1.0]
+                    else:
+                        var64 = [1.0, 0.0, 0.0]
+                else:
+                    var64 = [0.0, 0.0, 1.0]
+        else:
+            if input[4] <= 0.5:
+                if input[14] <= 0.5:
+                    if input[5] <= 0.5:
+                        var64 = [0.0, 0.0, 1.0]
+                    else:
+                        var64 = [0.0, 1.0, 0.0]
+                else:
+                    var64 = [0.0, 1.0, 0.0]
+            else:
+                if input[17] <= 42.925825119018555:
+                    var64 = [0.0, 0.0, 1.0]
+                else:
+                    var64 = [1.0, 0.0, 0.0]
+    else:
+        if input[4] <= 0.5:
+            if input[16] <= 0.5:
+                if input[10] <= 0.5:
+                    if input[9] <= 0.5:
+                        if input[5] <= 0.5:
+                            if input[15] <= 0.5:
+                                if input[18] <= 32.875:
+                                    if input[17] <= 29.032323837280273:
+                                        if input[7] <= 0.5:
+                                            var64 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var64 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var64 = [0.0, 0.0, 1.0]
+                                else:
+                                    var64 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[1] <= 0.5:
+                                    var64 = [0.0, 1.0, 0.0]
+                                else:
+                                    var64 = [1.0, 0.0, 0.0]
+                        else:
+                            var64 = [0.0, 1.0, 0.0]
+                    else:
+                        var64 = [0.0, 1.0, 0.0]
+                else:
+                    var64 = [0.0, 0.0, 1.0]
+            else:
+                if input[5] <= 0.5:
+                    if input[0] <= 0.5:
+                        var64 = [1.0, 0.0, 0.0]
+                    else:
+                        var64 = [0.0, 0.0, 1.0]
+                else:
+                    var64 = [0.0, 1.0, 0.0]
+        else:
+            var64 = [1.0, 0.0, 0.0]
+    if input[11] <= 0.5:
+        if input[12] <= 0.5:
+            if input[0] <= 0.5:
+                if input[17] <= 33.808231353759766:
+                    if input[16] <= 0.5:
+                        if input[17] <= 23.842538833618164:
+                            var65 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[17] <= 33.033369064331055:
+                                if input[18] <= 19.217583179473877:
+                                    var65 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[6] <= 0.5:
+                                        if input[7] <= 0.5:
+                                            if input[5] <= 0.5:
+                                                var65 = [0.0, 0.0, 1.0]
+                                            else:
+                                                var65 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var65 = [0.0, 1.0, 0.0]
+                                    else:
+                                        if input[17] <= 28.370381355285645:
+                                            var65 = [1.0, 0.0, 0.0]
+                                        else:
+                                            var65 = [0.0, 1.0, 0.0]
+                            else:
+                                var65 = [0.0, 1.0, 0.0]
+                    else:
+                        var65 = [0.0, 1.0, 0.0]
+                else:
+                    var65 = [1.0, 0.0, 0.0]
+            else:
+                if input[5] <= 0.5:
+                    if input[4] <= 0.5:
+                        if input[15] <= 0.5:
+                            if input[14] <= 0.5:
+                                if input[7] <= 0.5:
+                                    var65 = [0.0, 1.0, 0.0]
+                                else:
+                                    var65 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[8] <= 0.5:
+                                    if input[17] <= 20.63496208190918:
+                                        var65 = [0.0, 1.0, 0.0]
+                                    else:
+                                        if input[17] <= 26.73582935333252:
+                                            var65 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var65 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[18] <= 28.94499969482422:
+                                        if input[18] <= 17.78000020980835:
+                                            var65 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var65 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var65 = [0.0, 1.0, 0.0]
+                        else:
+                            var65 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[9] <= 0.5:
+                            if input[18] <= 28.369998931884766:
+                                var65 = [1.0, 0.0, 0.0]
+                            else:
+                                var65 = [0.0, 0.0, 1.0]
+                        else:
+                            var65 = [0.0, 1.0, 0.0]
+                else:
+                    var65 = [0.0, 1.0, 0.0]
+        else:
+            if input[16] <= 0.5:
+                if input[5] <= 0.5:
+                    var65 = [0.0, 0.0, 1.0]
+                else:
+                    var65 = [0.0, 1.0, 0.0]
+            else:
+                var65 = [0.0, 0.0, 1.0]
+    else:
+        if input[5] <= 0.5:
+            if input[17] <= 31.649048805236816:
+                if input[14] <= 0.5:
+                    var65 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 29.988983154296875:
+                        var65 = [1.0, 0.0, 0.0]
+                    else:
+                        var65 = [0.0, 0.0, 1.0]
+            else:
+                var65 = [1.0, 0.0, 0.0]
+        else:
+            var65 = [0.0, 0.0, 1.0]
+    if input[7] <= 0.5:
+        if input[18] <= 1.2049999833106995:
+            var66 = [1.0, 0.0, 0.0]
+        else:
+            if input[0] <= 0.5:
+                if input[18] <= 40.67499923706055:
+                    if input[1] <= 0.5:
+                        if input[3] <= 0.5:
+                            if input[5] <= 0.5:
+                                if input[16] <= 0.5:
+                                    if input[6] <= 0.5:
+                                        var66 = [1.0, 0.0, 0.0]
+                                    else:
+                                        if input[14] <= 0.5:
+                                            var66 = [1.0, 0.0, 0.0]
+                                        else:
+                                            if input[18] <= 2.575000047683716:
+                                                var66 = [0.0, 0.0, 1.0]
+                                            else:
+                                                var66 = [1.0, 0.0, 0.0]
+                                else:
+                                    var66 = [1.0, 0.0, 0.0]
+                            else:
+                                var66 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[15] <= 0.5:
+                                if input[18] <= 2.8249999284744263:
+                                    var66 = [1.0, 0.0, 0.0]
+                                else:
+                                    var66 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[17] <= 33.98869323730469:
+                                    var66 = [0.0, 1.0, 0.0]
+                                else:
+                                    var66 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[9] <= 0.5:
+                            if input[10] <= 0.5:
+                                if input[13] <= 0.5:
+                                    var66 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[18] <= 31.5:
+                                        var66 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var66 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[4] <= 0.5:
+                                    var66 = [0.0, 0.0, 1.0]
+                                else:
+                                    var66 = [1.0, 0.0, 0.0]
+                        else:
+                            var66 = [0.0, 1.0, 0.0]
+                else:
+                    if input[15] <= 0.5:
+                        if input[17] <= 26.03660011291504:
+                            var66 = [0.0, 1.0, 0.0]
+                        else:
+                            var66 = [0.0, 0.0, 1.0]
+                    else:
+                        var66 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 43.65999984741211:
+                    if input[9] <= 0.5:
+                        if input[13] <= 0.5:
+                            if input[5] <= 0.5:
+                                var66 = [0.0, 0.0, 1.0]
+                            else:
+                                var66 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 33.932854652404785:
+                                var66 = [0.0, 1.0, 0.0]
+                            else:
+                                var66 = [1.0, 0.0, 0.0]
+                    else:
+                        var66 = [0.0, 1.0, 0.0]
+                else:
+                    var66 = [1.0, 0.0, 0.0]
+    else:
+        if input[17] <= 21.472963333129883:
+            var66 = [0.0, 1.0, 0.0]
+        else:
+            if input[18] <= 35.55500030517578:
+                if input[17] <= 26.443750381469727:
+                    var66 = [0.0, 0.0, 1.0]
+                else:
+                    var66 = [0.0, 1.0, 0.0]
+            else:
+                var66 = [1.0, 0.0, 0.0]
+    if input[2] <= 0.5:
+        if input[9] <= 0.5:
+            if input[5] <= 0.5:
+                if input[18] <= 9.985000133514404:
+                    if input[17] <= 38.36206245422363:
+                        var67 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[4] <= 0.5:
+                            var67 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[15] <= 0.5:
+                                var67 = [1.0, 0.0, 0.0]
+                            else:
+                                var67 = [0.0, 0.0, 1.0]
+                else:
+                    if input[13] <= 0.5:
+                        if input[10] <= 0.5:
+                            if input[1] <= 0.5:
+                                if input[8] <= 0.5:
+                                    if input[18] <= 32.875:
+                                        var67 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var67 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[4] <= 0.5:
+                                        var67 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var67 = [1.0, 0.0, 0.0]
+                            else:
+                                var67 = [1.0, 0.0, 0.0]
+                        else:
+                            var67 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[4] <= 0.5:
+                            if input[0] <= 0.5:
+                                var67 = [1.0, 0.0, 0.0]
+                            else:
+                                var67 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[16] <= 0.5:
+                                if input[17] <= 35.3419246673584:
+                                    var67 = [0.0, 0.0, 1.0]
+                                else:
+                                    var67 = [1.0, 0.0, 0.0]
+                            else:
+                                var67 = [1.0, 0.0, 0.0]
+            else:
+                if input[14] <= 0.5:
+                    var67 = [0.0, 1.0, 0.0]
+                else:
+                    if input[1] <= 0.5:
+                        var67 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[13] <= 0.5:
+                            var67 = [0.0, 0.0, 1.0]
+                        else:
+                            var67 = [0.0, 1.0, 0.0]
+        else:
+            if input[1] <= 0.5:
+                var67 = [0.0, 1.0, 0.0]
+            else:
+                if input[17] <= 32.28618144989014:
+                    var67 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 12.023727416992188:
+                        var67 = [0.0, 1.0, 0.0]
+                    else:
+                        var67 = [0.0, 0.0, 1.0]
+    else:
+        if input[5] <= 0.5:
+            if input[11] <= 0.5:
+                var67 = [1.0, 0.0, 0.0]
+            else:
+                if input[17] <= 33.337998390197754:
+                    if input[18] <= 1.4599999785423279:
+                        var67 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[16] <= 0.5:
+                            var67 = [0.0, 0.0, 1.0]
+                        else:
+                            var67 = [1.0, 0.0, 0.0]
+                else:
+                    var67 = [1.0, 0.0, 0.0]
+        else:
+            var67 = [0.0, 0.0, 1.0]
+    if input[11] <= 0.5:
+        if input[6] <= 0.5:
+            if input[16] <= 0.5:
+                if input[4] <= 0.5:
+                    if input[8] <= 0.5:
+                        var68 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[0] <= 0.5:
+                            var68 = [0.0, 0.0, 1.0]
+                        else:
+                            var68 = [0.0, 1.0, 0.0]
+                else:
+                    if input[7] <= 0.5:
+                        if input[1] <= 0.5:
+                            if input[18] <= 28.369998931884766:
+                                if input[18] <= 13.69499957561493:
+                                    var68 = [0.0, 0.0, 1.0]
+                                else:
+                                    var68 = [1.0, 0.0, 0.0]
+                            else:
+                                var68 = [0.0, 0.0, 1.0]
+                        else:
+                            var68 = [1.0, 0.0, 0.0]
+                    else:
+                        var68 = [1.0, 0.0, 0.0]
+            else:
+                var68 = [0.0, 1.0, 0.0]
+        else:
+            if input[0] <= 0.5:
+                if input[17] <= 33.033369064331055:
+                    if input[7] <= 0.5:
+                        if input[17] <= 24.874298095703125:
+                            var68 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[9] <= 0.5:
+                                if input[12] <= 0.5:
+                                    if input[17] <= 29.714322090148926:
+                                        var68 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var68 = [0.0, 0.0, 1.0]
+                                else:
+                                    var68 = [0.0, 0.0, 1.0]
+                            else:
+                                var68 = [0.0, 0.0, 1.0]
+                    else:
+                        var68 = [1.0, 0.0, 0.0]
+                else:
+                    var68 = [0.0, 1.0, 0.0]
+            else:
+                if input[15] <= 0.5:
+                    if input[17] <= 17.662528038024902:
+                        var68 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[14] <= 0.5:
+                            var68 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[7] <= 0.5:
+                                if input[17] <= 30.333117485046387:
+                                    var68 = [0.0, 1.0, 0.0]
+                                else:
+                                    var68 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[18] <= 32.875:
+                                    var68 = [0.0, 0.0, 1.0]
+                                else:
+                                    var68 = [0.0, 1.0, 0.0]
+                else:
+                    var68 = [0.0, 1.0, 0.0]
+    else:
+        if input[5] <= 0.5:
+            if input[4] <= 0.5:
+                if input[17] <= 33.505757331848145:
+                    if input[18] <= 2.0550000071525574:
+                        if input[17] <= 28.09898853302002:
+                            var68 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[17] <= 29.643961906433105:
+                                var68 = [0.0, 0.0, 1.0]
+                            else:
+                                var68 = [1.0, 0.0, 0.0]
+                    else:
+                        var68 = [0.0, 0.0, 1.0]
+                else:
+                    var68 = [1.0, 0.0, 0.0]
+            else:
+                var68 = [1.0, 0.0, 0.0]
+        else:
+            var68 = [0.0, 0.0, 1.0]
+    if input[17] <= 30.69906520843506:
+        if input[6] <= 0.5:
+            if input[18] <= 2.2699999809265137:
+                var69 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 27.685659408569336:
+                    if input[8] <= 0.5:
+                        if input[10] <= 0.5:
+                            var69 = [0.0, 1.0, 0.0]
+                        else:
+                            var69 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[16] <= 0.5:
+                            var69 = [0.0, 0.0, 1.0]
+                        else:
+                            var69 = [0.0, 1.0, 0.0]
+                else:
+                    var69 = [0.0, 0.0, 1.0]
+        else:
+            if input[8] <= 0.5:
+                if input[1] <= 0.5:
+                    if input[9] <= 0.5:
+                        if input[17] <= 25.16532611846924:
+                            var69 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[14] <= 0.5:
+                                var69 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[17] <= 29.054829597473145:
+                                    var69 = [1.0, 0.0, 0.0]
+                                else:
+                                    var69 = [0.0, 0.0, 1.0]
+                    else:
+                        var69 = [0.0, 1.0, 0.0]
+                else:
+                    var69 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 28.94499969482422:
+                    if input[17] <= 29.205008506774902:
+                        if input[16] <= 0.5:
+                            var69 = [0.0, 1.0, 0.0]
+                        else:
+                            var69 = [1.0, 0.0, 0.0]
+                    else:
+                        var69 = [0.0, 0.0, 1.0]
+                else:
+                    var69 = [0.0, 1.0, 0.0]
+    else:
+        if input[2] <= 0.5:
+            if input[18] <= 17.847583293914795:
+                if input[6] <= 0.5:
+                    var69 = [1.0, 0.0, 0.0]
+                else:
+                    var69 = [0.0, 0.0, 1.0]
+            else:
+                if input[9] <= 0.5:
+                    if input[1] <= 0.5:
+                        if input[17] <= 33.13436317443848:
+                            var69 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[18] <= 28.369998931884766:
+                                var69 = [1.0, 0.0, 0.0]
+                            else:
+                                var69 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[4] <= 0.5:
+                            if input[10] <= 0.5:
+                                var69 = [1.0, 0.0, 0.0]
+                            else:
+                                var69 = [0.0, 0.0, 1.0]
+                        else:
+                            var69 = [1.0, 0.0, 0.0]
+                else:
+                    var69 = [0.0, 1.0, 0.0]
+        else:
+            var69 = [1.0, 0.0, 0.0]
+    if input[4] <= 0.5:
+        if input[18] <= 19.835000038146973:
+            if input[14] <= 0.5:
+                if input[2] <= 0.5:
+                    if input[13] <= 0.5:
+                        if input[18] <= 1.784999966621399:
+                            var70 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[10] <= 0.5:
+                                if input[8] <= 0.5:
+                                    if input[9] <= 0.5:
+                                        if input[16] <= 0.5:
+                                            if input[6] <= 0.5:
+                                                var70 = [0.0, 1.0, 0.0]
+                                            else:
+                                                var70 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var70 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var70 = [0.0, 0.0, 1.0]
+                                else:
+                                    var70 = [0.0, 0.0, 1.0]
+                            else:
+                                var70 = [0.0, 0.0, 1.0]
+                    else:
+                        var70 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 0.7749999761581421:
+                        var70 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[15] <= 0.5:
+                            var70 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[18] <= 2.8600000143051147:
+                                if input[18] <= 1.2400000095367432:
+                                    var70 = [1.0, 0.0, 0.0]
+                                else:
+                                    var70 = [0.0, 0.0, 1.0]
+                            else:
+                                var70 = [1.0, 0.0, 0.0]
+            else:
+                if input[17] <= 18.347983360290527:
+                    var70 = [0.0, 1.0, 0.0]
+                else:
+                    var70 = [0.0, 0.0, 1.0]
+        else:
+            if input[6] <= 0.5:
+                if input[8] <= 0.5:
+                    var70 = [0.0, 1.0, 0.0]
+                else:
+                    if input[16] <= 0.5:
+                        var70 = [0.0, 0.0, 1.0]
+                    else:
+                        var70 = [0.0, 1.0, 0.0]
+            else:
+                if input[9] <= 0.5:
+                    if input[13] <= 0.5:
+                        if input[10] <= 0.5:
+                            if input[17] <= 26.443750381469727:
+                                var70 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[8] <= 0.5:
+                                    var70 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[17] <= 30.333117485046387:
+                                        var70 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var70 = [0.0, 0.0, 1.0]
+                        else:
+                            var70 = [0.0, 0.0, 1.0]
+                    else:
+                        var70 = [1.0, 0.0, 0.0]
+                else:
+                    var70 = [0.0, 1.0, 0.0]
+    else:
+        if input[10] <= 0.5:
+            if input[7] <= 0.5:
+                if input[9] <= 0.5:
+                    if input[0] <= 0.5:
+                        var70 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 33.13436317443848:
+                            var70 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[17] <= 35.3419246673584:
+                                var70 = [0.0, 0.0, 1.0]
+                            else:
+                                var70 = [1.0, 0.0, 0.0]
+                else:
+                    var70 = [0.0, 1.0, 0.0]
+            else:
+                var70 = [1.0, 0.0, 0.0]
+        else:
+            if input[18] <= 39.47500038146973:
+                var70 = [1.0, 0.0, 0.0]
+            else:
+                var70 = [0.0, 0.0, 1.0]
+    if input[2] <= 0.5:
+        if input[17] <= 32.415992736816406:
+            if input[0] <= 0.5:
+                if input[5] <= 0.5:
+                    if input[1] <= 0.5:
+                        var71 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 42.46999931335449:
+                            if input[17] <= 29.68824863433838:
+                                var71 = [1.0, 0.0, 0.0]
+                            else:
+                                var71 = [0.0, 1.0, 0.0]
+                        else:
+                            var71 = [0.0, 0.0, 1.0]
+                else:
+                    if input[14] <= 0.5:
+                        var71 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[1] <= 0.5:
+                            var71 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 22.481115341186523:
+                                var71 = [0.0, 0.0, 1.0]
+                            else:
+                                var71 = [0.0, 1.0, 0.0]
+            else:
+                if input[4] <= 0.5:
+                    if input[7] <= 0.5:
+                        var71 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 25.144999504089355:
+                            var71 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[18] <= 34.224998474121094:
+                                var71 = [0.0, 0.0, 1.0]
+                            else:
+                                var71 = [0.0, 1.0, 0.0]
+                else:
+                    if input[15] <= 0.5:
+                        var71 = [1.0, 0.0, 0.0]
+                    else:
+                        var71 = [0.0, 1.0, 0.0]
+        else:
+            if input[4] <= 0.5:
+                if input[18] <= 42.165000915527344:
+                    if input[16] <= 0.5:
+                        if input[18] <= 12.023727416992188:
+                            var71 = [0.0, 1.0, 0.0]
+                        else:
+                            var71 = [0.0, 0.0, 1.0]
+                    else:
+                        var71 = [0.0, 0.0, 1.0]
+                else:
+                    var71 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 13.69499957561493:
+                    if input[14] <= 0.5:
+                        var71 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 2.8249999284744263:
+                            var71 = [1.0, 0.0, 0.0]
+                        else:
+                            var71 = [0.0, 0.0, 1.0]
+                else:
+                    var71 = [1.0, 0.0, 0.0]
+    else:
+        if input[18] <= 1.2900000214576721:
+            if input[14] <= 0.5:
+                if input[16] <= 0.5:
+                    var71 = [1.0, 0.0, 0.0]
+                else:
+                    var71 = [0.0, 0.0, 1.0]
+            else:
+                var71 = [1.0, 0.0, 0.0]
+        else:
+            if input[18] <= 2.0:
+                var71 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 2.225000023841858:
+                    var71 = [1.0, 0.0, 0.0]
+                else:
+                    if input[18] <= 2.575000047683716:
+                        var71 = [0.0, 0.0, 1.0]
+                    else:
+                        var71 = [1.0, 0.0, 0.0]
+    if input[9] <= 0.5:
+        if input[5] <= 0.5:
+            if input[10] <= 0.5:
+                if input[3] <= 0.5:
+                    if input[11] <= 0.5:
+                        if input[17] <= 19.265146255493164:
+                            var72 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[16] <= 0.5:
+                                if input[1] <= 0.5:
+                                    if input[4] <= 0.5:
+                                        var72 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var72 = [1.0, 0.0, 0.0]
+                                else:
+                                    var72 = [1.0, 0.0, 0.0]
+                            else:
+                                var72 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[4] <= 0.5:
+                            if input[18] <= 2.5700000524520874:
+                                if input[15] <= 0.5:
+                                    if input[18] <= 1.7950000166893005:
+                                        var72 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var72 = [0.0, 0.0, 1.0]
+                                else:
+                                    var72 = [1.0, 0.0, 0.0]
+                            else:
+                                var72 = [1.0, 0.0, 0.0]
+                        else:
+                            var72 = [1.0, 0.0, 0.0]
+                else:
+                    var72 = [0.0, 0.0, 1.0]
+            else:
+                if input[6] <= 0.5:
+                    var72 = [1.0, 0.0, 0.0]
+                else:
+                    var72 = [0.0, 0.0, 1.0]
+        else:
+            if input[14] <= 0.5:
+                if input[8] <= 0.5:
+                    if input[11] <= 0.5:
+                        var72 = [0.0, 1.0, 0.0]
+                    else:
+                        var72 = [0.0, 0.0, 1.0]
+                else:
+                    var72 = [0.0, 0.0, 1.0]
+            else:
+                var72 = [0.0, 1.0, 0.0]
+    else:
+        var72 = [0.0, 1.0, 0.0]
+    if input[2] <= 0.5:
+        if input[12] <= 0.5:
+            if input[13] <= 0.5:
+                if input[0] <= 0.5:
+                    if input[18] <= 47.43000030517578:
+                        if input[17] <= 20.9281644821167:
+                            if input[10] <= 0.5:
+                                var73 = [0.0, 1.0, 0.0]
+                            else:
+                                var73 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[17] <= 32.28618144989014:
+                                if input[9] <= 0.5:
+                                    if input[6] <= 0.5:
+                                        var73 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var73 = [1.0, 0.0, 0.0]
+                                else:
+                                    var73 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[17] <= 36.993812561035156:
+                                    if input[18] <= 12.023727416992188:
+                                        var73 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var73 = [0.0, 0.0, 1.0]
+                                else:
+                                    var73 = [1.0, 0.0, 0.0]
+                    else:
+                        var73 = [0.0, 0.0, 1.0]
+                else:
+                    if input[15] <= 0.5:
+                        if input[18] <= 23.894185066223145:
+                            var73 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[14] <= 0.5:
+                                if input[18] <= 28.124184608459473:
+                                    var73 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[6] <= 0.5:
+                                        var73 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var73 = [0.0, 0.0, 1.0]
+                            else:
+                                var73 = [0.0, 1.0, 0.0]
+                    else:
+                        var73 = [0.0, 1.0, 0.0]
+            else:
+                if input[16] <= 0.5:
+                    if input[15] <= 0.5:
+                        if input[18] <= 31.5:
+                            var73 = [0.0, 1.0, 0.0]
+                        else:
+                            var73 = [1.0, 0.0, 0.0]
+                    else:
+                        var73 = [1.0, 0.0, 0.0]
+                else:
+                    if input[1] <= 0.5:
+                        var73 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 27.46390724182129:
+                            var73 = [0.0, 1.0, 0.0]
+                        else:
+                            var73 = [1.0, 0.0, 0.0]
+        else:
+            if input[6] <= 0.5:
+                if input[14] <= 0.5:
+                    var73 = [0.0, 1.0, 0.0]
+                else:
+                    var73 = [1.0, 0.0, 0.0]
+            else:
+                var73 = [0.0, 0.0, 1.0]
+    else:
+        if input[15] <= 0.5:
+            var73 = [1.0, 0.0, 0.0]
+        else:
+            if input[17] <= 23.402153968811035:
+                var73 = [0.0, 0.0, 1.0]
+            else:
+                var73 = [1.0, 0.0, 0.0]
+    if input[18] <= 7.241144418716431:
+        if input[3] <= 0.5:
+            if input[18] <= 1.4100000262260437:
+                if input[15] <= 0.5:
+                    if input[16] <= 0.5:
+                        var74 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[5] <= 0.5:
+                            var74 = [1.0, 0.0, 0.0]
+                        else:
+                            var74 = [0.0, 0.0, 1.0]
+                else:
+                    var74 = [1.0, 0.0, 0.0]
+            else:
+                if input[16] <= 0.5:
+                    if input[6] <= 0.5:
+                        if input[15] <= 0.5:
+                            var74 = [1.0, 0.0, 0.0]
+                        else:
+                            var74 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 2.575000047683716:
+                            var74 = [0.0, 0.0, 1.0]
+                        else:
+                            var74 = [1.0, 0.0, 0.0]
+                else:
+                    var74 = [1.0, 0.0, 0.0]
+        else:
+            if input[15] <= 0.5:
+                if input[14] <= 0.5:
+                    var74 = [0.0, 0.0, 1.0]
+                else:
+                    if input[18] <= 2.774999976158142:
+                        var74 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 42.925825119018555:
+                            var74 = [0.0, 0.0, 1.0]
+                        else:
+                            var74 = [1.0, 0.0, 0.0]
+            else:
+                var74 = [0.0, 1.0, 0.0]
+    else:
+        if input[4] <= 0.5:
+            if input[18] <= 47.43000030517578:
+                if input[17] <= 17.662528038024902:
+                    if input[14] <= 0.5:
+                        var74 = [0.0, 0.0, 1.0]
+                    else:
+                        var74 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 19.835000038146973:
+                        if input[18] <= 12.727582931518555:
+                            var74 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[18] <= 16.670000076293945:
+                                if input[18] <= 14.122582912445068:
+                                    var74 = [0.0, 0.0, 1.0]
+                                else:
+                                    var74 = [1.0, 0.0, 0.0]
+                            else:
+                                var74 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[9] <= 0.5:
+                            if input[5] <= 0.5:
+                                var74 = [0.0, 0.0, 1.0]
+                            else:
+                                var74 = [0.0, 1.0, 0.0]
+                        else:
+                            var74 = [0.0, 1.0, 0.0]
+            else:
+                var74 = [0.0, 0.0, 1.0]
+        else:
+            if input[17] <= 30.499518394470215:
+                var74 = [0.0, 0.0, 1.0]
+            else:
+                if input[9] <= 0.5:
+                    if input[14] <= 0.5:
+                        var74 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[0] <= 0.5:
+                            var74 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[18] <= 27.4399995803833:
+                                var74 = [1.0, 0.0, 0.0]
+                            else:
+                                var74 = [0.0, 0.0, 1.0]
+                else:
+                    var74 = [0.0, 1.0, 0.0]
+    if input[13] <= 0.5:
+        if input[17] <= 31.92208957672119:
+            if input[11] <= 0.5:
+                if input[10] <= 0.5:
+                    if input[8] <= 0.5:
+                        if input[9] <= 0.5:
+                            if input[18] <= 3.409999966621399:
+                                var75 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[17] <= 19.371797561645508:
+                                    var75 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[16] <= 0.5:
+                                        var75 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var75 = [0.0, 0.0, 1.0]
+                        else:
+                            var75 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[16] <= 0.5:
+                            if input[0] <= 0.5:
+                                var75 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[17] <= 19.485254287719727:
+                                    var75 = [0.0, 0.0, 1.0]
+                                else:
+                                    var75 = [0.0, 1.0, 0.0]
+                        else:
+                            var75 = [0.0, 1.0, 0.0]
+                else:
+                    var75 = [0.0, 0.0, 1.0]
+            else:
+                if input[16] <= 0.5:
+                    if input[5] <= 0.5:
+                        if input[18] <= 1.0899999737739563:
+                            var75 = [1.0, 0.0, 0.0]
+                        else:
+                            var75 = [0.0, 0.0, 1.0]
+                    else:
+                        var75 = [0.0, 0.0, 1.0]
+                else:
+                    if input[5] <= 0.5:
+                        var75 = [1.0, 0.0, 0.0]
+                    else:
+                        var75 = [0.0, 0.0, 1.0]
+        else:
+            if input[9] <= 0.5:
+                if input[2] <= 0.5:
+                    if input[6] <= 0.5:
+                        if input[14] <= 0.5:
+                            var75 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[18] <= 2.8249999284744263:
+                                var75 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[3] <= 0.5:
+                                    var75 = [1.0, 0.0, 0.0]
+                                else:
+                                    var75 = [0.0, 0.0, 1.0]
+                    else:
+                        var75 = [0.0, 0.0, 1.0]
+                else:
+                    var75 = [1.0, 0.0, 0.0]
+            else:
+                var75 = [0.0, 1.0, 0.0]
+    else:
+        if input[1] <= 0.5:
+            if input[17] <= 23.717225074768066:
+                var75 = [0.0, 1.0, 0.0]
+            else:
+                if input[17] <= 31.252721786499023:
+                    var75 = [1.0, 0.0, 0.0]
+                else:
+                    if input[4] <= 0.5:
+                        var75 = [0.0, 1.0, 0.0]
+                    else:
+                        var75 = [1.0, 0.0, 0.0]
+        else:
+            if input[5] <= 0.5:
+                var75 = [1.0, 0.0, 0.0]
+            else:
+                var75 = [0.0, 1.0, 0.0]
+    if input[9] <= 0.5:
+        if input[3] <= 0.5:
+            if input[5] <= 0.5:
+                if input[6] <= 0.5:
+                    if input[2] <= 0.5:
+                        if input[17] <= 30.972089767456055:
+                            var76 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[10] <= 0.5:
+                                if input[13] <= 0.5:
+                                    var76 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[17] <= 36.032827377319336:
+                                        var76 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var76 = [1.0, 0.0, 0.0]
+                            else:
+                                var76 = [1.0, 0.0, 0.0]
+                    else:
+                        var76 = [1.0, 0.0, 0.0]
+                else:
+                    if input[11] <= 0.5:
+                        if input[13] <= 0.5:
+                            if input[1] <= 0.5:
+                                if input[14] <= 0.5:
+                                    var76 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[7] <= 0.5:
+                                        var76 = [0.0, 1.0, 0.0]
+                                    else:
+                                        if input[18] <= 32.875:
+                                            if input[18] <= 30.53999900817871:
+                                                var76 = [0.0, 1.0, 0.0]
+                                            else:
+                                                var76 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var76 = [0.0, 1.0, 0.0]
+                            else:
+                                var76 = [0.0, 0.0, 1.0]
+                        else:
+                            var76 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 29.054829597473145:
+                            var76 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[18] <= 1.3449999690055847:
+                                var76 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[14] <= 0.5:
+                                    var76 = [1.0, 0.0, 0.0]
+                                else:
+                                    var76 = [0.0, 0.0, 1.0]
+            else:
+                if input[11] <= 0.5:
+                    if input[18] <= 19.425000190734863:
+                        if input[10] <= 0.5:
+                            if input[13] <= 0.5:
+                                var76 = [0.0, 0.0, 1.0]
+                            else:
+                                var76 = [0.0, 1.0, 0.0]
+                        else:
+                            var76 = [0.0, 0.0, 1.0]
+                    else:
+                        var76 = [0.0, 1.0, 0.0]
+                else:
+                    var76 = [0.0, 0.0, 1.0]
+        else:
+            if input[5] <= 0.5:
+                var76 = [0.0, 0.0, 1.0]
+            else:
+                var76 = [0.0, 1.0, 0.0]
+    else:
+        var76 = [0.0, 1.0, 0.0]
+    if input[0] <= 0.5:
+        if input[10] <= 0.5:
+            if input[11] <= 0.5:
+                if input[1] <= 0.5:
+                    if input[14] <= 0.5:
+                        if input[5] <= 0.5:
+                            var77 = [0.0, 0.0, 1.0]
+                        else:
+                            var77 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[6] <= 0.5:
+                            if input[17] <= 42.925825119018555:
+                                var77 = [0.0, 0.0, 1.0]
+                            else:
+                                var77 = [1.0, 0.0, 0.0]
+                        else:
+                            var77 = [0.0, 0.0, 1.0]
+                else:
+                    if input[7] <= 0.5:
+                        if input[16] <= 0.5:
+                            if input[15] <= 0.5:
+                                var77 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[17] <= 32.28618144989014:
+                                    var77 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[18] <= 12.023727416992188:
+                                        var77 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var77 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[6] <= 0.5:
+                                var77 = [0.0, 1.0, 0.0]
+                            else:
+                                var77 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[5] <= 0.5:
+                            var77 = [1.0, 0.0, 0.0]
+                        else:
+                            var77 = [0.0, 1.0, 0.0]
+            else:
+                if input[17] <= 23.04396915435791:
+                    var77 = [0.0, 0.0, 1.0]
+                else:
+                    if input[18] <= 1.699999988079071:
+                        if input[17] <= 32.571603775024414:
+                            var77 = [0.0, 0.0, 1.0]
+                        else:
+                            var77 = [1.0, 0.0, 0.0]
+                    else:
+                        var77 = [1.0, 0.0, 0.0]
+        else:
+            var77 = [0.0, 0.0, 1.0]
+    else:
+        if input[17] <= 34.15621376037598:
+            if input[18] <= 9.494693279266357:
+                var77 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 17.439963340759277:
+                    if input[7] <= 0.5:
+                        var77 = [0.0, 1.0, 0.0]
+                    else:
+                        var77 = [0.0, 0.0, 1.0]
+                else:
+                    var77 = [0.0, 1.0, 0.0]
+        else:
+            var77 = [1.0, 0.0, 0.0]
+    if input[9] <= 0.5:
+        if input[7] <= 0.5:
+            if input[5] <= 0.5:
+                if input[12] <= 0.5:
+                    if input[1] <= 0.5:
+                        if input[4] <= 0.5:
+                            if input[8] <= 0.5:
+                                if input[18] <= 1.4599999785423279:
+                                    var78 = [1.0, 0.0, 0.0]
+                                else:
+                                    if input[16] <= 0.5:
+                                        if input[17] <= 31.38050079345703:
+                                            if input[17] <= 26.802518844604492:
+                                                var78 = [1.0, 0.0, 0.0]
+                                            else:
+                                                var78 = [0.0, 0.0, 1.0]
+                                        else:
+                                            if input[11] <= 0.5:
+                                                var78 = [0.0, 1.0, 0.0]
+                                            else:
+                                                var78 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var78 = [1.0, 0.0, 0.0]
+                            else:
+                                var78 = [0.0, 1.0, 0.0]
+                        else:
+                            var78 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[10] <= 0.5:
+                            var78 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[16] <= 0.5:
+                                if input[17] <= 34.45302391052246:
+                                    var78 = [0.0, 0.0, 1.0]
+                                else:
+                                    var78 = [1.0, 0.0, 0.0]
+                            else:
+                                var78 = [0.0, 0.0, 1.0]
+                else:
+                    if input[18] <= 2.694999933242798:
+                        var78 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[16] <= 0.5:
+                            if input[17] <= 44.4867000579834:
+                                var78 = [1.0, 0.0, 0.0]
+                            else:
+                                var78 = [0.0, 0.0, 1.0]
+                        else:
+                            var78 = [0.0, 0.0, 1.0]
+            else:
+                if input[12] <= 0.5:
+                    if input[2] <= 0.5:
+                        if input[18] <= 10.525000095367432:
+                            var78 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[10] <= 0.5:
+                                var78 = [0.0, 1.0, 0.0]
+                            else:
+                                var78 = [0.0, 0.0, 1.0]
+                    else:
+                        var78 = [0.0, 0.0, 1.0]
+                else:
+                    var78 = [0.0, 1.0, 0.0]
+        else:
+            if input[17] <= 19.049431800842285:
+                var78 = [0.0, 0.0, 1.0]
+            else:
+                if input[15] <= 0.5:
+                    if input[5] <= 0.5:
+                        if input[18] <= 30.53999900817871:
+                            var78 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 26.443750381469727:
+                                var78 = [0.0, 0.0, 1.0]
+                            else:
+                                var78 = [0.0, 1.0, 0.0]
+                    else:
+                        var78 = [0.0, 1.0, 0.0]
+                else:
+                    if input[5] <= 0.5:
+                        var78 = [1.0, 0.0, 0.0]
+                    else:
+                        var78 = [0.0, 1.0, 0.0]
+    else:
+        if input[6] <= 0.5:
+            var78 = [0.0, 1.0, 0.0]
+        else:
+            if input[0] <= 0.5:
+                if input[18] <= 21.752583026885986:
+                    var78 = [0.0, 0.0, 1.0]
+                else:
+                    var78 = [0.0, 1.0, 0.0]
+            else:
+                var78 = [0.0, 1.0, 0.0]
+    if input[9] <= 0.5:
+        if input[18] <= 37.72500038146973:
+            if input[18] <= 1.4100000262260437:
+                if input[5] <= 0.5:
+                    var79 = [1.0, 0.0, 0.0]
+                else:
+                    var79 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 21.605905532836914:
+                    if input[1] <= 0.5:
+                        if input[3] <= 0.5:
+                            if input[6] <= 0.5:
+                                var79 = [0.0, 1.0, 0.0]
+                            else:
+                                var79 = [0.0, 0.0, 1.0]
+                        else:
+                            var79 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[17] <= 20.381393432617188:
+                            var79 = [0.0, 0.0, 1.0]
+                        else:
+                            var79 = [0.0, 1.0, 0.0]
+                else:
+                    if input[11] <= 0.5:
+                        if input[5] <= 0.5:
+                            if input[8] <= 0.5:
+                                if input[1] <= 0.5:
+                                    if input[12] <= 0.5:
+                                        if input[15] <= 0.5:
+                                            var79 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var79 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var79 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[4] <= 0.5:
+                                        var79 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var79 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[1] <= 0.5:
+                                    if input[6] <= 0.5:
+                                        var79 = [1.0, 0.0, 0.0]
+                                    else:
+                                        if input[17] <= 30.333117485046387:
+                                            var79 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var79 = [0.0, 0.0, 1.0]
+                                else:
+                                    var79 = [1.0, 0.0, 0.0]
+                        else:
+                            var79 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 2.0:
+                            var79 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[5] <= 0.5:
+                                if input[18] <= 2.5700000524520874:
+                                    if input[17] <= 31.649048805236816:
+                                        var79 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var79 = [1.0, 0.0, 0.0]
+                                else:
+                                    var79 = [1.0, 0.0, 0.0]
+                            else:
+                                var79 = [0.0, 0.0, 1.0]
+        else:
+            if input[8] <= 0.5:
+                if input[14] <= 0.5:
+                    var79 = [1.0, 0.0, 0.0]
+                else:
+                    if input[1] <= 0.5:
+                        var79 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[18] <= 44.03499984741211:
+                            var79 = [1.0, 0.0, 0.0]
+                        else:
+                            var79 = [0.0, 0.0, 1.0]
+            else:
+                var79 = [0.0, 0.0, 1.0]
+    else:
+        var79 = [0.0, 1.0, 0.0]
+    if input[18] <= 9.619693279266357:
+        if input[2] <= 0.5:
+            if input[1] <= 0.5:
+                if input[8] <= 0.5:
+                    if input[5] <= 0.5:
+                        var80 = [0.0, 0.0, 1.0]
+                    else:
+                        var80 = [0.0, 1.0, 0.0]
+                else:
+                    var80 = [0.0, 0.0, 1.0]
+            else:
+                var80 = [0.0, 0.0, 1.0]
+        else:
+            if input[14] <= 0.5:
+                if input[5] <= 0.5:
+                    var80 = [1.0, 0.0, 0.0]
+                else:
+                    var80 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 1.3449999690055847:
+                    var80 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 40.20197582244873:
+                        var80 = [0.0, 0.0, 1.0]
+                    else:
+                        var80 = [1.0, 0.0, 0.0]
+    else:
+        if input[0] <= 0.5:
+            if input[1] <= 0.5:
+                var80 = [1.0, 0.0, 0.0]
+            else:
+                if input[17] <= 26.612996101379395:
+                    if input[17] <= 22.81070613861084:
+                        var80 = [0.0, 0.0, 1.0]
+                    else:
+                        var80 = [0.0, 1.0, 0.0]
+                else:
+                    if input[16] <= 0.5:
+                        if input[13] <= 0.5:
+                            var80 = [0.0, 0.0, 1.0]
+                        else:
+                            var80 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 29.714322090148926:
+                            var80 = [1.0, 0.0, 0.0]
+                        else:
+                            var80 = [0.0, 0.0, 1.0]
+        else:
+            if input[13] <= 0.5:
+                if input[15] <= 0.5:
+                    if input[17] <= 17.740819931030273:
+                        if input[14] <= 0.5:
+                            var80 = [0.0, 0.0, 1.0]
+                        else:
+                            var80 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 33.529998779296875:
+                            if input[17] <= 25.268705368041992:
+                                var80 = [0.0, 0.0, 1.0]
+                            else:
+                                var80 = [0.0, 1.0, 0.0]
+                        else:
+                            var80 = [0.0, 1.0, 0.0]
+                else:
+                    var80 = [0.0, 1.0, 0.0]
+            else:
+                if input[5] <= 0.5:
+                    if input[14] <= 0.5:
+                        var80 = [1.0, 0.0, 0.0]
+                    else:
+                        var80 = [0.0, 0.0, 1.0]
+                else:
+                    var80 = [0.0, 1.0, 0.0]
+    if input[5] <= 0.5:
+        if input[3] <= 0.5:
+            if input[2] <= 0.5:
+                if input[1] <= 0.5:
+                    if input[6] <= 0.5:
+                        if input[16] <= 0.5:
+                            if input[17] <= 33.06261157989502:
+                                var81 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[15] <= 0.5:
+                                    var81 = [0.0, 0.0, 1.0]
+                                else:
+                                    var81 = [1.0, 0.0, 0.0]
+                        else:
+                            var81 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[9] <= 0.5:
+                            if input[16] <= 0.5:
+                                if input[8] <= 0.5:
+                                    if input[17] <= 26.443750381469727:
+                                        var81 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var81 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[17] <= 30.333117485046387:
+                                        var81 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var81 = [0.0, 0.0, 1.0]
+                            else:
+                                var81 = [0.0, 0.0, 1.0]
+                        else:
+                            var81 = [0.0, 1.0, 0.0]
+                else:
+                    if input[8] <= 0.5:
+                        if input[4] <= 0.5:
+                            if input[18] <= 37.9950008392334:
+                                var81 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[7] <= 0.5:
+                                    if input[17] <= 32.923152923583984:
+                                        var81 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var81 = [1.0, 0.0, 0.0]
+                                else:
+                                    var81 = [1.0, 0.0, 0.0]
+                        else:
+                            var81 = [1.0, 0.0, 0.0]
+                    else:
+                        var81 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 2.225000023841858:
+                    var81 = [1.0, 0.0, 0.0]
+                else:
+                    if input[15] <= 0.5:
+                        if input[7] <= 0.5:
+                            if input[16] <= 0.5:
+                                if input[17] <= 40.20197582244873:
+                                    var81 = [0.0, 0.0, 1.0]
+                                else:
+                                    var81 = [1.0, 0.0, 0.0]
+                            else:
+                                var81 = [1.0, 0.0, 0.0]
+                        else:
+                            var81 = [1.0, 0.0, 0.0]
+                    else:
+                        var81 = [1.0, 0.0, 0.0]
+        else:
+            if input[14] <= 0.5:
+                var81 = [0.0, 0.0, 1.0]
+            else:
+                if input[4] <= 0.5:
+                    var81 = [0.0, 0.0, 1.0]
+                else:
+                    var81 = [1.0, 0.0, 0.0]
+    else:
+        if input[17] <= 22.122957229614258:
+            if input[10] <= 0.5:
+                var81 = [0.0, 1.0, 0.0]
+            else:
+                if input[17] <= 17.263123035430908:
+                    var81 = [0.0, 1.0, 0.0]
+                else:
+                    var81 = [0.0, 0.0, 1.0]
+        else:
+            if input[2] <= 0.5:
+                var81 = [0.0, 1.0, 0.0]
+            else:
+                var81 = [0.0, 0.0, 1.0]
+    if input[2] <= 0.5:
+        if input[6] <= 0.5:
+            if input[18] <= 19.119999885559082:
+                if input[1] <= 0.5:
+                    if input[18] <= 2.8249999284744263:
+                        if input[17] <= 33.31845760345459:
+                            var82 = [0.0, 1.0, 0.0]
+                        else:
+                            var82 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[9] <= 0.5:
+                            if input[17] <= 33.84502410888672:
+                                if input[0] <= 0.5:
+                                    var82 = [0.0, 1.0, 0.0]
+                                else:
+                                    var82 = [0.0, 0.0, 1.0]
+                            else:
+                                var82 = [0.0, 0.0, 1.0]
+                        else:
+                            var82 = [0.0, 1.0, 0.0]
+                else:
+                    var82 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 22.282362937927246:
+                    var82 = [0.0, 1.0, 0.0]
+                else:
+                    if input[17] <= 35.3419246673584:
+                        if input[18] <= 28.809999465942383:
+                            var82 = [0.0, 1.0, 0.0]
+                        else:
+                            var82 = [0.0, 0.0, 1.0]
+                    else:
+                        var82 = [1.0, 0.0, 0.0]
+        else:
+            if input[0] <= 0.5:
+                if input[16] <= 0.5:
+                    if input[9] <= 0.5:
+                        var82 = [0.0, 0.0, 1.0]
+                    else:
+                        var82 = [0.0, 1.0, 0.0]
+                else:
+                    if input[17] <= 28.156450271606445:
+                        var82 = [1.0, 0.0, 0.0]
+                    else:
+                        var82 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 30.324999809265137:
+                    if input[14] <= 0.5:
+                        var82 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[8] <= 0.5:
+                            var82 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 29.032323837280273:
+                                var82 = [0.0, 1.0, 0.0]
+                            else:
+                                var82 = [0.0, 0.0, 1.0]
+                else:
+                    if input[17] <= 26.443750381469727:
+                        var82 = [0.0, 0.0, 1.0]
+                    else:
+                        var82 = [0.0, 1.0, 0.0]
+    else:
+        if input[18] <= 0.5699999928474426:
+            var82 = [0.0, 0.0, 1.0]
+        else:
+            if input[6] <= 0.5:
+                if input[14] <= 0.5:
+                    if input[5] <= 0.5:
+                        var82 = [1.0, 0.0, 0.0]
+                    else:
+                        var82 = [0.0, 0.0, 1.0]
+                else:
+                    var82 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 1.7950000166893005:
+                    var82 = [1.0, 0.0, 0.0]
+                else:
+                    if input[14] <= 0.5:
+                        var82 = [1.0, 0.0, 0.0]
+                    else:
+                        var82 = [0.0, 0.0, 1.0]
+    if input[5] <= 0.5:
+        if input[11] <= 0.5:
+            if input[9] <= 0.5:
+                if input[2] <= 0.5:
+                    if input[12] <= 0.5:
+                        if input[18] <= 40.67499923706055:
+                            if input[16] <= 0.5:
+                                if input[17] <= 35.72043991088867:
+                                    if input[6] <= 0.5:
+                                        var83 = [1.0, 0.0, 0.0]
+                                    else:
+                                        if input[10] <= 0.5:
+                                            if input[13] <= 0.5:
+                                                if input[7] <= 0.5:
+                                                    if input[17] <= 30.333117485046387:
+                                                        var83 = [0.0, 1.0, 0.0]
+                                                    else:
+                                                        var83 = [0.0, 0.0, 1.0]
+                                                else:
+                                                    if input[18] <= 30.53999900817871:
+                                                        var83 = [0.0, 1.0, 0.0]
+                                                    else:
+                                                        var83 = [0.0, 0.0, 1.0]
+                                            else:
+                                                var83 = [0.0, 1.0, 0.0]
+                                        else:
+                                            var83 = [0.0, 0.0, 1.0]
+                                else:
+                                    var83 = [1.0, 0.0, 0.0]
+                            else:
+                                var83 = [1.0, 0.0, 0.0]
+                        else:
+                            var83 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[17] <= 43.06949424743652:
+                            var83 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[16] <= 0.5:
+                                var83 = [1.0, 0.0, 0.0]
+                            else:
+                                var83 = [0.0, 0.0, 1.0]
+                else:
+                    var83 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 19.551767826080322:
+                    if input[17] <= 33.033369064331055:
+                        var83 = [0.0, 0.0, 1.0]
+                    else:
+                        var83 = [0.0, 1.0, 0.0]
+                else:
+                    var83 = [0.0, 1.0, 0.0]
+        else:
+            if input[6] <= 0.5:
+                var83 = [1.0, 0.0, 0.0]
+            else:
+                if input[15] <= 0.5:
+                    if input[14] <= 0.5:
+                        var83 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 29.988983154296875:
+                            var83 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[17] <= 37.61045742034912:
+                                var83 = [0.0, 0.0, 1.0]
+                            else:
+                                var83 = [1.0, 0.0, 0.0]
+                else:
+                    var83 = [1.0, 0.0, 0.0]
+    else:
+        if input[17] <= 23.012829780578613:
+            if input[17] <= 22.122957229614258:
+                if input[0] <= 0.5:
+                    if input[18] <= 19.835000038146973:
+                        var83 = [0.0, 0.0, 1.0]
+                    else:
+                        var83 = [0.0, 1.0, 0.0]
+                else:
+                    var83 = [0.0, 1.0, 0.0]
+            else:
+                var83 = [0.0, 0.0, 1.0]
+        else:
+            var83 = [0.0, 1.0, 0.0]
+    if input[0] <= 0.5:
+        if input[11] <= 0.5:
+            if input[5] <= 0.5:
+                if input[9] <= 0.5:
+                    if input[18] <= 11.539999961853027:
+                        var84 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[14] <= 0.5:
+                            if input[10] <= 0.5:
+                                var84 = [1.0, 0.0, 0.0]
+                            else:
+                                var84 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[2] <= 0.5:
+                                if input[17] <= 36.41134262084961:
+                                    var84 = [0.0, 0.0, 1.0]
+                                else:
+                                    var84 = [1.0, 0.0, 0.0]
+                            else:
+                                var84 = [1.0, 0.0, 0.0]
+                else:
+                    var84 = [0.0, 1.0, 0.0]
+            else:
+                var84 = [0.0, 1.0, 0.0]
+        else:
+            if input[6] <= 0.5:
+                if input[16] <= 0.5:
+                    if input[5] <= 0.5:
+                        var84 = [1.0, 0.0, 0.0]
+                    else:
+                        var84 = [0.0, 0.0, 1.0]
+                else:
+                    var84 = [0.0, 0.0, 1.0]
+            else:
+                var84 = [1.0, 0.0, 0.0]
+    else:
+        if input[4] <= 0.5:
+            if input[18] <= 10.019999980926514:
+                var84 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 25.954999923706055:
+                    if input[14] <= 0.5:
+                        var84 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 17.78000020980835:
+                            var84 = [0.0, 1.0, 0.0]
+                        else:
+                            var84 = [0.0, 0.0, 1.0]
+                else:
+                    var84 = [0.0, 1.0, 0.0]
+        else:
+            if input[18] <= 21.794692516326904:
+                var84 = [0.0, 1.0, 0.0]
+            else:
+                var84 = [0.0, 0.0, 1.0]
+    if input[11] <= 0.5:
+        if input[5] <= 0.5:
+            if input[13] <= 0.5:
+                if input[9] <= 0.5:
+                    if input[7] <= 0.5:
+                        if input[6] <= 0.5:
+                            if input[18] <= 2.8249999284744263:
+                                var85 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[10] <= 0.5:
+                                    if input[8] <= 0.5:
+                                        var85 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var85 = [1.0, 0.0, 0.0]
+                                else:
+                                    var85 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[18] <= 10.144999980926514:
+                                var85 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[14] <= 0.5:
+                                    var85 = [0.0, 0.0, 1.0]
+                                else:
+                                    var85 = [0.0, 1.0, 0.0]
+                    else:
+                        var85 = [1.0, 0.0, 0.0]
+                else:
+                    if input[1] <= 0.5:
+                        var85 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 21.752583026885986:
+                            if input[18] <= 12.023727416992188:
+                                var85 = [0.0, 1.0, 0.0]
+                            else:
+                                var85 = [0.0, 0.0, 1.0]
+                        else:
+                            var85 = [0.0, 1.0, 0.0]
+            else:
+                if input[6] <= 0.5:
+                    if input[17] <= 35.3419246673584:
+                        var85 = [0.0, 0.0, 1.0]
+                    else:
+                        var85 = [1.0, 0.0, 0.0]
+                else:
+                    var85 = [1.0, 0.0, 0.0]
+        else:
+            if input[18] <= 47.53499984741211:
+                if input[8] <= 0.5:
+                    var85 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 22.364999771118164:
+                        var85 = [0.0, 0.0, 1.0]
+                    else:
+                        var85 = [0.0, 1.0, 0.0]
+            else:
+                var85 = [0.0, 0.0, 1.0]
+    else:
+        if input[14] <= 0.5:
+            if input[5] <= 0.5:
+                var85 = [1.0, 0.0, 0.0]
+            else:
+                var85 = [0.0, 0.0, 1.0]
+        else:
+            if input[18] <= 1.3399999737739563:
+                var85 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 2.575000047683716:
+                    var85 = [0.0, 0.0, 1.0]
+                else:
+                    var85 = [1.0, 0.0, 0.0]
+    if input[11] <= 0.5:
+        if input[6] <= 0.5:
+            if input[4] <= 0.5:
+                var86 = [0.0, 1.0, 0.0]
+            else:
+                if input[10] <= 0.5:
+                    if input[7] <= 0.5:
+                        if input[9] <= 0.5:
+                            if input[18] <= 2.8249999284744263:
+                                var86 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[0] <= 0.5:
+                                    var86 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[8] <= 0.5:
+                                        var86 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var86 = [1.0, 0.0, 0.0]
+                        else:
+                            var86 = [0.0, 1.0, 0.0]
+                    else:
+                        var86 = [1.0, 0.0, 0.0]
+                else:
+                    var86 = [1.0, 0.0, 0.0]
+        else:
+            if input[9] <= 0.5:
+                if input[16] <= 0.5:
+                    if input[0] <= 0.5:
+                        if input[10] <= 0.5:
+                            if input[17] <= 23.39246654510498:
+                                var86 = [0.0, 0.0, 1.0]
+                            else:
+                                var86 = [1.0, 0.0, 0.0]
+                        else:
+                            var86 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[8] <= 0.5:
+                            if input[18] <= 30.53999900817871:
+                                var86 = [0.0, 1.0, 0.0]
+                            else:
+                                var86 = [0.0, 0.0, 1.0]
+                        else:
+                            var86 = [0.0, 1.0, 0.0]
+                else:
+                    if input[1] <= 0.5:
+                        var86 = [0.0, 0.0, 1.0]
+                    else:
+                        var86 = [1.0, 0.0, 0.0]
+            else:
+                var86 = [0.0, 1.0, 0.0]
+    else:
+        if input[5] <= 0.5:
+            if input[14] <= 0.5:
+                var86 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 2.225000023841858:
+                    if input[17] <= 30.714895248413086:
+                        if input[18] <= 1.0899999737739563:
+                            var86 = [1.0, 0.0, 0.0]
+                        else:
+                            var86 = [0.0, 0.0, 1.0]
+                    else:
+                        var86 = [1.0, 0.0, 0.0]
+                else:
+                    if input[17] <= 40.20197582244873:
+                        var86 = [0.0, 0.0, 1.0]
+                    else:
+                        var86 = [1.0, 0.0, 0.0]
+        else:
+            var86 = [0.0, 0.0, 1.0]
+    if input[11] <= 0.5:
+        if input[9] <= 0.5:
+            if input[18] <= 10.144999980926514:
+                if input[18] <= 1.784999966621399:
+                    var87 = [0.0, 1.0, 0.0]
+                else:
+                    if input[5] <= 0.5:
+                        if input[4] <= 0.5:
+                            var87 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[17] <= 44.4867000579834:
+                                var87 = [1.0, 0.0, 0.0]
+                            else:
+                                var87 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[8] <= 0.5:
+                            var87 = [0.0, 1.0, 0.0]
+                        else:
+                            var87 = [0.0, 0.0, 1.0]
+            else:
+                if input[1] <= 0.5:
+                    if input[14] <= 0.5:
+                        if input[17] <= 28.85096263885498:
+                            var87 = [0.0, 1.0, 0.0]
+                        else:
+                            var87 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[8] <= 0.5:
+                            if input[6] <= 0.5:
+                                var87 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[17] <= 26.443750381469727:
+                                    var87 = [0.0, 0.0, 1.0]
+                                else:
+                                    var87 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[18] <= 22.90000057220459:
+                                if input[18] <= 17.070000171661377:
+                                    var87 = [0.0, 1.0, 0.0]
+                                else:
+                                    var87 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[18] <= 28.94499969482422:
+                                    var87 = [0.0, 0.0, 1.0]
+                                else:
+                                    var87 = [0.0, 1.0, 0.0]
+                else:
+                    if input[7] <= 0.5:
+                        if input[17] <= 20.66996669769287:
+                            if input[17] <= 20.12319564819336:
+                                var87 = [0.0, 0.0, 1.0]
+                            else:
+                                var87 = [0.0, 1.0, 0.0]
+                        else:
+                            var87 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[15] <= 0.5:
+                            var87 = [1.0, 0.0, 0.0]
+                        else:
+                            var87 = [0.0, 1.0, 0.0]
+        else:
+            var87 = [0.0, 1.0, 0.0]
+    else:
+        if input[4] <= 0.5:
+            if input[14] <= 0.5:
+                if input[5] <= 0.5:
+                    var87 = [1.0, 0.0, 0.0]
+                else:
+                    var87 = [0.0, 0.0, 1.0]
+            else:
+                if input[17] <= 32.571603775024414:
+                    if input[18] <= 1.0899999737739563:
+                        var87 = [1.0, 0.0, 0.0]
+                    else:
+                        var87 = [0.0, 0.0, 1.0]
+                else:
+                    var87 = [1.0, 0.0, 0.0]
+        else:
+            var87 = [1.0, 0.0, 0.0]
+    if input[9] <= 0.5:
+        if input[17] <= 23.561559677124023:
+            if input[10] <= 0.5:
+                if input[8] <= 0.5:
+                    if input[13] <= 0.5:
+                        if input[11] <= 0.5:
+                            if input[5] <= 0.5:
+                                var88 = [1.0, 0.0, 0.0]
+                            else:
+                                var88 = [0.0, 1.0, 0.0]
+                        else:
+                            var88 = [0.0, 0.0, 1.0]
+                    else:
+                        var88 = [0.0, 1.0, 0.0]
+                else:
+                    var88 = [0.0, 0.0, 1.0]
+            else:
+                var88 = [0.0, 0.0, 1.0]
+        else:
+            if input[0] <= 0.5:
+                if input[2] <= 0.5:
+                    if input[5] <= 0.5:
+                        if input[6] <= 0.5:
+                            if input[15] <= 0.5:
+                                if input[17] <= 42.925825119018555:
+                                    var88 = [0.0, 0.0, 1.0]
+                                else:
+                                    var88 = [1.0, 0.0, 0.0]
+                            else:
+                                var88 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[7] <= 0.5:
+                                if input[16] <= 0.5:
+                                    var88 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[17] <= 29.714322090148926:
+                                        var88 = [1.0, 0.0, 0.0]
+                                    else:
+                                        if input[12] <= 0.5:
+                                            if input[17] <= 32.923152923583984:
+                                                var88 = [0.0, 0.0, 1.0]
+                                            else:
+                                                var88 = [1.0, 0.0, 0.0]
+                                        else:
+                                            var88 = [0.0, 0.0, 1.0]
+                            else:
+                                var88 = [1.0, 0.0, 0.0]
+                    else:
+                        var88 = [0.0, 1.0, 0.0]
+                else:
+                    if input[14] <= 0.5:
+                        var88 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[7] <= 0.5:
+                            if input[17] <= 32.190701484680176:
+                                if input[17] <= 29.054829597473145:
+                                    var88 = [1.0, 0.0, 0.0]
+                                else:
+                                    var88 = [0.0, 0.0, 1.0]
+                            else:
+                                var88 = [1.0, 0.0, 0.0]
+                        else:
+                            var88 = [1.0, 0.0, 0.0]
+            else:
+                if input[16] <= 0.5:
+                    if input[8] <= 0.5:
+                        if input[13] <= 0.5:
+                            var88 = [0.0, 1.0, 0.0]
+                        else:
+                            var88 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[17] <= 30.333117485046387:
+                            var88 = [0.0, 1.0, 0.0]
+                        else:
+                            var88 = [0.0, 0.0, 1.0]
+                else:
+                    var88 = [1.0, 0.0, 0.0]
+    else:
+        if input[16] <= 0.5:
+            if input[0] <= 0.5:
+                if input[17] <= 32.28618144989014:
+                    var88 = [0.0, 1.0, 0.0]
+                else:
+                    if input[17] <= 33.033369064331055:
+                        var88 = [0.0, 0.0, 1.0]
+                    else:
+                        var88 = [0.0, 1.0, 0.0]
+            else:
+                var88 = [0.0, 1.0, 0.0]
+        else:
+            var88 = [0.0, 1.0, 0.0]
+    if input[5] <= 0.5:
+        if input[9] <= 0.5:
+            if input[2] <= 0.5:
+                if input[0] <= 0.5:
+                    if input[4] <= 0.5:
+                        if input[18] <= 36.23500061035156:
+                            var89 = [0.0, 0.0, 1.0]
+                        else:
+                            var89 = [1.0, 0.0, 0.0]
+                    else:
+                        var89 = [1.0, 0.0, 0.0]
+                else:
+                    if input[6] <= 0.5:
+                        var89 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[18] <= 17.62000036239624:
+                            var89 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[16] <= 0.5:
+                                if input[18] <= 25.954999923706055:
+                                    var89 = [0.0, 0.0, 1.0]
+                                else:
+                                    var89 = [0.0, 1.0, 0.0]
+                            else:
+                                var89 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 1.3449999690055847:
+                    var89 = [1.0, 0.0, 0.0]
+                else:
+                    if input[6] <= 0.5:
+                        var89 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[16] <= 0.5:
+                            if input[15] <= 0.5:
+                                var89 = [0.0, 0.0, 1.0]
+                            else:
+                                var89 = [1.0, 0.0, 0.0]
+                        else:
+                            var89 = [1.0, 0.0, 0.0]
+        else:
+            var89 = [0.0, 1.0, 0.0]
+    else:
+        if input[11] <= 0.5:
+            if input[16] <= 0.5:
+                if input[18] <= 46.53499984741211:
+                    if input[10] <= 0.5:
+                        var89 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[0] <= 0.5:
+                            var89 = [0.0, 0.0, 1.0]
+                        else:
+                            var89 = [0.0, 1.0, 0.0]
+                else:
+                    var89 = [0.0, 0.0, 1.0]
+            else:
+                var89 = [0.0, 1.0, 0.0]
+        else:
+            var89 = [0.0, 0.0, 1.0]
+    if input[17] <= 33.00283432006836:
+        if input[5] <= 0.5:
+            if input[18] <= 7.419693231582642:
+                if input[17] <= 23.056336402893066:
+                    var90 = [0.0, 0.0, 1.0]
+                else:
+                    if input[16] <= 0.5:
+                        if input[15] <= 0.5:
+                            var90 = [0.0, 0.0, 1.0]
+                        else:
+                            var90 = [1.0, 0.0, 0.0]
+                    else:
+                        var90 = [1.0, 0.0, 0.0]
+            else:
+                if input[9] <= 0.5:
+                    if input[15] <= 0.5:
+                        if input[18] <= 13.34499979019165:
+                            var90 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 30.721294403076172:
+                                if input[17] <= 30.4994478225708:
+                                    if input[4] <= 0.5:
+                                        if input[0] <= 0.5:
+                                            var90 = [1.0, 0.0, 0.0]
+                                        else:
+                                            if input[17] <= 26.569499015808105:
+                                                var90 = [0.0, 0.0, 1.0]
+                                            else:
+                                                if input[17] <= 30.333117485046387:
+                                                    var90 = [0.0, 1.0, 0.0]
+                                                else:
+                                                    var90 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var90 = [0.0, 0.0, 1.0]
+                                else:
+                                    var90 = [0.0, 1.0, 0.0]
+                            else:
+                                var90 = [1.0, 0.0, 0.0]
+                    else:
+                        var90 = [0.0, 0.0, 1.0]
+                else:
+                    if input[16] <= 0.5:
+                        if input[1] <= 0.5:
+                            var90 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 32.28618144989014:
+                                var90 = [0.0, 1.0, 0.0]
+                            else:
+                                var90 = [0.0, 0.0, 1.0]
+                    else:
+                        var90 = [0.0, 1.0, 0.0]
+        else:
+            if input[10] <= 0.5:
+                var90 = [0.0, 1.0, 0.0]
+            else:
+                if input[0] <= 0.5:
+                    var90 = [0.0, 0.0, 1.0]
+                else:
+                    var90 = [0.0, 1.0, 0.0]
+    else:
+        if input[2] <= 0.5:
+            if input[13] <= 0.5:
+                if input[1] <= 0.5:
+                    var90 = [0.0, 0.0, 1.0]
+                else:
+                    if input[6] <= 0.5:
+                        var90 = [1.0, 0.0, 0.0]
+                    else:
+                        var90 = [0.0, 0.0, 1.0]
+            else:
+                var90 = [1.0, 0.0, 0.0]
+        else:
+            var90 = [1.0, 0.0, 0.0]
+    if input[2] <= 0.5:
+        if input[4] <= 0.5:
+            if input[17] <= 32.415992736816406:
+                if input[8] <= 0.5:
+                    if input[18] <= 11.614999651908875:
+                        if input[17] <= 19.421363830566406:
+                            var91 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[5] <= 0.5:
+                                var91 = [0.0, 0.0, 1.0]
+                            else:
+                                var91 = [0.0, 1.0, 0.0]
+                    else:
+                        var91 = [0.0, 1.0, 0.0]
+                else:
+                    if input[17] <= 18.164326667785645:
+                        var91 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[0] <= 0.5:
+                            var91 = [1.0, 0.0, 0.0]
+                        else:
+                            var91 = [0.0, 1.0, 0.0]
+            else:
+                if input[9] <= 0.5:
+                    if input[10] <= 0.5:
+                        var91 = [1.0, 0.0, 0.0]
+                    else:
+                        var91 = [0.0, 0.0, 1.0]
+                else:
+                    var91 = [0.0, 0.0, 1.0]
+        else:
+            if input[17] <= 30.972089767456055:
+                var91 = [0.0, 0.0, 1.0]
+            else:
+                if input[14] <= 0.5:
+                    var91 = [0.0, 0.0, 1.0]
+                else:
+                    if input[12] <= 0.5:
+                        if input[13] <= 0.5:
+                            var91 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[18] <= 35.3799991607666:
+                                var91 = [0.0, 0.0, 1.0]
+                            else:
+                                var91 = [1.0, 0.0, 0.0]
+                    else:
+                        var91 = [1.0, 0.0, 0.0]
+    else:
+        if input[17] <= 31.649048805236816:
+            if input[18] <= 2.0550000071525574:
+                if input[15] <= 0.5:
+                    if input[17] <= 24.30154037475586:
+                        var91 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[16] <= 0.5:
+                            var91 = [0.0, 0.0, 1.0]
+                        else:
+                            var91 = [1.0, 0.0, 0.0]
+                else:
+                    var91 = [0.0, 0.0, 1.0]
+            else:
+                var91 = [0.0, 0.0, 1.0]
+        else:
+            var91 = [1.0, 0.0, 0.0]
+    if input[7] <= 0.5:
+        if input[17] <= 19.21723461151123:
+            var92 = [0.0, 1.0, 0.0]
+        else:
+            if input[4] <= 0.5:
+                if input[16] <= 0.5:
+                    if input[17] <= 35.32961463928223:
+                        if input[9] <= 0.5:
+                            if input[18] <= 28.94499969482422:
+                                if input[6] <= 0.5:
+                                    var92 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[11] <= 0.5:
+                                        if input[0] <= 0.5:
+                                            var92 = [0.0, 0.0, 1.0]
+                                        else:
+                                            if input[17] <= 31.030875205993652:
+                                                var92 = [0.0, 0.0, 1.0]
+                                            else:
+                                                var92 = [0.0, 1.0, 0.0]
+                                    else:
+                                        if input[18] <= 3.0850000381469727:
+                                            var92 = [0.0, 0.0, 1.0]
+                                        else:
+                                            var92 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[10] <= 0.5:
+                                    var92 = [0.0, 1.0, 0.0]
+                                else:
+                                    var92 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[18] <= 21.752583026885986:
+                                if input[18] <= 12.023727416992188:
+                                    var92 = [0.0, 1.0, 0.0]
+                                else:
+                                    var92 = [0.0, 0.0, 1.0]
+                            else:
+                                var92 = [0.0, 1.0, 0.0]
+                    else:
+                        var92 = [1.0, 0.0, 0.0]
+                else:
+                    if input[12] <= 0.5:
+                        if input[18] <= 20.169184684753418:
+                            var92 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[13] <= 0.5:
+                                var92 = [0.0, 1.0, 0.0]
+                            else:
+                                var92 = [1.0, 0.0, 0.0]
+                    else:
+                        var92 = [0.0, 0.0, 1.0]
+            else:
+                if input[12] <= 0.5:
+                    if input[8] <= 0.5:
+                        if input[15] <= 0.5:
+                            if input[18] <= 39.47500038146973:
+                                var92 = [1.0, 0.0, 0.0]
+                            else:
+                                var92 = [0.0, 0.0, 1.0]
+                        else:
+                            var92 = [1.0, 0.0, 0.0]
+                    else:
+                        var92 = [1.0, 0.0, 0.0]
+                else:
+                    var92 = [0.0, 0.0, 1.0]
+    else:
+        if input[17] <= 24.913984298706055:
+            if input[1] <= 0.5:
+                if input[17] <= 22.344231605529785:
+                    if input[15] <= 0.5:
+                        if input[16] <= 0.5:
+                            var92 = [0.0, 1.0, 0.0]
+                        else:
+                            var92 = [0.0, 0.0, 1.0]
+                    else:
+                        var92 = [0.0, 1.0, 0.0]
+                else:
+                    var92 = [0.0, 0.0, 1.0]
+            else:
+                var92 = [0.0, 1.0, 0.0]
+        else:
+            if input[17] <= 36.63549327850342:
+                if input[15] <= 0.5:
+                    var92 = [0.0, 1.0, 0.0]
+                else:
+                    var92 = [1.0, 0.0, 0.0]
+            else:
+                var92 = [1.0, 0.0, 0.0]
+    if input[18] <= 6.015000104904175:
+        if input[5] <= 0.5:
+            if input[2] <= 0.5:
+                if input[16] <= 0.5:
+                    if input[6] <= 0.5:
+                        if input[17] <= 44.4867000579834:
+                            if input[18] <= 2.8249999284744263:
+                                var93 = [1.0, 0.0, 0.0]
+                            else:
+                                var93 = [0.0, 0.0, 1.0]
+                        else:
+                            var93 = [0.0, 0.0, 1.0]
+                    else:
+                        var93 = [0.0, 0.0, 1.0]
+                else:
+                    var93 = [0.0, 0.0, 1.0]
+            else:
+                var93 = [1.0, 0.0, 0.0]
+        else:
+            if input[15] <= 0.5:
+                if input[14] <= 0.5:
+                    var93 = [0.0, 0.0, 1.0]
+                else:
+                    var93 = [0.0, 1.0, 0.0]
+            else:
+                if input[2] <= 0.5:
+                    var93 = [0.0, 1.0, 0.0]
+                else:
+                    var93 = [0.0, 0.0, 1.0]
+    else:
+        if input[18] <= 9.441144466400146:
+            var93 = [0.0, 0.0, 1.0]
+        else:
+            if input[10] <= 0.5:
+                if input[4] <= 0.5:
+                    if input[16] <= 0.5:
+                        if input[0] <= 0.5:
+                            if input[18] <= 46.53499984741211:
+                                if input[18] <= 17.287582874298096:
+                                    if input[17] <= 33.033369064331055:
+                                        var93 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var93 = [0.0, 1.0, 0.0]
+                                else:
+                                    var93 = [0.0, 1.0, 0.0]
+                            else:
+                                var93 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[5] <= 0.5:
+                                if input[18] <= 25.888320922851562:
+                                    var93 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[8] <= 0.5:
+                                        if input[14] <= 0.5:
+                                            var93 = [0.0, 1.0, 0.0]
+                                        else:
+                                            if input[9] <= 0.5:
+                                                if input[17] <= 26.73582935333252:
+                                                    var93 = [0.0, 0.0, 1.0]
+                                                else:
+                                                    var93 = [0.0, 1.0, 0.0]
+                                            else:
+                                                var93 = [0.0, 1.0, 0.0]
+                                    else:
+                                        var93 = [0.0, 1.0, 0.0]
+                            else:
+                                var93 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[1] <= 0.5:
+                            if input[7] <= 0.5:
+                                var93 = [0.0, 1.0, 0.0]
+                            else:
+                                var93 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[8] <= 0.5:
+                                var93 = [1.0, 0.0, 0.0]
+                            else:
+                                if input[17] <= 23.3491153717041:
+                                    var93 = [0.0, 1.0, 0.0]
+                                else:
+                                    var93 = [1.0, 0.0, 0.0]
+                else:
+                    if input[18] <= 41.314998626708984:
+                        var93 = [0.0, 0.0, 1.0]
+                    else:
+                        var93 = [1.0, 0.0, 0.0]
+            else:
+                var93 = [0.0, 0.0, 1.0]
+    if input[17] <= 31.92208957672119:
+        if input[9] <= 0.5:
+            if input[11] <= 0.5:
+                if input[6] <= 0.5:
+                    if input[5] <= 0.5:
+                        if input[10] <= 0.5:
+                            var94 = [1.0, 0.0, 0.0]
+                        else:
+                            var94 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[17] <= 23.012829780578613:
+                            if input[1] <= 0.5:
+                                var94 = [0.0, 1.0, 0.0]
+                            else:
+                                var94 = [0.0, 0.0, 1.0]
+                        else:
+                            var94 = [0.0, 1.0, 0.0]
+                else:
+                    if input[3] <= 0.5:
+                        if input[1] <= 0.5:
+                            if input[8] <= 0.5:
+                                if input[7] <= 0.5:
+                                    var94 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[17] <= 26.443750381469727:
+                                        var94 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var94 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[17] <= 29.032323837280273:
+                                    var94 = [0.0, 1.0, 0.0]
+                                else:
+                                    var94 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[17] <= 21.143878936767578:
+                                var94 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[8] <= 0.5:
+                                    if input[17] <= 26.510512351989746:
+                                        var94 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var94 = [0.0, 0.0, 1.0]
+                                else:
+                                    var94 = [1.0, 0.0, 0.0]
+                    else:
+                        var94 = [0.0, 0.0, 1.0]
+            else:
+                if input[15] <= 0.5:
+                    if input[17] <= 24.30154037475586:
+                        var94 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[16] <= 0.5:
+                            if input[18] <= 1.0899999737739563:
+                                var94 = [1.0, 0.0, 0.0]
+                            else:
+                                var94 = [0.0, 0.0, 1.0]
+                        else:
+                            var94 = [1.0, 0.0, 0.0]
+                else:
+                    var94 = [0.0, 0.0, 1.0]
+        else:
+            var94 = [0.0, 1.0, 0.0]
+    else:
+        if input[4] <= 0.5:
+            if input[10] <= 0.5:
+                if input[18] <= 2.940000057220459:
+                    var94 = [1.0, 0.0, 0.0]
+                else:
+                    if input[2] <= 0.5:
+                        if input[12] <= 0.5:
+                            if input[9] <= 0.5:
+                                var94 = [1.0, 0.0, 0.0]
+                            else:
+                                var94 = [0.0, 0.0, 1.0]
+                        else:
+                            var94 = [0.0, 0.0, 1.0]
+                    else:
+                        var94 = [1.0, 0.0, 0.0]
+            else:
+                var94 = [0.0, 0.0, 1.0]
+        else:
+            if input[18] <= 28.369998931884766:
+                var94 = [1.0, 0.0, 0.0]
+            else:
+                var94 = [0.0, 0.0, 1.0]
+    if input[18] <= 9.985000133514404:
+        if input[11] <= 0.5:
+            if input[6] <= 0.5:
+                if input[8] <= 0.5:
+                    if input[15] <= 0.5:
+                        if input[17] <= 42.925825119018555:
+                            var95 = [0.0, 0.0, 1.0]
+                        else:
+                            var95 = [1.0, 0.0, 0.0]
+                    else:
+                        var95 = [0.0, 1.0, 0.0]
+                else:
+                    var95 = [0.0, 0.0, 1.0]
+            else:
+                var95 = [0.0, 0.0, 1.0]
+        else:
+            if input[5] <= 0.5:
+                if input[18] <= 1.4599999785423279:
+                    var95 = [1.0, 0.0, 0.0]
+                else:
+                    if input[4] <= 0.5:
+                        if input[15] <= 0.5:
+                            if input[18] <= 2.240000009536743:
+                                var95 = [0.0, 0.0, 1.0]
+                            else:
+                                var95 = [1.0, 0.0, 0.0]
+                        else:
+                            var95 = [1.0, 0.0, 0.0]
+                    else:
+                        var95 = [1.0, 0.0, 0.0]
+            else:
+                var95 = [0.0, 0.0, 1.0]
+    else:
+        if input[6] <= 0.5:
+            if input[18] <= 47.5049991607666:
+                if input[13] <= 0.5:
+                    if input[4] <= 0.5:
+                        if input[10] <= 0.5:
+                            var95 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 17.263123035430908:
+                                var95 = [0.0, 1.0, 0.0]
+                            else:
+                                var95 = [0.0, 0.0, 1.0]
+                    else:
+                        var95 = [1.0, 0.0, 0.0]
+                else:
+                    if input[14] <= 0.5:
+                        var95 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[1] <= 0.5:
+                            var95 = [0.0, 0.0, 1.0]
+                        else:
+                            var95 = [1.0, 0.0, 0.0]
+            else:
+                if input[17] <= 30.499518394470215:
+                    var95 = [0.0, 0.0, 1.0]
+                else:
+                    var95 = [1.0, 0.0, 0.0]
+        else:
+            if input[1] <= 0.5:
+                if input[9] <= 0.5:
+                    if input[15] <= 0.5:
+                        if input[7] <= 0.5:
+                            if input[18] <= 28.94499969482422:
+                                var95 = [0.0, 0.0, 1.0]
+                            else:
+                                var95 = [0.0, 1.0, 0.0]
+                        else:
+                            var95 = [0.0, 0.0, 1.0]
+                    else:
+                        var95 = [0.0, 1.0, 0.0]
+                else:
+                    var95 = [0.0, 1.0, 0.0]
+            else:
+                if input[18] <= 40.709999084472656:
+                    if input[7] <= 0.5:
+                        var95 = [0.0, 0.0, 1.0]
+                    else:
+                        var95 = [1.0, 0.0, 0.0]
+                else:
+                    var95 = [0.0, 0.0, 1.0]
+    if input[2] <= 0.5:
+        if input[18] <= 9.441144466400146:
+            if input[5] <= 0.5:
+                if input[4] <= 0.5:
+                    var96 = [0.0, 0.0, 1.0]
+                else:
+                    var96 = [1.0, 0.0, 0.0]
+            else:
+                var96 = [0.0, 1.0, 0.0]
+        else:
+            if input[4] <= 0.5:
+                if input[1] <= 0.5:
+                    if input[17] <= 22.836759567260742:
+                        var96 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[7] <= 0.5:
+                            if input[17] <= 31.030875205993652:
+                                if input[17] <= 30.333117485046387:
+                                    var96 = [0.0, 1.0, 0.0]
+                                else:
+                                    var96 = [0.0, 0.0, 1.0]
+                            else:
+                                var96 = [0.0, 1.0, 0.0]
+                        else:
+                            var96 = [0.0, 0.0, 1.0]
+                else:
+                    if input[10] <= 0.5:
+                        if input[17] <= 32.12221717834473:
+                            if input[9] <= 0.5:
+                                if input[6] <= 0.5:
+                                    var96 = [0.0, 1.0, 0.0]
+                                else:
+                                    var96 = [1.0, 0.0, 0.0]
+                            else:
+                                var96 = [0.0, 1.0, 0.0]
+                        else:
+                            if input[17] <= 33.033369064331055:
+                                var96 = [0.0, 0.0, 1.0]
+                            else:
+                                var96 = [0.0, 1.0, 0.0]
+                    else:
+                        var96 = [0.0, 0.0, 1.0]
+            else:
+                var96 = [1.0, 0.0, 0.0]
+    else:
+        if input[4] <= 0.5:
+            if input[6] <= 0.5:
+                var96 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 1.3449999690055847:
+                    var96 = [1.0, 0.0, 0.0]
+                else:
+                    if input[18] <= 2.5700000524520874:
+                        var96 = [0.0, 0.0, 1.0]
+                    else:
+                        var96 = [1.0, 0.0, 0.0]
+        else:
+            var96 = [1.0, 0.0, 0.0]
+    if input[5] <= 0.5:
+        if input[2] <= 0.5:
+            if input[8] <= 0.5:
+                if input[9] <= 0.5:
+                    if input[13] <= 0.5:
+                        if input[7] <= 0.5:
+                            if input[16] <= 0.5:
+                                if input[18] <= 16.145000338554382:
+                                    var97 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[17] <= 36.993812561035156:
+                                        var97 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var97 = [1.0, 0.0, 0.0]
+                            else:
+                                var97 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[18] <= 34.394999504089355:
+                                var97 = [0.0, 0.0, 1.0]
+                            else:
+                                var97 = [1.0, 0.0, 0.0]
+                    else:
+                        if input[15] <= 0.5:
+                            if input[18] <= 41.314998626708984:
+                                var97 = [0.0, 0.0, 1.0]
+                            else:
+                                var97 = [1.0, 0.0, 0.0]
+                        else:
+                            if input[4] <= 0.5:
+                                var97 = [0.0, 1.0, 0.0]
+                            else:
+                                var97 = [1.0, 0.0, 0.0]
+                else:
+                    if input[16] <= 0.5:
+                        if input[17] <= 32.28618144989014:
+                            var97 = [0.0, 1.0, 0.0]
+                        else:
+                            var97 = [0.0, 0.0, 1.0]
+                    else:
+                        var97 = [0.0, 1.0, 0.0]
+            else:
+                if input[17] <= 27.76011371612549:
+                    var97 = [0.0, 1.0, 0.0]
+                else:
+                    if input[18] <= 28.234999656677246:
+                        var97 = [1.0, 0.0, 0.0]
+                    else:
+                        var97 = [0.0, 1.0, 0.0]
+        else:
+            if input[14] <= 0.5:
+                var97 = [1.0, 0.0, 0.0]
+            else:
+                if input[17] <= 31.256547927856445:
+                    var97 = [0.0, 0.0, 1.0]
+                else:
+                    var97 = [1.0, 0.0, 0.0]
+    else:
+        if input[2] <= 0.5:
+            if input[0] <= 0.5:
+                if input[12] <= 0.5:
+                    if input[7] <= 0.5:
+                        if input[17] <= 24.05971908569336:
+                            var97 = [0.0, 0.0, 1.0]
+                        else:
+                            var97 = [0.0, 1.0, 0.0]
+                    else:
+                        var97 = [0.0, 1.0, 0.0]
+                else:
+                    var97 = [0.0, 1.0, 0.0]
+            else:
+                if input[8] <= 0.5:
+                    var97 = [0.0, 1.0, 0.0]
+                else:
+                    if input[15] <= 0.5:
+                        var97 = [0.0, 1.0, 0.0]
+                    else:
+                        var97 = [0.0, 0.0, 1.0]
+        else:
+            var97 = [0.0, 0.0, 1.0]
+    if input[17] <= 31.818840980529785:
+        if input[11] <= 0.5:
+            if input[8] <= 0.5:
+                if input[13] <= 0.5:
+                    if input[9] <= 0.5:
+                        if input[10] <= 0.5:
+                            if input[1] <= 0.5:
+                                if input[7] <= 0.5:
+                                    var98 = [0.0, 1.0, 0.0]
+                                else:
+                                    if input[18] <= 32.875:
+                                        var98 = [0.0, 0.0, 1.0]
+                                    else:
+                                        var98 = [0.0, 1.0, 0.0]
+                            else:
+                                var98 = [1.0, 0.0, 0.0]
+                        else:
+                            var98 = [0.0, 0.0, 1.0]
+                    else:
+                        var98 = [0.0, 1.0, 0.0]
+                else:
+                    if input[5] <= 0.5:
+                        if input[18] <= 30.78499937057495:
+                            var98 = [0.0, 1.0, 0.0]
+                        else:
+                            var98 = [1.0, 0.0, 0.0]
+                    else:
+                        var98 = [0.0, 1.0, 0.0]
+            else:
+                if input[17] <= 21.972312927246094:
+                    if input[17] <= 18.164326667785645:
+                        var98 = [0.0, 0.0, 1.0]
+                    else:
+                        var98 = [0.0, 1.0, 0.0]
+                else:
+                    if input[16] <= 0.5:
+                        var98 = [0.0, 0.0, 1.0]
+                    else:
+                        var98 = [1.0, 0.0, 0.0]
+        else:
+            if input[16] <= 0.5:
+                if input[6] <= 0.5:
+                    var98 = [0.0, 0.0, 1.0]
+                else:
+                    if input[18] <= 1.425000011920929:
+                        var98 = [1.0, 0.0, 0.0]
+                    else:
+                        var98 = [0.0, 0.0, 1.0]
+            else:
+                if input[5] <= 0.5:
+                    var98 = [1.0, 0.0, 0.0]
+                else:
+                    var98 = [0.0, 0.0, 1.0]
+    else:
+        if input[18] <= 17.847583293914795:
+            if input[18] <= 3.1299999952316284:
+                if input[17] <= 40.26011085510254:
+                    var98 = [1.0, 0.0, 0.0]
+                else:
+                    if input[15] <= 0.5:
+                        var98 = [1.0, 0.0, 0.0]
+                    else:
+                        var98 = [0.0, 0.0, 1.0]
+            else:
+                var98 = [0.0, 0.0, 1.0]
+        else:
+            var98 = [1.0, 0.0, 0.0]
+    if input[11] <= 0.5:
+        if input[10] <= 0.5:
+            if input[17] <= 33.808231353759766:
+                if input[16] <= 0.5:
+                    if input[17] <= 31.818840980529785:
+                        var99 = [0.0, 1.0, 0.0]
+                    else:
+                        if input[18] <= 16.36614465713501:
+                            var99 = [0.0, 1.0, 0.0]
+                        else:
+                            var99 = [1.0, 0.0, 0.0]
+                else:
+                    if input[12] <= 0.5:
+                        if input[17] <= 21.05126667022705:
+                            if input[13] <= 0.5:
+                                if input[7] <= 0.5:
+                                    var99 = [0.0, 1.0, 0.0]
+                                else:
+                                    var99 = [0.0, 0.0, 1.0]
+                            else:
+                                var99 = [0.0, 1.0, 0.0]
+                        else:
+                            var99 = [1.0, 0.0, 0.0]
+                    else:
+                        var99 = [0.0, 0.0, 1.0]
+            else:
+                if input[18] <= 20.704999804496765:
+                    if input[17] <= 43.06949424743652:
+                        var99 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[15] <= 0.5:
+                            var99 = [1.0, 0.0, 0.0]
+                        else:
+                            var99 = [0.0, 0.0, 1.0]
+                else:
+                    var99 = [1.0, 0.0, 0.0]
+        else:
+            if input[15] <= 0.5:
+                if input[5] <= 0.5:
+                    if input[4] <= 0.5:
+                        var99 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[18] <= 39.47500038146973:
+                            var99 = [1.0, 0.0, 0.0]
+                        else:
+                            var99 = [0.0, 0.0, 1.0]
+                else:
+                    if input[18] <= 26.630000114440918:
+                        var99 = [0.0, 0.0, 1.0]
+                    else:
+                        var99 = [0.0, 1.0, 0.0]
+            else:
+                var99 = [0.0, 0.0, 1.0]
+    else:
+        if input[15] <= 0.5:
+            if input[5] <= 0.5:
+                if input[17] <= 31.649048805236816:
+                    if input[18] <= 2.0550000071525574:
+                        var99 = [1.0, 0.0, 0.0]
+                    else:
+                        var99 = [0.0, 0.0, 1.0]
+                else:
+                    var99 = [1.0, 0.0, 0.0]
+            else:
+                var99 = [0.0, 0.0, 1.0]
+        else:
+            if input[4] <= 0.5:
+                if input[18] <= 1.399999976158142:
+                    var99 = [1.0, 0.0, 0.0]
+                else:
+                    if input[18] <= 3.9049999713897705:
+                        var99 = [0.0, 0.0, 1.0]
+                    else:
+                        var99 = [1.0, 0.0, 0.0]
+            else:
+                var99 = [1.0, 0.0, 0.0]
+    if input[2] <= 0.5:
+        if input[10] <= 0.5:
+            if input[14] <= 0.5:
+                if input[3] <= 0.5:
+                    if input[17] <= 33.57559776306152:
+                        if input[17] <= 32.415992736816406:
+                            if input[1] <= 0.5:
+                                if input[7] <= 0.5:
+                                    var100 = [0.0, 1.0, 0.0]
+                                else:
+                                    var100 = [0.0, 0.0, 1.0]
+                            else:
+                                if input[18] <= 47.53499984741211:
+                                    var100 = [0.0, 1.0, 0.0]
+                                else:
+                                    var100 = [0.0, 0.0, 1.0]
+                        else:
+                            var100 = [0.0, 0.0, 1.0]
+                    else:
+                        var100 = [1.0, 0.0, 0.0]
+                else:
+                    if input[5] <= 0.5:
+                        var100 = [0.0, 0.0, 1.0]
+                    else:
+                        var100 = [0.0, 1.0, 0.0]
+            else:
+                if input[1] <= 0.5:
+                    if input[8] <= 0.5:
+                        if input[0] <= 0.5:
+                            if input[17] <= 19.421363830566406:
+                                var100 = [0.0, 1.0, 0.0]
+                            else:
+                                if input[18] <= 2.694999933242798:
+                                    var100 = [0.0, 0.0, 1.0]
+                                else:
+                                    if input[18] <= 2.8249999284744263:
+                                        var100 = [1.0, 0.0, 0.0]
+                                    else:
+                                        var100 = [0.0, 0.0, 1.0]
+                        else:
+                            if input[4] <= 0.5:
+                                var100 = [0.0, 1.0, 0.0]
+                            else:
+                                var100 = [0.0, 0.0, 1.0]
+                    else:
+                        if input[4] <= 0.5:
+                            var100 = [0.0, 1.0, 0.0]
+                        else:
+                            var100 = [1.0, 0.0, 0.0]
+                else:
+                    var100 = [0.0, 1.0, 0.0]
+        else:
+            var100 = [0.0, 0.0, 1.0]
+    else:
+        if input[4] <= 0.5:
+            if input[18] <= 1.4100000262260437:
+                if input[17] <= 24.30154037475586:
+                    var100 = [0.0, 0.0, 1.0]
+                else:
+                    var100 = [1.0, 0.0, 0.0]
+            else:
+                if input[18] <= 1.8299999833106995:
+                    var100 = [0.0, 0.0, 1.0]
+                else:
+                    if input[15] <= 0.5:
+                        if input[17] <= 30.578115463256836:
+                            var100 = [1.0, 0.0, 0.0]
+                        else:
+                            var100 = [0.0, 0.0, 1.0]
+                    else:
+                        var100 = [1.0, 0.0, 0.0]
+        else:
+            var100 = [1.0, 0.0, 0.0]
+    return mul_vector_number(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(add_vectors(var46, var47), var48), var49), var50), var51), var52), var53), var54), var55), var56), var57), var58), var59), var60), var61), var62), var63), var64), var65), var66), var67), var68), var69), var70), var71), var72), var73), var74), var75), var76), var77), var78), var79), var80), var81), var82), var83), var84), var85), var86), var87), var88), var89), var90), var91), var92), var93), var94), var95), var96), var97), var98), var99), var100), 0.01)
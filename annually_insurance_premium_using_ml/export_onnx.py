@@ -0,0 +1,41 @@
+import pickle
+import os
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType, StringTensorType, Int64TensorType
+
+# Directory holding the trained model artifacts
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# -------------------- Build-time ONNX Export --------------------
+
+# Run once after (re)training the model:
+#     python annually_insurance_premium_using_ml/export_onnx.py
+#
+# Converts the whole sklearn pipeline (OneHotEncoder preprocessing plus
+# the RandomForest) to ONNX. The API serves model.onnx through ONNX
+# Runtime when available, which keeps inference in native code and loads
+# the model file memory-mapped instead of unpickling Python objects.
+
+def main():
+    # Load the trained pipeline
+    with open(os.path.join(MODEL_DIR, 'model.pkl'), 'rb') as f:
+        model = pickle.load(f)
+
+    # One typed graph input per feature column the pipeline consumes
+    initial_types = [
+        ('bmi', FloatTensorType([None, 1])),
+        ('age_group', StringTensorType([None, 1])),
+        ('lifestyle_risk', StringTensorType([None, 1])),
+        ('city_tier', Int64TensorType([None, 1])),
+        ('income_lpa', FloatTensorType([None, 1])),
+        ('occupation', StringTensorType([None, 1])),
+    ]
+
+    # zipmap off so the graph outputs a plain label tensor
+    onx = convert_sklearn(model, initial_types=initial_types, options={id(model): {'zipmap': False}})
+
+    with open(os.path.join(MODEL_DIR, 'model.onnx'), 'wb') as f:
+        f.write(onx.SerializeToString())
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,87 @@
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, computed_field, field_validator
 from typing import Annotated, Literal
+from functools import cached_property
+from bisect import bisect_left, bisect_right
+import copy
+import importlib.util
+import numpy as np
+import os
 import pandas as pd
 import pickle
+import sys
 
 # -------------------- Load ML Model --------------------
 
+MODEL_DIR = 'annually_insurance_premium_using_ml'
+
 # Load the trained model from file using binary mode
-with open('annually_insurance_premium_using_ml\\model.pkl', 'rb') as f:
+with open(os.path.join(MODEL_DIR, 'model.pkl'), 'rb') as f:
     model = pickle.load(f)
-    
+
+# Preprocessing step and class labels, needed by the compiled fast path
+preprocessor = model.named_steps['preprocessor']
+model_classes = model.named_steps['classifier'].classes_
+
+# Intern the fitted encoder's category strings so equality checks against
+# (equally interned) request strings can short-circuit on object identity
+# instead of comparing characters
+for _cats in preprocessor.named_transformers_['cat'].categories_:
+    for _i, _cat in enumerate(_cats):
+        if isinstance(_cat, str):
+            _cats[_i] = sys.intern(_cat)
+
+# Column order the pipeline was trained on ('city' itself is not a model feature)
+TRAINED_FEATURES = list(preprocessor.feature_names_in_)
+
+# Copy of the fitted preprocessor with its column names remapped to
+# positional indices, so it can transform a plain ndarray in trained
+# column order without a DataFrame; verified against the name-keyed
+# preprocessor at startup and disabled if the outputs ever differ
+def _index_keyed_preprocessor():
+    remapped = copy.deepcopy(preprocessor)
+    remapped.transformers_ = [(name, trans, [TRAINED_FEATURES.index(col) for col in cols])
+                              for name, trans, cols in remapped.transformers_]
+    if hasattr(remapped, '_columns'):
+        remapped._columns = [[TRAINED_FEATURES.index(col) for col in cols] for cols in remapped._columns]
+    del remapped.feature_names_in_
+    return remapped
+
+try:
+    array_preprocessor = _index_keyed_preprocessor()
+    _probe = np.array([[22.5, 'adult', 'low', 1, 10.0, 'private_job']], dtype=object)
+    if not np.array_equal(array_preprocessor.transform(_probe),
+                          preprocessor.transform(pd.DataFrame(_probe, columns=TRAINED_FEATURES))):
+        array_preprocessor = None
+except Exception:
+    array_preprocessor = None
+
+# Load the m2cgen-compiled classifier if it has been generated
+# (see compile_model.py); its score() replaces sklearn's Python-level
+# tree traversal with straight-line generated code
+_compiled_path = os.path.join(MODEL_DIR, 'compiled_model.py')
+if os.path.exists(_compiled_path):
+    _spec = importlib.util.spec_from_file_location('compiled_model', _compiled_path)
+    _compiled = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_compiled)
+    compiled_score = _compiled.score
+else:
+    compiled_score = None
+
+# Prefer the ONNX export of the full pipeline when ONNX Runtime is
+# installed and model.onnx has been generated (see export_onnx.py):
+# the model file is memory-mapped and both the encoder and the forest
+# run as native code
+onnx_session = None
+_onnx_path = os.path.join(MODEL_DIR, 'model.onnx')
+if os.path.exists(_onnx_path):
+    try:
+        import onnxruntime
+        onnx_session = onnxruntime.InferenceSession(_onnx_path, providers=['CPUExecutionProvider'])
+    except ImportError:
+        pass
+
 # Create FastAPI instance
 app = FastAPI()
 
@@ -26,10 +97,65 @@ tier_2_cities = [
     'Chiniot', 'Kohat', 'Muzaffarabad', 'Gilgit', 'Kotli', 'Skardu', 'Khuzdar', 'Bannu', 'Gwadar', 'Jhang', 'Hafizabad',
     'Kamoke', 'Jacobabad', 'Shikarpur', 'Charsadda', 'Mansehra', 'Narowal', 'Vehari', 'Layyah', 'Attock', 'Lodhran',
     'Badin', 'Khanewal', 'Bhakkar', 'Haripur', 'Swabi', 'Jamshoro', 'Gojra', 'Chakwal', 'Jaranwala', 'Khanpur', 'Kamalia',
-    'Daska', 'Nowshera', 'Thatta', 'Pakpattan', 'Jaccobabad', 'Samundri', 'Muridke', 'Mianwali', 'Kandhkot', 'Shahdadpur', 
-    'Shahkot', 'Arifwala', 'Pattoki', 'Shikarpur', 'Hangu', 'Charsadda', 'Burewala', 'Jatoi',
+    'Daska', 'Nowshera', 'Thatta', 'Pakpattan', 'Jaccobabad', 'Samundri', 'Muridke', 'Mianwali', 'Kandhkot', 'Shahdadpur',
+    'Shahkot', 'Arifwala', 'Pattoki', 'Hangu', 'Burewala', 'Jatoi',
 ]
 
+# Precomputed city -> tier mapping for O(1) lookups instead of scanning both
+# lists per request; keys are interned to match the interned request strings
+CITY_TIER = {sys.intern(city): 1 for city in tier_1_cities}
+CITY_TIER.update({sys.intern(city): 2 for city in tier_2_cities})
+
+# -------------------- Feature Engineering Helpers --------------------
+
+# Module-level scalar functions for the engineered features, shared by the
+# input model (and usable on raw values without building a UserInput).
+# The categorical ones resolve through precomputed decision tables: bisect
+# finds the band in C code and a tuple index picks the label, replacing
+# the chained comparisons with a single lookup
+
+AGE_BREAKS = (25, 45, 60)
+AGE_GROUPS = ("young", "adult", "middle_aged", "senior")
+
+BMI_BREAKS = (27, 30)
+RISK_TABLE = (
+    ("low", "medium", "medium"),    # non-smoker, by BMI band
+    ("medium", "medium", "high"),   # smoker, by BMI band
+)
+
+def compute_bmi(weight: float, height: float) -> float:
+    return round(weight / (height ** 2), 2)
+
+def compute_lifestyle_risk(smoker: bool, bmi: float) -> str:
+    return RISK_TABLE[smoker][bisect_left(BMI_BREAKS, bmi)]
+
+def compute_age_group(age: int) -> str:
+    return AGE_GROUPS[bisect_right(AGE_BREAKS, age)]
+
+# -------------------- Generated Feature Builder --------------------
+
+# Expression for each model feature in terms of the raw input fields
+# (bmi is computed once into a local before the row is assembled)
+_FEATURE_EXPRS = {
+    'bmi': 'bmi',
+    'age_group': 'AGE_GROUPS[bisect_right(AGE_BREAKS, age)]',
+    'lifestyle_risk': 'RISK_TABLE[smoker][bisect_left(BMI_BREAKS, bmi)]',
+    'city_tier': 'CITY_TIER.get(city, 3)',
+    'income_lpa': 'income_lpa',
+    'occupation': 'occupation',
+}
+
+# Generate make_feature_row() at import, specialized to the column order
+# the loaded model was trained on: the engineering is inlined into one
+# flat function, with no per-request property or dict dispatch, and a
+# retrained model with reordered columns regenerates the right row shape
+_BUILDER_SOURCE = (
+    'def make_feature_row(age, weight, height, income_lpa, smoker, city, occupation):\n'
+    '    bmi = round(weight / (height ** 2), 2)\n'
+    '    return [' + ', '.join(_FEATURE_EXPRS[feature] for feature in TRAINED_FEATURES) + ']\n'
+)
+exec(compile(_BUILDER_SOURCE, '<feature-builder>', 'exec'))
+
 # -------------------- Pydantic Input Model --------------------
 
 class UserInput(BaseModel):
@@ -43,65 +169,106 @@ class UserInput(BaseModel):
     occupation: Annotated[Literal['retired', 'freelancer', 'student', 'government_job',
        'business_owner', 'unemployed', 'private_job'], Field(..., description='Occupation of the user')]
 
-    # Computed BMI based on height and weight
+    # Intern the string fields after validation: the parsed JSON yields
+    # fresh string objects each request, interning makes the CITY_TIER
+    # lookup and the encoder's category comparisons identity matches
+    @field_validator('city', 'occupation', mode='after')
+    @classmethod
+    def _intern_strings(cls, value: str) -> str:
+        return sys.intern(value)
+
+    # Computed BMI based on height and weight; cached_property stores the
+    # result on the instance so bmi (read again by lifestyle_risk and the
+    # prediction path) is computed once per request
     @computed_field
-    @property
+    @cached_property
     def bmi(self) -> float:
-        bmi = round(self.weight / (self.height ** 2), 2)
-        return bmi
+        return compute_bmi(self.weight, self.height)
 
     # Determine lifestyle risk based on smoking status and BMI
     @computed_field
-    @property
+    @cached_property
     def lifestyle_risk(self) -> str:
-        if self.smoker and self.bmi > 30:
-            return "high"
-        elif self.smoker or self.bmi > 27:
-            return "medium"
-        else:
-            return "low"
+        return compute_lifestyle_risk(self.smoker, self.bmi)
 
     # Categorize user by age group
     @computed_field
-    @property
+    @cached_property
     def age_group(self) -> str:
-        if self.age < 25:
-            return "young"
-        elif self.age < 45:
-            return "adult"
-        elif self.age < 60:
-            return "middle_aged"
-        else:
-            return "senior"
+        return compute_age_group(self.age)
 
     # Map city to its tier
     @computed_field
-    @property
+    @cached_property
     def city_tier(self) -> int:
-        if self.city in tier_1_cities:
-            return 1
-        elif self.city in tier_2_cities:
-            return 2
-        else:
-            return 3
+        # Unknown cities default to tier 3
+        return CITY_TIER.get(self.city, 3)
 
 # -------------------- Prediction Endpoint --------------------
 
+# Position of each feature column within a generated row
+_COL = {feature: index for index, feature in enumerate(TRAINED_FEATURES)}
+
+# Run prebuilt feature rows through the ONNX session; the feed is sliced
+# column-wise from the row matrix, so no pandas is involved
+def _onnx_predict(rows: np.ndarray) -> np.ndarray:
+    feed = {
+        'bmi': rows[:, [_COL['bmi']]].astype(np.float32),
+        'age_group': rows[:, [_COL['age_group']]],
+        'lifestyle_risk': rows[:, [_COL['lifestyle_risk']]],
+        'city_tier': rows[:, [_COL['city_tier']]].astype(np.int64),
+        'income_lpa': rows[:, [_COL['income_lpa']]].astype(np.float32),
+        'occupation': rows[:, [_COL['occupation']]],
+    }
+    return onnx_session.run(['label'], feed)[0]
+
+# Predict premium categories for one or more users, choosing the fastest
+# available backend: ONNX session, then the index-keyed preprocessor with
+# the m2cgen forest or sklearn classifier, then the pickled pipeline
+def _predict_users(users: list[UserInput]):
+    # Feature rows in the trained column order, via the generated builder
+    rows = np.array([make_feature_row(user.age, user.weight, user.height, user.income_lpa,
+                                      user.smoker, user.city, user.occupation) for user in users], dtype=object)
+
+    if onnx_session is not None:
+        return _onnx_predict(rows)
+
+    if array_preprocessor is not None:
+        # Encode the raw ndarray directly, no DataFrame involved
+        encoded = array_preprocessor.transform(rows)
+        if compiled_score is not None:
+            return [model_classes[int(np.argmax(compiled_score(list(row))))] for row in encoded]
+        return model.named_steps['classifier'].predict(encoded)
+
+    # Last resort: the name-keyed pipeline requires a DataFrame
+    input_df = pd.DataFrame(rows, columns=TRAINED_FEATURES, copy=False)
+    return model.predict(input_df)
+
 @app.post("/predict")
 def predict_premium(data: UserInput):
-    # Construct DataFrame with engineered features
-    input_df = pd.DataFrame([{
-        'bmi': data.bmi,
-        'age_group': data.age_group,
-        'lifestyle_risk': data.lifestyle_risk,
-        'city_tier': data.city_tier,
-        'income_lpa': data.income_lpa,
-        'city': data.city,
-        'occupation': data.occupation 
-    }])
-    
     # Make prediction using the ML model
-    prediction = model.predict(input_df)[0]
-    
+    prediction = _predict_users([data])[0]
+
     # Return prediction as JSON response
     return JSONResponse(status_code=200, content={'predicted_category': prediction})
+
+@app.post("/predict_batch")
+def predict_premium_batch(data: list[UserInput]):
+    # An empty batch has nothing to predict; the backends expect a 2D row matrix
+    if not data:
+        return JSONResponse(status_code=200, content={'predictions': []})
+
+    # Single model call for the whole batch
+    predictions = _predict_users(data)
+
+    # Return predictions in request order
+    return JSONResponse(status_code=200, content={'predictions': list(predictions)})
+
+# -------------------- Server Entry Point --------------------
+
+# Production launcher: one worker process per core so prediction load
+# saturates all CPUs; with uvicorn[standard] installed, uvicorn's 'auto'
+# settings pick the uvloop event loop and httptools parser where supported
+if __name__ == '__main__':
+    import uvicorn
+    uvicorn.run('app:app', host='0.0.0.0', port=8000, workers=os.cpu_count())
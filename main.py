@@ -1,13 +1,32 @@
 from fastapi import FastAPI, Path, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, computed_field
+from pydantic.dataclasses import dataclass as pydantic_dataclass
 from typing import Annotated, Literal, Optional
-import json
- 
-app = FastAPI()
+import dataclasses
+import numpy as np
+import orjson
+import os
+
+# Serialize all responses with orjson instead of the stdlib json encoder
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # -------------------- Data Model --------------------
 
+# Scalar versions of the derived patient fields, reusable on plain dicts
+def compute_bmi(weight: float, height: float) -> float:
+    return round(weight / (height ** 2), 2)
+
+def compute_verdict(bmi: float) -> str:
+    if bmi < 18.5:
+        return 'Underweight'
+    elif bmi < 25:
+        return 'Normal'
+    elif bmi < 30:
+        return 'Overweight'
+    else:
+        return 'Obese'
+
 class Patient(BaseModel):
     # Basic patient fields with validation
     id: Annotated[str, Field(..., description='ID of the Patient', examples=['P001'])]
@@ -22,43 +41,75 @@ class Patient(BaseModel):
     @computed_field
     @property
     def bmi(self) -> float:
-        bmi = round(self.weight / (self.height ** 2), 2)
-        return bmi
-    
+        return compute_bmi(self.weight, self.height)
+
     # Health verdict based on BMI value
     @computed_field
     @property
     def verdict(self) -> str:
-        if self.bmi < 18.5:
-            return 'Underweight'
-        elif self.bmi < 25:
-            return 'Normal'
-        elif self.bmi < 30:
-            return 'Overweight'
-        else:
-            return 'Obese'
+        return compute_verdict(self.bmi)
         
-# Partial model for updating patient fields
-class PatientUpdate(BaseModel):
+# Partial model for updating patient fields; a slotted pydantic dataclass
+# keeps the field validation but skips per-instance __dict__ allocation
+# and the BaseModel machinery this write path never uses. None (the
+# default) means "leave the stored value unchanged"
+@pydantic_dataclass(slots=True)
+class PatientUpdate:
     name: Annotated[Optional[str], Field(default=None)]
     city: Annotated[Optional[str], Field(default=None)]
     age: Annotated[Optional[int], Field(default=None, gt=0, lt=120)]
     gender: Annotated[Optional[Literal['male', 'female', 'other']], Field(default=None)]
     height: Annotated[Optional[float], Field(default=None, gt=0)]
     weight: Annotated[Optional[float], Field(default=None, gt=0)]
-        
+
+# Field names an update may touch, precomputed once
+UPDATE_FIELDS = [field.name for field in dataclasses.fields(PatientUpdate)]
+
 # -------------------- Utility Functions --------------------
 
-# Load patient data from JSON file
-def load_data():
-    with open("patients.json", "r") as file:
-        data = json.load(file)
-    return data
+DATA_FILE = "patients.json"
 
-# Save patient data back to JSON file
+# In-memory cache of the parsed patient data, keyed on the file's mtime
+_CACHE = {'mtime': None, 'data': None}
+
+# Load patient data, re-reading the file only when it has changed on disk
+def load_data():
+    mtime = os.stat(DATA_FILE).st_mtime
+    if _CACHE['data'] is None or _CACHE['mtime'] != mtime:
+        with open(DATA_FILE, "rb") as file:
+            _CACHE['data'] = orjson.loads(file.read())
+        _CACHE['mtime'] = mtime
+    return _CACHE['data']
+
+# Save patient data back to JSON file and write through to the cache
 def save_data(data):
-    with open("patients.json", "w") as file:
-        json.dump(data, file)
+    # Write to a temp file and replace so readers never see a partial file
+    tmp_file = DATA_FILE + ".tmp"
+    with open(tmp_file, "wb") as file:
+        file.write(orjson.dumps(data))
+    os.replace(tmp_file, DATA_FILE)
+
+    _CACHE['data'] = data
+    _CACHE['mtime'] = os.stat(DATA_FILE).st_mtime
+
+# Columnar (structure-of-arrays) view over the cached patient data: one
+# contiguous float array per numeric field plus the record list, rebuilt
+# only when the underlying data changes
+NUMERIC_FIELDS = ['height', 'weight', 'bmi']
+
+_COLUMNS = {'mtime': None, 'records': None, 'arrays': None}
+
+def load_columns():
+    load_data()
+    if _COLUMNS['mtime'] != _CACHE['mtime']:
+        records = list(_CACHE['data'].values())
+        _COLUMNS['records'] = records
+        _COLUMNS['arrays'] = {
+            field: np.fromiter((p.get(field, 0) for p in records), dtype=float, count=len(records))
+            for field in NUMERIC_FIELDS
+        }
+        _COLUMNS['mtime'] = _CACHE['mtime']
+    return _COLUMNS
 
 # -------------------- API Endpoints --------------------
 
@@ -74,9 +125,19 @@ def about():
 
 @app.get("/view")
 def view():
-    # View all patient data
-    data = load_data()
-    return data
+    # View all patient data, streamed record by record so the full
+    # response body is never materialized in memory; the snapshot list
+    # keeps the stream consistent if a write lands mid-response
+    records = list(load_data().items())
+
+    async def generate():
+        yield b'{'
+        for index, (patient_id, record) in enumerate(records):
+            prefix = b',' if index else b''
+            yield prefix + orjson.dumps(patient_id) + b':' + orjson.dumps(record)
+        yield b'}'
+
+    return StreamingResponse(generate(), media_type='application/json')
 
 @app.get("/patient/{patient_id}")
 def view_patient(patient_id: str = Path(..., description='ID of the patient in DB', example='P001')):
@@ -92,21 +153,20 @@ def view_patient(patient_id: str = Path(..., description='ID of the patient in D
 def sort_patient(sort_by : str = Query(..., description='sort on the basis of height, weight or BMI'), 
                  order: str = Query('asc', description='sort in asc or desc order')):
     # Sort patient data by a given field and order
-    valid_fields = ['height', 'weight', 'bmi']
-    
-    if sort_by not in valid_fields:
-        raise HTTPException(status_code=400, detail='Invalid field select from {valid_fields}')
-    
+    if sort_by not in NUMERIC_FIELDS:
+        raise HTTPException(status_code=400, detail=f'Invalid field select from {NUMERIC_FIELDS}')
+
     if order not in ['asc', 'desc']:
         raise HTTPException(status_code=400, detail='Invalid order select between asc and desc')
 
-    data = load_data()
-    
-    sort_order = True if order == 'desc' else False
+    # Sort via the cached column arrays; negating the keys keeps the
+    # stable tie order for descending sorts
+    columns = load_columns()
+    keys = columns['arrays'][sort_by]
+    if order == 'desc':
+        keys = -keys
+    sorted_data = [columns['records'][i] for i in np.argsort(keys, kind='stable')]
 
-    # Sort using the given field
-    sorted_data = sorted(data.values(), key = lambda x: x.get(sort_by, 0), reverse = sort_order)
-    
     return sorted_data
 
 @app.post('/create')
@@ -123,7 +183,7 @@ def create_patient(patient: Patient):
     # Save updated data
     save_data(data)
     
-    return JSONResponse(status_code=201, content={'message' : 'Patient Data Created Successful'})
+    return ORJSONResponse(status_code=201, content={'message' : 'Patient Data Created Successful'})
 
 @app.put('/edit/{patient_id}')
 def update_patient(patient_id: str, patient_update: PatientUpdate):
@@ -133,25 +193,25 @@ def update_patient(patient_id: str, patient_update: PatientUpdate):
     if patient_id not in data:
         raise HTTPException(status_code=404, detail='Patient data not found')
     
-    # Get existing record and apply updates
+    # Get existing record and apply the provided fields
     existing_patient_info = data[patient_id]
-    updated_patient_info = patient_update.model_dump(exclude_unset=True)
-
-    for key, value in updated_patient_info.items():
-        existing_patient_info[key] = value
 
-    # Recalculate BMI/verdict using full model validation
-    existing_patient_info['id'] = patient_id
-    patient_pydandic_obj = Patient(**existing_patient_info)
+    for field in UPDATE_FIELDS:
+        value = getattr(patient_update, field)
+        if value is not None:
+            existing_patient_info[field] = value
 
-    # Convert back to dict
-    existing_patient_info = patient_pydandic_obj.model_dump(exclude='id')
+    # Recalculate the derived fields directly; the updated values were
+    # already validated by PatientUpdate, so rebuilding a full Patient
+    # model here would only repeat that work
+    existing_patient_info['bmi'] = compute_bmi(existing_patient_info['weight'], existing_patient_info['height'])
+    existing_patient_info['verdict'] = compute_verdict(existing_patient_info['bmi'])
 
     # Save updated info
     data[patient_id] = existing_patient_info
     save_data(data)
 
-    return JSONResponse(status_code=200, content={'message':'Patient Data Updated'})
+    return ORJSONResponse(status_code=200, content={'message':'Patient Data Updated'})
 
 @app.delete('/delete/{patient_id}')
 def delete_patient(patient_id: str):
@@ -164,4 +224,12 @@ def delete_patient(patient_id: str):
     del data[patient_id]
     save_data(data)
 
-    return JSONResponse(status_code=200, content={'message':'patient deleted'})
+    return ORJSONResponse(status_code=200, content={'message':'patient deleted'})
+
+# -------------------- Server Entry Point --------------------
+
+# Production launcher mirroring app.py: one worker per core, with uvloop
+# and httptools picked up automatically when uvicorn[standard] is installed
+if __name__ == '__main__':
+    import uvicorn
+    uvicorn.run('main:app', host='0.0.0.0', port=8000, workers=os.cpu_count())